@@ -29,7 +29,7 @@ class BulkArchiveRequest(BaseModel):
     archive_location: Optional[str] = None
 
 @router.get("/")
-async def list_documents(
+def list_documents(
     project_id: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
     document_type: Optional[str] = Query(None),
@@ -90,7 +90,7 @@ async def list_documents(
     }
 
 @router.post("/archive")
-async def archive_document(request: ArchiveDocumentRequest, db: Session = Depends(get_db)):
+def archive_document(request: ArchiveDocumentRequest, db: Session = Depends(get_db)):
     """Archive a single document"""
     
     document = db.query(Document).filter(Document.id == request.document_id).first()
@@ -121,7 +121,7 @@ async def archive_document(request: ArchiveDocumentRequest, db: Session = Depend
     }
 
 @router.post("/archive/bulk")
-async def bulk_archive_documents(request: BulkArchiveRequest, db: Session = Depends(get_db)):
+def bulk_archive_documents(request: BulkArchiveRequest, db: Session = Depends(get_db)):
     """Archive multiple documents at once"""
     
     documents = db.query(Document).filter(
@@ -161,7 +161,7 @@ async def bulk_archive_documents(request: BulkArchiveRequest, db: Session = Depe
     }
 
 @router.post("/unarchive/{document_id}")
-async def unarchive_document(
+def unarchive_document(
     document_id: int, 
     unarchived_by: str = Query(..., description="User who is unarchiving"),
     db: Session = Depends(get_db)
@@ -195,7 +195,7 @@ async def unarchive_document(
     }
 
 @router.get("/archive")
-async def list_archived_documents(
+def list_archived_documents(
     project_id: Optional[str] = Query(None),
     archived_by: Optional[str] = Query(None),
     archive_date_start: Optional[str] = Query(None),
@@ -258,7 +258,7 @@ async def list_archived_documents(
     }
 
 @router.get("/archive/stats")
-async def get_archive_statistics(
+def get_archive_statistics(
     project_id: Optional[str] = Query(None),
     db: Session = Depends(get_db)
 ):
@@ -316,7 +316,7 @@ async def get_archive_statistics(
     }
 
 @router.get("/{document_id}")
-async def get_document(document_id: int, db: Session = Depends(get_db)):
+def get_document(document_id: int, db: Session = Depends(get_db)):
     """Get specific document details including archive status"""
     
     document = db.query(Document).filter(Document.id == document_id).first()
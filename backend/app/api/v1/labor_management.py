@@ -19,13 +19,13 @@ router = APIRouter()
 
 # ======= LABOR OPERATIONS CRUD =======
 @router.get("/operations", response_model=List[LaborOperationResponse])
-async def get_labor_operations(db: Session = Depends(get_db)):
+def get_labor_operations(db: Session = Depends(get_db)):
     """Get all labor operations"""
     operations = db.query(LaborOperation).filter(LaborOperation.active == True).order_by(LaborOperation.name).all()
     return operations
 
 @router.post("/operations", response_model=LaborOperationResponse, status_code=201)
-async def create_labor_operation(operation: LaborOperationCreate, db: Session = Depends(get_db)):
+def create_labor_operation(operation: LaborOperationCreate, db: Session = Depends(get_db)):
     """Create a new labor operation"""
     # Check for duplicate name
     existing = db.query(LaborOperation).filter(LaborOperation.name == operation.name).first()
@@ -39,7 +39,7 @@ async def create_labor_operation(operation: LaborOperationCreate, db: Session =
     return db_operation
 
 @router.put("/operations/{operation_id}", response_model=LaborOperationResponse)
-async def update_labor_operation(operation_id: int, operation: LaborOperationUpdate, db: Session = Depends(get_db)):
+def update_labor_operation(operation_id: int, operation: LaborOperationUpdate, db: Session = Depends(get_db)):
     """Update an existing labor operation"""
     db_operation = db.query(LaborOperation).filter(LaborOperation.id == operation_id).first()
     if not db_operation:
@@ -60,7 +60,7 @@ async def update_labor_operation(operation_id: int, operation: LaborOperationUpd
     return db_operation
 
 @router.delete("/operations/{operation_id}")
-async def delete_labor_operation(operation_id: int, db: Session = Depends(get_db)):
+def delete_labor_operation(operation_id: int, db: Session = Depends(get_db)):
     """Delete (deactivate) a labor operation"""
     db_operation = db.query(LaborOperation).filter(LaborOperation.id == operation_id).first()
     if not db_operation:
@@ -72,13 +72,13 @@ async def delete_labor_operation(operation_id: int, db: Session = Depends(get_db
 
 # ======= COATING SYSTEMS CRUD =======
 @router.get("/coatings", response_model=List[CoatingSystemResponse])
-async def get_coating_systems(db: Session = Depends(get_db)):
+def get_coating_systems(db: Session = Depends(get_db)):
     """Get all coating systems"""
     coatings = db.query(CoatingSystem).filter(CoatingSystem.active == True).order_by(CoatingSystem.name).all()
     return coatings
 
 @router.post("/coatings", response_model=CoatingSystemResponse, status_code=201)
-async def create_coating_system(coating: CoatingSystemCreate, db: Session = Depends(get_db)):
+def create_coating_system(coating: CoatingSystemCreate, db: Session = Depends(get_db)):
     """Create a new coating system"""
     # Check for duplicate name
     existing = db.query(CoatingSystem).filter(CoatingSystem.name == coating.name).first()
@@ -92,7 +92,7 @@ async def create_coating_system(coating: CoatingSystemCreate, db: Session = Depe
     return db_coating
 
 @router.put("/coatings/{coating_id}", response_model=CoatingSystemResponse)
-async def update_coating_system(coating_id: int, coating: CoatingSystemUpdate, db: Session = Depends(get_db)):
+def update_coating_system(coating_id: int, coating: CoatingSystemUpdate, db: Session = Depends(get_db)):
     """Update an existing coating system"""
     db_coating = db.query(CoatingSystem).filter(CoatingSystem.id == coating_id).first()
     if not db_coating:
@@ -113,7 +113,7 @@ async def update_coating_system(coating_id: int, coating: CoatingSystemUpdate, d
     return db_coating
 
 @router.delete("/coatings/{coating_id}")
-async def delete_coating_system(coating_id: int, db: Session = Depends(get_db)):
+def delete_coating_system(coating_id: int, db: Session = Depends(get_db)):
     """Delete (deactivate) a coating system"""
     db_coating = db.query(CoatingSystem).filter(CoatingSystem.id == coating_id).first()
     if not db_coating:
@@ -125,13 +125,13 @@ async def delete_coating_system(coating_id: int, db: Session = Depends(get_db)):
 
 # ======= LABOR SETTINGS CRUD =======
 @router.get("/settings", response_model=List[LaborSettingsResponse])
-async def get_labor_settings(db: Session = Depends(get_db)):
+def get_labor_settings(db: Session = Depends(get_db)):
     """Get all labor settings"""
     settings = db.query(LaborSettings).order_by(LaborSettings.setting_key).all()
     return settings
 
 @router.put("/settings/{setting_key}", response_model=LaborSettingsResponse)
-async def update_labor_setting(setting_key: str, setting: LaborSettingsUpdate, db: Session = Depends(get_db)):
+def update_labor_setting(setting_key: str, setting: LaborSettingsUpdate, db: Session = Depends(get_db)):
     """Update a labor setting value"""
     db_setting = db.query(LaborSettings).filter(LaborSettings.setting_key == setting_key).first()
     if not db_setting:
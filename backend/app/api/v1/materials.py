@@ -20,7 +20,7 @@ class LoginRequest(BaseModel):
 
 # Authentication endpoint added to materials router as emergency fix
 @router.post("/auth-login")
-async def emergency_auth_login(request: LoginRequest, db: Session = Depends(get_db)):
+def emergency_auth_login(request: LoginRequest, db: Session = Depends(get_db)):
     """Emergency login endpoint in materials router"""
     try:
         email = request.email
@@ -45,7 +45,7 @@ async def emergency_auth_login(request: LoginRequest, db: Session = Depends(get_
         raise HTTPException(status_code=500, detail=f"Login failed: {str(e)}")
 
 @router.get("/")
-async def search_materials(
+def search_materials(
     q: str = Query(None, description="Search term for materials"),
     category: str = Query(None, description="Filter by category"),
     subcategory: str = Query(None, description="Filter by subcategory (Fitting, Pipe, Valve, etc.)"),
@@ -147,7 +147,7 @@ async def search_materials(
     ]
 
 @router.get("/enhanced")
-async def search_materials_enhanced(
+def search_materials_enhanced(
     q: str = Query(None, description="Search term for materials"),
     category: str = Query(None, description="Filter by category"),
     subcategory: str = Query(None, description="Filter by subcategory"),
@@ -198,14 +198,14 @@ async def search_materials_enhanced(
     ]
 
 @router.get("/categories")
-async def get_material_categories(db: Session = Depends(get_db)):
+def get_material_categories(db: Session = Depends(get_db)):
     """Get all available material categories"""
     
     categories = db.query(Material.category).distinct().all()
     return [category[0] for category in categories if category[0]]
 
 @router.get("/subcategories")
-async def get_material_subcategories(
+def get_material_subcategories(
     category: str = Query(None, description="Filter subcategories by category"),
     db: Session = Depends(get_db)
 ):
@@ -220,7 +220,7 @@ async def get_material_subcategories(
     return [subcat[0] for subcat in subcategories if subcat[0]]
 
 @router.get("/specifications")
-async def get_material_specifications(db: Session = Depends(get_db)):
+def get_material_specifications(db: Session = Depends(get_db)):
     """Get all available material specifications/standards"""
     
     specs = db.query(Material.specs_standard).filter(
@@ -230,7 +230,7 @@ async def get_material_specifications(db: Session = Depends(get_db)):
     return [spec[0] for spec in specs if spec[0]]
 
 @router.get("/fittings")
-async def search_fittings(
+def search_fittings(
     q: str = Query(None, description="Search fittings"),
     specs: str = Query(None, description="Filter by ASTM standard"),
     size: str = Query(None, description="Filter by size"),
@@ -266,7 +266,7 @@ async def search_fittings(
     ]
 
 @router.get("/pipes")
-async def search_pipes(
+def search_pipes(
     q: str = Query(None, description="Search pipes"),
     specs: str = Query(None, description="Filter by ASTM standard"), 
     schedule: str = Query(None, description="Filter by schedule"),
@@ -304,7 +304,7 @@ async def search_pipes(
     ]
 
 @router.get("/by-shape/{shape_key}")
-async def get_material_by_shape(shape_key: str, db: Session = Depends(get_db)):
+def get_material_by_shape(shape_key: str, db: Session = Depends(get_db)):
     """Get material by shape key (e.g., W12X26, PL1/2X12)"""
     
     material = db.query(Material).filter(
@@ -327,7 +327,7 @@ async def get_material_by_shape(shape_key: str, db: Session = Depends(get_db)):
     }
 
 @router.get("/{material_id}")
-async def get_material(material_id: int, db: Session = Depends(get_db)):
+def get_material(material_id: int, db: Session = Depends(get_db)):
     """Get specific material by ID"""
     
     material = db.query(Material).filter(Material.id == material_id).first()
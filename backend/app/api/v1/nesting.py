@@ -42,7 +42,7 @@ class NestingOptimizationResponse(BaseModel):
     recommendations: List[str]
 
 @router.post("/optimize", response_model=NestingOptimizationResponse)
-async def optimize_project_materials(
+def optimize_project_materials(
     request: NestingOptimizationRequest,
     db: Session = Depends(get_db)
 ):
@@ -216,7 +216,7 @@ class SingleEntryOptimizationResponse(BaseModel):
     alternative_suggestions: List[str]
 
 @router.post("/optimize-entry", response_model=SingleEntryOptimizationResponse)
-async def optimize_single_entry(
+def optimize_single_entry(
     request: SingleEntryOptimizationRequest,
     db: Session = Depends(get_db)
 ):
@@ -348,7 +348,7 @@ async def get_standard_material_sizes():
     }
 
 @router.get("/waste-analysis/{project_id}")
-async def analyze_material_waste(
+def analyze_material_waste(
     project_id: str,
     db: Session = Depends(get_db)
 ):
@@ -569,7 +569,7 @@ def _generate_recommendations(optimization_result: NestingResult) -> List[str]:
     return recommendations
 
 @router.post("/save-results/{project_id}")
-async def save_nesting_results(
+def save_nesting_results(
     project_id: str,
     nesting_results: dict,
     db: Session = Depends(get_db)
@@ -613,7 +613,7 @@ async def save_nesting_results(
         )
 
 @router.get("/results/{project_id}")
-async def get_nesting_results(
+def get_nesting_results(
     project_id: str,
     db: Session = Depends(get_db)
 ):
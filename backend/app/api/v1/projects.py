@@ -6,9 +6,9 @@ Project management for takeoff system
 from typing import List
 from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, insert
 from app.core.database import get_db
-from app.models.takeoff import TakeoffProject, TakeoffEntry
+from app.models.takeoff import TakeoffProject, TakeoffEntry, refresh_project_totals
 from app.schemas.takeoff import (
     TakeoffProjectCreate, TakeoffProjectUpdate, TakeoffProjectResponse,
     ProjectTakeoffSaveRequest, ProjectTakeoffSaveResponse
@@ -17,7 +17,7 @@ from app.schemas.takeoff import (
 router = APIRouter()
 
 @router.get("/", response_model=List[TakeoffProjectResponse])
-async def get_projects(
+def get_projects(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     status: str = Query(None, description="Filter by project status"),
@@ -50,13 +50,6 @@ async def get_projects(
     # Convert to response format with field mapping
     response_projects = []
     for project in projects:
-        # Count entries and calculate totals
-        entry_stats = db.query(
-            func.count(TakeoffEntry.id).label('total_entries'),
-            func.sum(TakeoffEntry.total_weight_tons).label('total_weight_tons'),
-            func.sum(TakeoffEntry.total_price).label('total_value')
-        ).filter(TakeoffEntry.project_id == project.id).first()
-        
         # Create response data with proper field mapping
         response_data = {
             "id": project.id,
@@ -70,16 +63,16 @@ async def get_projects(
             "project_date": project.project_date,
             "created_at": project.created_at,
             "updated_at": project.updated_at,
-            "total_entries": entry_stats.total_entries or 0,
-            "total_weight_tons": float(entry_stats.total_weight_tons or 0),
-            "total_value": float(entry_stats.total_value or 0)
+            "total_entries": project.cached_entries_count or 0,
+            "total_weight_tons": float(project.cached_total_weight_tons or 0),
+            "total_value": (project.cached_total_price_cents or 0) / 100
         }
         response_projects.append(response_data)
     
     return response_projects
 
 @router.post("/", response_model=TakeoffProjectResponse)
-async def create_project(
+def create_project(
     project_data: TakeoffProjectCreate,
     db: Session = Depends(get_db)
 ):
@@ -153,7 +146,7 @@ async def create_project(
     return response_data
 
 @router.get("/{project_id}", response_model=TakeoffProjectResponse)
-async def get_project(
+def get_project(
     project_id: str,
     db: Session = Depends(get_db)
 ):
@@ -163,13 +156,6 @@ async def get_project(
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    # Add project statistics
-    entry_stats = db.query(
-        func.count(TakeoffEntry.id).label('total_entries'),
-        func.sum(TakeoffEntry.total_weight_tons).label('total_weight_tons'),
-        func.sum(TakeoffEntry.total_price).label('total_value')
-    ).filter(TakeoffEntry.project_id == project_id).first()
-    
     # Create response data with proper field mapping
     response_data = {
         "id": project.id,
@@ -183,15 +169,15 @@ async def get_project(
         "project_date": project.project_date,
         "created_at": project.created_at,
         "updated_at": project.updated_at,
-        "total_entries": entry_stats.total_entries or 0,
-        "total_weight_tons": float(entry_stats.total_weight_tons or 0),
-        "total_value": float(entry_stats.total_value or 0)
+        "total_entries": project.cached_entries_count or 0,
+        "total_weight_tons": float(project.cached_total_weight_tons or 0),
+        "total_value": (project.cached_total_price_cents or 0) / 100
     }
     
     return response_data
 
 @router.put("/{project_id}", response_model=TakeoffProjectResponse)
-async def update_project(
+def update_project(
     project_id: str,
     project_update: TakeoffProjectUpdate,
     db: Session = Depends(get_db)
@@ -222,15 +208,15 @@ async def update_project(
         "project_date": db_project.project_date,
         "created_at": db_project.created_at,
         "updated_at": db_project.updated_at,
-        "total_entries": 0,
-        "total_weight_tons": 0.0,
-        "total_value": 0.0
+        "total_entries": db_project.cached_entries_count or 0,
+        "total_weight_tons": float(db_project.cached_total_weight_tons or 0),
+        "total_value": (db_project.cached_total_price_cents or 0) / 100
     }
     
     return response_data
 
 @router.delete("/{project_id}")
-async def delete_project(
+def delete_project(
     project_id: str,
     db: Session = Depends(get_db)
 ):
@@ -250,7 +236,7 @@ async def delete_project(
     return {"message": f"Project {project_id} deleted successfully"}
 
 @router.post("/{project_id}/duplicate")
-async def duplicate_project(
+def duplicate_project(
     project_id: str,
     new_name: str = Query(..., description="Name for the duplicated project"),
     db: Session = Depends(get_db)
@@ -269,7 +255,7 @@ async def duplicate_project(
         description=f"Duplicate of {original_project.name}"
     )
     
-    new_project = await create_project(project_data, db)
+    new_project = create_project(project_data, db)
     
     # Copy takeoff entries
     original_entries = db.query(TakeoffEntry).filter(TakeoffEntry.project_id == project_id).all()
@@ -305,7 +291,7 @@ async def duplicate_project(
     }
 
 @router.get("/{project_id}/summary")
-async def get_project_summary(
+def get_project_summary(
     project_id: str,
     db: Session = Depends(get_db)
 ):
@@ -375,7 +361,7 @@ async def get_project_summary(
     }
 
 @router.get("/stats/dashboard")
-async def get_dashboard_stats(db: Session = Depends(get_db)):
+def get_dashboard_stats(db: Session = Depends(get_db)):
     """Get dashboard statistics for all projects"""
     
     # Overall statistics
@@ -391,15 +377,12 @@ async def get_dashboard_stats(db: Session = Depends(get_db)):
         desc(TakeoffProject.created_at)
     ).limit(5).all()
     
-    # Total value across all projects
-    total_value = db.query(
-        func.sum(TakeoffEntry.total_price)
-    ).scalar() or 0
-    
-    # Total weight across all projects
-    total_weight = db.query(
-        func.sum(TakeoffEntry.total_weight_tons)
-    ).scalar() or 0
+    # Totals across all projects, from the cached per-project aggregates
+    total_value_cents, total_weight = db.query(
+        func.coalesce(func.sum(TakeoffProject.cached_total_price_cents), 0),
+        func.coalesce(func.sum(TakeoffProject.cached_total_weight_tons), 0)
+    ).one()
+    total_value = total_value_cents / 100
     
     return {
         'overview': {
@@ -426,7 +409,7 @@ async def test_project_route(project_id: str):
     return {"message": f"Project {project_id} test route works"}
 
 @router.post("/{project_id}/takeoff", response_model=ProjectTakeoffSaveResponse)
-async def save_project_takeoff(
+def save_project_takeoff(
     project_id: str,
     request: ProjectTakeoffSaveRequest,
     db: Session = Depends(get_db)
@@ -445,32 +428,20 @@ async def save_project_takeoff(
         # Delete existing entries for this project to avoid duplicates
         db.query(TakeoffEntry).filter(TakeoffEntry.project_id == project_id).delete()
         
-        # Create new entries from the request
-        entries_saved = 0
-        for entry_data in request.entries:
-            # Create new TakeoffEntry from the data with proper field mapping
-            new_entry = TakeoffEntry(
-                project_id=project_id,
-                qty=entry_data.get('qty', 1),
-                shape_key=entry_data.get('shape_key', ''),
-                description=entry_data.get('description', ''),
-                length_ft=entry_data.get('length_ft', 0.0),
-                width_ft=entry_data.get('width_in', 0.0) / 12.0 if entry_data.get('width_in') else 0.0,  # Convert inches to feet
-                weight_per_ft=entry_data.get('weight_per_ft', 0.0),
-                total_length_ft=entry_data.get('total_length_ft', 0.0),
-                total_weight_lbs=entry_data.get('total_weight_lbs', 0.0),
-                total_weight_tons=entry_data.get('total_weight_tons', 0.0),
-                unit_price_per_cwt=entry_data.get('unit_price_per_cwt', 0.0),
-                total_price=entry_data.get('total_price', 0.0),
-                labor_hours=entry_data.get('labor_hours', 0.0),
-                labor_rate=entry_data.get('labor_rate', 75.0),
-                labor_cost=entry_data.get('labor_cost', 0.0),
-                labor_mode=entry_data.get('labor_mode', 'auto'),
-                notes=entry_data.get('notes', '')
-            )
-            
-            db.add(new_entry)
-            entries_saved += 1
+        # Build rows from the request with proper field mapping; entries
+        # arrive already validated and defaulted by ProjectTakeoffSaveEntry
+        new_entries = []
+        for entry in request.entries:
+            row = entry.model_dump(exclude={"width_in"})
+            row["project_id"] = project_id
+            row["width_ft"] = entry.width_in / 12.0 if entry.width_in else 0.0  # Convert inches to feet
+            new_entries.append(row)
+        
+        # Insert all entries in one round trip, then refresh cached totals
+        if new_entries:
+            db.execute(insert(TakeoffEntry), new_entries)
+        refresh_project_totals(db.connection(), [project_id])
+        entries_saved = len(new_entries)
         
         # Commit all changes
         db.commit()
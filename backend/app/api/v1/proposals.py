@@ -84,7 +84,7 @@ async def generate_proposal_pdf(
         raise HTTPException(status_code=500, detail=f"Failed to generate PDF: {str(e)}")
 
 @router.post("/generate-final", response_model=FinalProposalResponse)
-async def generate_final_proposal(
+def generate_final_proposal(
     request: FinalProposalRequest,
     db: Session = Depends(get_db)
 ):
@@ -200,7 +200,7 @@ class ProposalResponse(BaseModel):
     message: Optional[str] = None
 
 @router.post("/generate", response_model=ProposalResponse)
-async def generate_ce_proposal(
+def generate_ce_proposal(
     request: ProposalGenerationRequest,
     db: Session = Depends(get_db)
 ):
@@ -332,7 +332,7 @@ async def get_proposal_templates():
     }
 
 @router.post("/preview")
-async def preview_proposal_totals(
+def preview_proposal_totals(
     request: ProposalGenerationRequest,
     db: Session = Depends(get_db)
 ):
@@ -395,7 +395,7 @@ async def preview_proposal_totals(
     }
 
 @router.post("/update-prices")
-async def update_material_prices(
+def update_material_prices(
     project_id: str,
     price_updates: List[MaterialPriceUpdate],
     db: Session = Depends(get_db)
@@ -453,7 +453,7 @@ async def update_material_prices(
         raise HTTPException(status_code=500, detail=f"Failed to update prices: {str(e)}")
 
 @router.get("/material-prices/{project_id}")
-async def get_project_material_prices(
+def get_project_material_prices(
     project_id: str,
     db: Session = Depends(get_db)
 ):
@@ -535,7 +535,7 @@ class BidSummaryResponse(BaseModel):
     success: bool
 
 @router.post("/save-indirect-settings")
-async def save_indirect_settings(
+def save_indirect_settings(
     request: IndirectExpensesRequest,
     db: Session = Depends(get_db)
 ):
@@ -567,7 +567,7 @@ async def save_indirect_settings(
         raise HTTPException(status_code=500, detail=f"Failed to save indirect settings: {str(e)}")
 
 @router.get("/indirect-settings/{project_id}")
-async def get_indirect_settings(
+def get_indirect_settings(
     project_id: str,
     db: Session = Depends(get_db)
 ):
@@ -597,7 +597,7 @@ async def get_indirect_settings(
         raise HTTPException(status_code=500, detail=f"Failed to get indirect settings: {str(e)}")
 
 @router.post("/calculate-with-indirects", response_model=BidSummaryResponse)
-async def calculate_bid_with_indirects(
+def calculate_bid_with_indirects(
     request: BidSummaryRequest,
     db: Session = Depends(get_db)
 ):
@@ -649,7 +649,7 @@ async def calculate_bid_with_indirects(
             cost_breakdown_percentages["total_indirects"] = (total_indirects / final_total) * 100
         
         # Save the calculation to project metadata
-        await save_indirect_settings(request.indirect_expenses, db)
+        save_indirect_settings(request.indirect_expenses, db)
         
         return BidSummaryResponse(
             project_id=request.project_id,
@@ -5,22 +5,35 @@ Real-time takeoff calculations and entry management
 
 from typing import List, Dict, Any
 from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.core.database import get_db
-from app.models.takeoff import TakeoffEntry, TakeoffProject
+from app.models.takeoff import TakeoffEntry, TakeoffProject, refresh_project_totals
 from app.models.material import Material
 from app.services.takeoff_service import TakeoffCalculationService
 from app.schemas.takeoff import (
     TakeoffEntryCreate, TakeoffEntryUpdate, TakeoffEntryResponse,
     TakeoffCalculationRequest, TakeoffCalculationResponse,
-    ProjectTotalsResponse
+    ProjectTotalsResponse, TakeoffSaveEntry, TakeoffGridRow
 )
 
 router = APIRouter()
 takeoff_service = TakeoffCalculationService()
 
+# Built once at import from the grid row schema: writes the whole list of
+# rows straight to JSON bytes with pydantic-core's compiled serializer, with
+# no intermediate Python objects for a second encoder to walk
+_ENTRY_LIST_JSON = TypeAdapter(List[TakeoffGridRow]).dump_json
+
+# Validates a whole save payload in one pydantic-core call instead of
+# reading each row field by field
+_SAVE_ENTRIES = TypeAdapter(List[TakeoffSaveEntry])
+
 @router.get("/projects/{project_id}/entries")
-async def get_project_entries(
+def get_project_entries(
     project_id: str,
     db: Session = Depends(get_db)
 ):
@@ -42,7 +55,7 @@ async def get_project_entries(
         entries = []
         for entry in db_entries:
             try:
-                entry_data = {
+                entry_data: TakeoffGridRow = {
                     "id": str(entry.id) if entry.id else str(hash(str(entry))),
                     "qty": int(entry.qty) if entry.qty else 1,
                     "shape_key": str(entry.shape_key) if entry.shape_key else "",
@@ -71,7 +84,7 @@ async def get_project_entries(
                 # Skip problematic entries instead of failing completely
                 continue
         
-        return entries
+        return Response(content=_ENTRY_LIST_JSON(entries), media_type="application/json")
         
     except HTTPException:
         # Re-raise HTTP exceptions as-is
@@ -84,7 +97,7 @@ async def get_project_entries(
         )
 
 @router.post("/calculate", response_model=TakeoffCalculationResponse)
-async def calculate_takeoff_entry(
+def calculate_takeoff_entry(
     request: TakeoffCalculationRequest,
     db: Session = Depends(get_db)
 ):
@@ -155,10 +168,10 @@ async def calculate_takeoff_entry(
         calculation["description"] = material_data.description
         calculation["category"] = getattr(material_data, "category", calculation.get("category", "Other"))
     
-    return TakeoffCalculationResponse(**calculation)
+    return ORJSONResponse(TakeoffCalculationResponse.from_calculation(calculation).to_dict())
 
 @router.get("/materials/search")
-async def search_materials(
+def search_materials(
     q: str = Query(..., description="Search term for materials"),
     category: str = Query(None, description="Filter by category"),
     limit: int = Query(50, description="Maximum results"),
@@ -208,21 +221,8 @@ async def search_materials(
         for m in sorted_materials
     ]
 
-@router.get("/projects/{project_id}/entries", response_model=List[TakeoffEntryResponse])
-async def get_project_takeoff_entries(
-    project_id: str,
-    db: Session = Depends(get_db)
-):
-    """Get all takeoff entries for a project"""
-    
-    entries = db.query(TakeoffEntry).filter(
-        TakeoffEntry.project_id == project_id
-    ).order_by(TakeoffEntry.created_at).all()
-    
-    return entries
-
 @router.post("/projects/{project_id}/entries", response_model=TakeoffEntryResponse)
-async def create_takeoff_entry(
+def create_takeoff_entry(
     project_id: str,
     entry_data: TakeoffEntryCreate,
     db: Session = Depends(get_db)
@@ -283,10 +283,10 @@ async def create_takeoff_entry(
     db.commit()
     db.refresh(db_entry)
     
-    return db_entry
+    return TakeoffEntryResponse.from_orm_trusted(db_entry)
 
 @router.put("/entries/{entry_id}", response_model=TakeoffEntryResponse)
-async def update_takeoff_entry(
+def update_takeoff_entry(
     entry_id: int,
     entry_update: TakeoffEntryUpdate,
     db: Session = Depends(get_db)
@@ -339,10 +339,10 @@ async def update_takeoff_entry(
     db.commit()
     db.refresh(db_entry)
     
-    return db_entry
+    return TakeoffEntryResponse.from_orm_trusted(db_entry)
 
 @router.delete("/entries/{entry_id}")
-async def delete_takeoff_entry(
+def delete_takeoff_entry(
     entry_id: int,
     db: Session = Depends(get_db)
 ):
@@ -358,7 +358,7 @@ async def delete_takeoff_entry(
     return {"message": "Takeoff entry deleted successfully"}
 
 @router.delete("/projects/{project_id}/entries")
-async def delete_all_project_entries(
+def delete_all_project_entries(
     project_id: str,
     db: Session = Depends(get_db)
 ):
@@ -380,6 +380,7 @@ async def delete_all_project_entries(
     
     # Delete all entries for this project
     deleted_count = db.query(TakeoffEntry).filter(TakeoffEntry.project_id == project_id).delete()
+    refresh_project_totals(db.connection(), [project_id])
     db.commit()
     
     return {
@@ -389,7 +390,7 @@ async def delete_all_project_entries(
     }
 
 @router.get("/projects/{project_id}/totals", response_model=ProjectTotalsResponse)
-async def get_project_totals(
+def get_project_totals(
     project_id: str,
     db: Session = Depends(get_db)
 ):
@@ -419,7 +420,7 @@ async def get_project_totals(
     return ProjectTotalsResponse(**totals)
 
 @router.get("/debug/database")
-async def debug_database(db: Session = Depends(get_db)):
+def debug_database(db: Session = Depends(get_db)):
     """Debug endpoint to check database connection and Material table"""
     try:
         from sqlalchemy import text
@@ -450,14 +451,14 @@ async def debug_database(db: Session = Depends(get_db)):
         return {"error": str(e), "type": type(e).__name__}
 
 @router.get("/categories")
-async def get_material_categories(db: Session = Depends(get_db)):
+def get_material_categories(db: Session = Depends(get_db)):
     """Get all available material categories"""
     
     categories = db.query(Material.category).distinct().all()
     return [category[0] for category in categories]
 
 @router.get("/descriptions/search")
-async def search_descriptions(
+def search_descriptions(
     q: str = Query(..., description="Search term for material descriptions"),
     limit: int = Query(20, description="Maximum results"),
     db: Session = Depends(get_db)
@@ -495,7 +496,7 @@ async def search_descriptions(
     return sorted_descriptions[:limit]
 
 @router.post("/projects/{project_id}/duplicate-entry/{entry_id}")
-async def duplicate_takeoff_entry(
+def duplicate_takeoff_entry(
     project_id: str,
     entry_id: int,
     db: Session = Depends(get_db)
@@ -533,7 +534,7 @@ async def duplicate_takeoff_entry(
     return duplicate_entry
 
 @router.post("/projects/{project_id}/save")
-async def save_project(
+def save_project(
     project_id: str,
     project_data: Dict[str, Any],
     db: Session = Depends(get_db)
@@ -542,45 +543,29 @@ async def save_project(
     Simple project save - replaces all entries for project in ONE transaction
     No loops, no race conditions, just a clean atomic save
     """
+    # Validate every row up front so a bad payload is a 422, not a half-built save
+    try:
+        entries = _SAVE_ENTRIES.validate_python(project_data.get('entries', []))
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+    
     try:
         # Start transaction
         # Delete existing entries for this project
         deleted_count = db.query(TakeoffEntry).filter(TakeoffEntry.project_id == project_id).delete()
         
-        # Get entries from request
-        entries_data = project_data.get('entries', [])
-        
-        # Create new entries in batch
+        # Build plain rows for a single executemany INSERT
         new_entries = []
-        for entry_data in entries_data:
-            db_entry = TakeoffEntry(
-                project_id=project_id,
-                qty=entry_data.get('qty', 1),
-                shape_key=entry_data.get('shape_key', ''),
-                description=entry_data.get('description', ''),
-                length_ft=entry_data.get('length_ft', 0.0),
-                width_ft=entry_data.get('width_ft', 0.0),
-                thickness_in=entry_data.get('thickness_in', 0.0),
-                weight_per_ft=entry_data.get('weight_per_ft', 0.0),
-                total_length_ft=entry_data.get('total_length_ft', 0.0),
-                total_weight_lbs=entry_data.get('total_weight_lbs', 0.0),
-                total_weight_tons=entry_data.get('total_weight_tons', 0.0),
-                unit_price_per_cwt=entry_data.get('unit_price_per_cwt', 0.0),
-                total_price=entry_data.get('total_price', 0.0),
-                labor_hours=entry_data.get('labor_hours', 0.0),
-                labor_rate=entry_data.get('labor_rate', 0.0),
-                labor_cost=entry_data.get('labor_cost', 0.0),
-                labor_mode=entry_data.get('labor_mode', 'auto'),
-                operations=entry_data.get('operations', []),
-                coatings_selected=entry_data.get('coatings_selected', []),
-                primary_coating=entry_data.get('primary_coating', ''),
-                coating_cost=entry_data.get('coating_cost', 0.0),
-                notes=entry_data.get('notes', '')
-            )
-            new_entries.append(db_entry)
+        for entry in entries:
+            row = entry.model_dump()
+            row["project_id"] = project_id
+            new_entries.append(row)
         
-        # Add all entries at once
-        db.add_all(new_entries)
+        # Insert all entries in one round trip (no per-row RETURNING), then
+        # bring the project's cached totals up to date
+        if new_entries:
+            db.execute(insert(TakeoffEntry), new_entries)
+        refresh_project_totals(db.connection(), [project_id])
         db.commit()
         
         return {
@@ -595,7 +580,7 @@ async def save_project(
         raise HTTPException(status_code=500, detail=f"Failed to save project: {str(e)}")
 
 @router.post("/projects/{project_id}/import-csv")
-async def import_takeoff_csv(
+def import_takeoff_csv(
     project_id: str,
     # file: UploadFile = File(...),  # Would implement file upload in production
     db: Session = Depends(get_db)
@@ -605,7 +590,7 @@ async def import_takeoff_csv(
     return {"message": "CSV import will be implemented in Phase 4"}
 
 @router.get("/projects/{project_id}/export-csv")
-async def export_takeoff_csv(
+def export_takeoff_csv(
     project_id: str,
     db: Session = Depends(get_db)
 ):
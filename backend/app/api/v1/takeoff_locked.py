@@ -23,7 +23,7 @@ def _material_or_400(db: Session, shape_key: str) -> Material:
     return mat
 
 @router.post("/calculate", response_model=TakeoffCalculationResponse)
-async def calculate_takeoff_entry(request: TakeoffCalculationRequest, db: Session = Depends(get_db)):
+def calculate_takeoff_entry(request: TakeoffCalculationRequest, db: Session = Depends(get_db)):
     mat = db.query(Material).filter(Material.shape_key == request.shape_key.upper()).first()
     material_confirmed = bool(mat)
     calc = svc.calculate_entry(
@@ -59,14 +59,14 @@ async def calculate_takeoff_entry(request: TakeoffCalculationRequest, db: Sessio
     return TakeoffCalculationResponse(**calc)
 
 @router.get("/projects/{project_id}/entries", response_model=List[TakeoffEntryResponse])
-async def get_project_takeoff_entries(project_id: str, db: Session = Depends(get_db)):
+def get_project_takeoff_entries(project_id: str, db: Session = Depends(get_db)):
     entries = db.query(TakeoffEntry).filter(TakeoffEntry.project_id == project_id).order_by(TakeoffEntry.created_at).all()
     for e in entries:
         setattr(e, "material_confirmed", True)
     return entries
 
 @router.post("/projects/{project_id}/entries", response_model=TakeoffEntryResponse, status_code=201)
-async def create_takeoff_entry(project_id: str, entry_data: TakeoffEntryCreate, db: Session = Depends(get_db)):
+def create_takeoff_entry(project_id: str, entry_data: TakeoffEntryCreate, db: Session = Depends(get_db)):
     mat = _material_or_400(db, entry_data.shape_key)
     req = TakeoffCalculationRequest(
         qty=entry_data.qty,
@@ -78,7 +78,7 @@ async def create_takeoff_entry(project_id: str, entry_data: TakeoffEntryCreate,
         labor_mode=entry_data.labor_mode,
         primary_coating=entry_data.primary_coating,
     )
-    calc = await calculate_takeoff_entry(req, db)
+    calc = calculate_takeoff_entry(req, db)
     db_entry = TakeoffEntry(
         project_id=project_id,
         qty=entry_data.qty,
@@ -107,7 +107,7 @@ async def create_takeoff_entry(project_id: str, entry_data: TakeoffEntryCreate,
     return db_entry
 
 @router.put("/entries/{entry_id}", response_model=TakeoffEntryResponse)
-async def update_takeoff_entry(entry_id: int, entry_update: TakeoffEntryUpdate, db: Session = Depends(get_db)):
+def update_takeoff_entry(entry_id: int, entry_update: TakeoffEntryUpdate, db: Session = Depends(get_db)):
     db_entry = db.query(TakeoffEntry).filter(TakeoffEntry.id == entry_id).first()
     if not db_entry:
         raise HTTPException(status_code=404, detail="Takeoff entry not found")
@@ -130,7 +130,7 @@ async def update_takeoff_entry(entry_id: int, entry_update: TakeoffEntryUpdate,
         labor_mode=db_entry.labor_mode,
         primary_coating=getattr(db_entry, "primary_coating", None),
     )
-    calc = await calculate_takeoff_entry(req, db)
+    calc = calculate_takeoff_entry(req, db)
     db_entry.weight_per_ft = calc.weight_per_ft
     db_entry.total_length_ft = calc.total_length_ft
     db_entry.total_weight_lbs = calc.total_weight_lbs
@@ -148,7 +148,7 @@ async def update_takeoff_entry(entry_id: int, entry_update: TakeoffEntryUpdate,
     return db_entry
 
 @router.get("/projects/{project_id}/totals", response_model=ProjectTotalsResponse)
-async def get_project_totals(project_id: str, db: Session = Depends(get_db)):
+def get_project_totals(project_id: str, db: Session = Depends(get_db)):
     entries = db.query(TakeoffEntry).filter(TakeoffEntry.project_id == project_id).all()
     entry_dicts = []
     for e in entries:
@@ -22,7 +22,7 @@ router = APIRouter()
 svc = TakeoffCalculationService()
 
 @router.post("/calculate", response_model=TakeoffCalculationResponse)
-async def calculate(request: TakeoffCalculationRequest, db: Session = Depends(get_db)):
+def calculate(request: TakeoffCalculationRequest, db: Session = Depends(get_db)):
     material = db.query(Material).filter(Material.shape_key == request.shape_key.upper()).first()
     result = svc.calculate_entry(
         qty=request.qty,
@@ -57,7 +57,7 @@ async def calculate(request: TakeoffCalculationRequest, db: Session = Depends(ge
     return TakeoffCalculationResponse(**result)
 
 @router.post("/projects/{project_id}/entries", response_model=TakeoffEntryResponse, status_code=201)
-async def create_entry(project_id: str, data: TakeoffEntryCreate, db: Session = Depends(get_db)):
+def create_entry(project_id: str, data: TakeoffEntryCreate, db: Session = Depends(get_db)):
     material = db.query(Material).filter(Material.shape_key == data.shape_key.upper()).first()
     # calc
     req = TakeoffCalculationRequest(
@@ -73,7 +73,7 @@ async def create_entry(project_id: str, data: TakeoffEntryCreate, db: Session =
         secondary_coating=data.secondary_coating,
         coatings_selected=data.coatings_selected,
     )
-    calc = await calculate(req, db)  # reuse endpoint logic
+    calc = calculate(req, db)  # reuse endpoint logic
     # Persist
     entry_kwargs = dict(
         project_id=project_id,
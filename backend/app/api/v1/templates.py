@@ -4,6 +4,7 @@ from sqlalchemy import and_, or_
 from typing import List, Optional
 from pydantic import BaseModel, Field
 from datetime import datetime
+from uuid import UUID
 
 from app.db.session import get_db
 from app.models.template import Template
@@ -26,7 +27,7 @@ class TemplateUpdate(BaseModel):
     calculator_settings: Optional[dict] = None
 
 class TemplateResponse(BaseModel):
-    id: str
+    id: UUID
     name: str
     category: str
     description: Optional[str]
@@ -53,7 +54,7 @@ def get_templates(
     return templates
 
 @router.get("/{template_id}", response_model=TemplateResponse)
-def get_template(template_id: str, db: Session = Depends(get_db)):
+def get_template(template_id: UUID, db: Session = Depends(get_db)):
     """Get a specific template by ID"""
     template = db.query(Template).filter(Template.id == template_id).first()
     if not template:
@@ -81,7 +82,7 @@ def create_template(template_data: TemplateCreate, db: Session = Depends(get_db)
 
 @router.put("/{template_id}", response_model=TemplateResponse)
 def update_template(
-    template_id: str, 
+    template_id: UUID, 
     template_data: TemplateUpdate, 
     db: Session = Depends(get_db)
 ):
@@ -103,7 +104,7 @@ def update_template(
     return template
 
 @router.delete("/{template_id}")
-def delete_template(template_id: str, db: Session = Depends(get_db)):
+def delete_template(template_id: UUID, db: Session = Depends(get_db)):
     """Delete a template"""
     template = db.query(Template).filter(Template.id == template_id).first()
     if not template:
@@ -117,7 +118,7 @@ def delete_template(template_id: str, db: Session = Depends(get_db)):
     return {"message": "Template deleted successfully"}
 
 @router.post("/{template_id}/duplicate", response_model=TemplateResponse)
-def duplicate_template(template_id: str, db: Session = Depends(get_db)):
+def duplicate_template(template_id: UUID, db: Session = Depends(get_db)):
     """Create a duplicate of an existing template"""
     original = db.query(Template).filter(Template.id == template_id).first()
     if not original:
@@ -1,14 +1,25 @@
 import os
+from typing import Optional
 from pydantic import BaseModel
 
 class Settings(BaseModel):
     database_url: str = os.getenv("DATABASE_URL", "sqlite:///./capitol_takeoff.db")
     jwt_secret: str = os.getenv("JWT_SECRET", "CHANGE-THIS-IN-PRODUCTION-RAILWAY-ENV-VARS")
     jwt_exp_minutes: int = int(os.getenv("JWT_EXP_MINUTES", "60"))
+    # bcrypt cost when bcrypt is the default scheme (no argon2-cffi); unset
+    # means calibrate to ~80 ms per hash at startup
+    bcrypt_rounds: Optional[int] = int(os.getenv("BCRYPT_ROUNDS")) if os.getenv("BCRYPT_ROUNDS") else None
     cors_origins: list[str] = [o for o in os.getenv("CORS_ORIGINS", "*" if os.getenv("ENVIRONMENT") == "production" else "http://localhost:5173,http://localhost:5174,http://localhost:5175,http://localhost:5176,http://localhost:5177,http://localhost:5178,http://localhost:5179").split(",") if o]
     admin_email: str = os.getenv("ADMIN_EMAIL", "admin@local")
     admin_password: str = os.getenv("ADMIN_PASSWORD", "Admin123!")
     env: str = os.getenv("ENV", "staging")
+    # DDL on boot is for local/staging; production schemas are migrated out of band
+    auto_create_tables: bool = os.getenv("AUTO_CREATE_TABLES", "false" if os.getenv("ENV") == "production" else "true").lower() == "true"
+    # Each sync handler thread holds at most one pooled DB connection, so by
+    # default run as many threads as the pool can hand out (DB_POOL_SIZE +
+    # DB_MAX_OVERFLOW); more would only queue on the pool checkout instead
+    threadpool_size: int = int(os.getenv("THREADPOOL_SIZE") or int(os.getenv("DB_POOL_SIZE", "20")) + int(os.getenv("DB_MAX_OVERFLOW", "10")))
+    db_pool_warm: int = int(os.getenv("DB_POOL_WARM", os.getenv("DB_POOL_SIZE", "20")))
     
     # Indolent Designs Company Profile
     company_name: str = os.getenv("COMPANY_NAME", "Indolent Designs")
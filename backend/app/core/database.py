@@ -3,21 +3,54 @@ Capitol Engineering Company - Database Configuration
 SQLAlchemy database setup for PostgreSQL
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+import msgpack
+from sqlalchemy import create_engine, text, JSON, LargeBinary
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.pool import NullPool
+from concurrent.futures import ThreadPoolExecutor
 import os
 
 # Database URL from environment - use PostgreSQL in production
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./capitol_takeoff.db")
 
+# Connection pool sizing. Each uvicorn worker keeps up to
+# DB_POOL_SIZE + DB_MAX_OVERFLOW connections open, so requests reuse an
+# established connection instead of paying a TCP/TLS handshake to Postgres.
+# pool_pre_ping drops connections the server closed while idle, and
+# pool_recycle retires connections before managed-Postgres idle timeouts.
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+# Behind PgBouncer in transaction mode the bouncer owns the pool; running a
+# second pool per worker on top of it just pins server connections
+USE_PGBOUNCER = os.getenv("DB_USE_PGBOUNCER", "false").lower() == "true"
+
 # Configure SQLAlchemy engine with proper settings for production
-if DATABASE_URL.startswith("postgresql"):
+if DATABASE_URL.startswith("postgresql") and USE_PGBOUNCER:
+    engine = create_engine(
+        DATABASE_URL,
+        poolclass=NullPool,
+        connect_args={
+            "connect_timeout": 60,
+            "application_name": "capitol-takeoff"
+        }
+    )
+elif DATABASE_URL.startswith("postgresql"):
     # Production PostgreSQL configuration
     engine = create_engine(
         DATABASE_URL,
+        pool_size=POOL_SIZE,
+        max_overflow=MAX_OVERFLOW,
+        pool_timeout=POOL_TIMEOUT,
         pool_pre_ping=True,
-        pool_recycle=300,
+        pool_recycle=POOL_RECYCLE,
+        # Batch executemany() UPDATE/DELETE via psycopg2's execute_batch;
+        # INSERTs already go through multi-row VALUES
+        executemany_mode="values_plus_batch",
         connect_args={
             "connect_timeout": 60,
             "application_name": "capitol-takeoff"
@@ -27,11 +60,29 @@ else:
     # Development SQLite configuration
     engine = create_engine(DATABASE_URL)
 
+# JSON column type: binary JSONB (parsed once on write, GIN-indexable) on
+# PostgreSQL, plain JSON on the SQLite development database
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+class MsgpackType(TypeDecorator):
+    """Opaque MessagePack blob (BYTEA/BLOB) for large numeric payloads that
+    are only ever read back whole. Roughly half the bytes of JSON text and
+    no JSON parse on fetch; use JSONType for anything queried in SQL."""
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else msgpack.packb(value, use_bin_type=True)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else msgpack.unpackb(value, raw=False)
+
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Create Base class
-Base = declarative_base()
+# Create Base class (DeclarativeBase so models can opt into MappedAsDataclass)
+class Base(DeclarativeBase):
+    pass
 
 # Dependency to get database session
 def get_db():
@@ -39,4 +90,38 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def warm_pool(count: int) -> int:
+    """Open up to `count` pooled connections in parallel and return them to
+    the pool, so the first burst of requests after a deploy does not pay the
+    connection handshake. Returns the number of connections warmed."""
+    if not DATABASE_URL.startswith("postgresql") or USE_PGBOUNCER:
+        return 0
+    count = max(0, min(count, POOL_SIZE))
+    if count == 0:
+        return 0
+
+    def _connect(_):
+        conn = engine.connect()
+        try:
+            conn.execute(text("SELECT 1"))
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
+    # Hold every connection until all are open so each worker thread
+    # creates a new one rather than reusing the previous checkout. If any
+    # connect fails, the ones that did open still go back to the pool.
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(_connect, i) for i in range(count)]
+    connections = []
+    try:
+        for future in futures:
+            connections.append(future.result())
+    finally:
+        for future in futures:
+            if not future.exception():
+                future.result().close()
+    return len(connections)
@@ -1,20 +1,55 @@
+import time
+import bcrypt
 from datetime import datetime, timedelta
 from typing import Any
 from jose import jwt
 from passlib.context import CryptContext
+from passlib.hash import argon2
 from .config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# argon2 when argon2-cffi is installed, bcrypt otherwise. Hashes in a
+# non-default scheme (or with outdated cost) are upgraded on the next
+# successful login via verify_and_update_password().
+_schemes = ["argon2", "bcrypt"] if argon2.has_backend() else ["bcrypt"]
+pwd_context = CryptContext(schemes=_schemes, deprecated="auto")
 
 ALGO = "HS256"
 
+def calibrate_bcrypt_rounds(target_ms: float = 80.0, low: int = 10, high: int = 14) -> int | None:
+    """Pick the bcrypt cost closest to target_ms on this machine and apply it.
+
+    Only matters when bcrypt is the default scheme, i.e. argon2-cffi is not
+    installed. With argon2 as the default, new hashes are argon2, legacy
+    bcrypt hashes are verified at the cost stored in the hash and then
+    rehashed to argon2, so the configured bcrypt cost is never used; this
+    returns None without timing anything.
+
+    Times a single hash at the lowest cost and extrapolates (each round
+    doubles the work), so calibration costs one cheap hash rather than a hash
+    at every candidate cost. BCRYPT_ROUNDS overrides the measurement."""
+    if pwd_context.default_scheme() != "bcrypt":
+        return None
+    rounds = settings.bcrypt_rounds
+    if rounds is None:
+        start = time.perf_counter()
+        bcrypt.hashpw(b"calibration", bcrypt.gensalt(rounds=low))
+        base_ms = (time.perf_counter() - start) * 1000
+        rounds = min(range(low, high + 1), key=lambda r: abs(base_ms * 2 ** (r - low) - target_ms))
+    pwd_context.update(bcrypt__rounds=rounds)
+    return rounds
+
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 def verify_password(password: str, hashed: str) -> bool:
     return pwd_context.verify(password, hashed)
 
+def verify_and_update_password(password: str, hashed: str) -> tuple[bool, str | None]:
+    """Verify a password; also return a replacement hash when the stored one
+    uses a deprecated scheme or cost"""
+    return pwd_context.verify_and_update(password, hashed)
+
 def create_access_token(subject: str, expires_minutes: int | None = None) -> str:
     expire = datetime.utcnow() + timedelta(minutes=expires_minutes or settings.jwt_exp_minutes)
     to_encode: dict[str, Any] = {"sub": subject, "exp": expire}
-    return jwt.encode(to_encode, settings.jwt_secret, algorithm=ALGO)
\ No newline at end of file
+    return jwt.encode(to_encode, settings.jwt_secret, algorithm=ALGO)
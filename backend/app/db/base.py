@@ -1,5 +1,7 @@
-from sqlalchemy.orm import declarative_base
-Base = declarative_base()
+from sqlalchemy.orm import DeclarativeBase
+
+class Base(DeclarativeBase):
+    pass
 
 # Import all models here to ensure they're registered with Base
 from app.models import material, takeoff, labor_operation, coating_system, labor_settings, nesting, template
\ No newline at end of file
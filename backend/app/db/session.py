@@ -1,9 +1,8 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from app.core.config import settings
+from sqlalchemy.orm import Session
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Share the pooled engine and sessionmaker from app.core.database so the
+# process keeps a single connection pool instead of one per module
+from app.core.database import engine, SessionLocal
 
 def get_db() -> Session:
     """Get database session"""
@@ -1,25 +1,178 @@
 import os
+import stat
+import asyncio
+import logging
+import hashlib
+import itertools
+import anyio
+import orjson
+from dataclasses import dataclass
+from mimetypes import guess_type
+from typing import Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse, Response, FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from starlette.staticfiles import NotModifiedResponse
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.core.config import settings
-from app.core.database import engine, Base
+from app.core.database import engine, Base, warm_pool
+from app.core.security import calibrate_bcrypt_rounds
 from app.api.v1 import api_router
 from app.routers import health
 
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"))
+logger = logging.getLogger("app")
+
 # Create FastAPI application
 app = FastAPI(
     title="Indolent Forge API",
     version="1.0.0",
-    description="Professional Takeoff System API - Indolent Designs"
+    description="Professional Takeoff System API - Indolent Designs",
+    default_response_class=ORJSONResponse
 )
 
+# Body for the generic 500 response, serialized once
+_GENERIC_500 = orjson.dumps({"error": "Internal server error", "status_code": 500})
+
+
+# Precompressed sidecars produced by the frontend build, in order of preference
+_PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+_COMPRESSIBLE_EXTS = (".js", ".css", ".html", ".svg", ".json", ".txt", ".map")
+
+
+class PrecompressedStatic(StaticFiles):
+    """Serves a .br/.gz sidecar next to a text asset when the client accepts it"""
+
+    async def get_response(self, path, scope):
+        if not path.endswith(_COMPRESSIBLE_EXTS):
+            return await super().get_response(path, scope)
+        request_headers = Headers(scope=scope)
+        accept_encoding = request_headers.get("accept-encoding", "")
+        for encoding, suffix in _PRECOMPRESSED:
+            if encoding not in accept_encoding:
+                continue
+            full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + suffix)
+            if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                continue
+            response = FileResponse(
+                full_path,
+                stat_result=stat_result,
+                media_type=guess_type(path)[0] or "text/plain",
+                headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+            )
+            if self.is_not_modified(response.headers, request_headers):
+                return NotModifiedResponse(response.headers)
+            return response
+        response = await super().get_response(path, scope)
+        response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+
+class CachedStatic(PrecompressedStatic):
+    """Static files with content-hashed names; safe to cache forever"""
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+class NoCacheStatic(PrecompressedStatic):
+    """Static files that must be revalidated on every load (SPA shell)"""
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
+
+# Path prefixes the SPA fallback must never answer, and file extensions that
+# are real files rather than client-side routes (tuples so startswith/endswith
+# run in C)
+_EXCLUDED_PREFIXES = ("api/", "health", "docs", "assets/", "static/")
+_STATIC_EXTS = (".js", ".css", ".png", ".jpg", ".ico", ".svg")
+
+
+class SpaStatic(NoCacheStatic):
+    """Frontend build directory; unknown paths get index.html so React Router
+    can resolve client-side routes"""
+
+    async def get_response(self, path, scope):
+        if path not in (".", "index.html"):
+            try:
+                return await super().get_response(path, scope)
+            except StarletteHTTPException as exc:
+                if exc.status_code != 404 or path.startswith(_EXCLUDED_PREFIXES) or path.endswith(_STATIC_EXTS):
+                    raise
+        request_headers = Headers(scope=scope)
+        # The mtime check (and any re-read) touches the filesystem; keep it
+        # off the event loop like the static lookups above
+        index_response = await anyio.to_thread.run_sync(
+            index_cache.response,
+            request_headers.get("if-none-match"),
+            request_headers.get("accept-encoding", "")
+        )
+        if index_response is None:
+            raise StarletteHTTPException(status_code=404, detail="Not found")
+        return index_response
+
+
+class IndexCache:
+    """In-memory copy of index.html (and its precompressed sidecars), re-read
+    only when the file's mtime changes"""
+
+    def __init__(self, path):
+        self.path = path
+        self._entry = None  # (mtime, {encoding: (body, etag)})
+
+    def _load(self):
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            self._entry = None
+            return None
+        entry = self._entry
+        if entry is None or entry[0] != mtime:
+            with open(self.path, "rb") as f:
+                body = f.read()
+            digest = hashlib.md5(body, usedforsecurity=False).hexdigest()
+            variants = {None: (body, f'"{digest}"')}
+            for encoding, suffix in _PRECOMPRESSED:
+                try:
+                    with open(self.path + suffix, "rb") as f:
+                        variants[encoding] = (f.read(), f'"{digest}-{encoding}"')
+                except OSError:
+                    pass
+            entry = self._entry = (mtime, variants)
+        return entry
+
+    def response(self, if_none_match=None, accept_encoding=""):
+        """Build the index response, or None if index.html does not exist.
+        Blocks on a stat (and a read when the file changed): call it from a
+        worker thread inside request handlers"""
+        entry = self._load()
+        if entry is None:
+            return None
+        variants = entry[1]
+        encoding = next(
+            (enc for enc, _ in _PRECOMPRESSED if enc in variants and enc in accept_encoding), None
+        )
+        body, etag = variants[encoding]
+        headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if encoding is not None:
+            headers["Content-Encoding"] = encoding
+        if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="text/html", headers=headers)
+
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -32,153 +185,191 @@ app.add_middleware(
 # Create database tables (in production, use Alembic migrations)
 @app.on_event("startup")
 async def startup_event():
-    # Create tables if they don't exist
+    # Sync route handlers (all the DB-backed endpoints) run in AnyIO's worker
+    # threads; size the limiter to the DB connection pool they draw from
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+
+    # Size the bcrypt cost to this machine once, off the event loop (a no-op
+    # when argon2 is the default password scheme)
+    rounds = await asyncio.to_thread(calibrate_bcrypt_rounds)
+    if rounds is not None:
+        logger.info("Using bcrypt cost %d", rounds)
+
+    # Create tables if they don't exist. DDL is blocking, so run it in a
+    # worker thread instead of stalling the event loop; production skips it
+    # so multiple workers don't contend on CREATE TABLE at boot.
     try:
-        Base.metadata.create_all(bind=engine)
-        print("Database tables created successfully")
+        if settings.auto_create_tables:
+            await asyncio.to_thread(Base.metadata.create_all, bind=engine)
+            logger.info("Database tables created successfully")
+        else:
+            logger.info("Skipping table creation (AUTO_CREATE_TABLES disabled)")
+
+        # Open pooled connections up front so the first requests skip the handshake
+        warmed = await asyncio.to_thread(warm_pool, settings.db_pool_warm)
+        if warmed:
+            logger.info("Warmed %d database connections", warmed)
         
         # Run labor data migration only if not in production
         if settings.env != "production":
             from app.core.data_migration import migrate_labor_data
             try:
-                migrate_labor_data()
-                print("Labor data migration completed")
+                await asyncio.to_thread(migrate_labor_data)
+                logger.info("Labor data migration completed")
             except Exception as migration_error:
-                print(f"Labor migration failed: {migration_error}")
+                logger.warning("Labor migration failed: %s", migration_error)
         else:
-            print("Production mode: Skipping data migrations")
+            logger.info("Production mode: Skipping data migrations")
             
     except Exception as e:
-        error_msg = f"Database connection failed: {e}"
-        print(error_msg)
+        logger.error("Database connection failed: %s", e)
         
         # In production, database failures should be fatal
         if settings.env == "production":
-            print("FATAL: Database connection required in production")
+            logger.critical("FATAL: Database connection required in production")
             raise e
         else:
-            print("Development mode: Continuing without database")
+            logger.warning("Development mode: Continuing without database")
 
 # Include routers
 app.include_router(health.router, prefix="/health", tags=["health"])
 app.include_router(api_router, prefix="/api/v1")
 
+def _iter_files(directory):
+    """Lazily yield file entries under directory, depth first"""
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir():
+                yield from _iter_files(entry.path)
+            else:
+                yield entry
+
+
+@dataclass(frozen=True)
+class StaticLayout:
+    """Snapshot of the frontend build directory, taken once at startup"""
+    static_exists: bool
+    assets_exists: bool
+    index_exists: bool
+    contents: tuple = ()
+    sample_files: tuple = ()
+    error: Optional[str] = None
+
+    @classmethod
+    def scan(cls, directory):
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except FileNotFoundError:
+            return cls(static_exists=False, assets_exists=False, index_exists=False)
+        except OSError as e:
+            return cls(static_exists=True, assets_exists=False, index_exists=False, error=str(e))
+        by_name = {entry.name: entry for entry in entries}
+        assets = by_name.get("assets")
+        index = by_name.get("index.html")
+        # First 20 files in static directory without walking the whole tree
+        prefix_len = len(directory) + 1
+        sample_files = tuple(
+            entry.path[prefix_len:] for entry in itertools.islice(_iter_files(directory), 20)
+        )
+        return cls(
+            static_exists=True,
+            assets_exists=assets is not None and assets.is_dir(),
+            index_exists=index is not None and index.is_file(),
+            contents=tuple(by_name),
+            sample_files=sample_files,
+        )
+
+
 # Mount static files for production (frontend build)
 static_dir = os.path.join(os.path.dirname(__file__), "..", "static")
-if os.path.exists(static_dir):
+static_layout = StaticLayout.scan(static_dir)
+if static_layout.static_exists:
     # Mount assets directory (CSS, JS, images)
-    assets_dir = os.path.join(static_dir, "assets")
-    if os.path.exists(assets_dir):
-        app.mount("/assets", StaticFiles(directory=assets_dir), name="assets")
-        print(f"✅ Serving frontend assets from: {assets_dir}")
+    if static_layout.assets_exists:
+        assets_dir = os.path.join(static_dir, "assets")
+        app.mount("/assets", CachedStatic(directory=assets_dir), name="assets")
+        logger.info("Serving frontend assets from: %s", assets_dir)
     
     # Mount static files
-    app.mount("/static", StaticFiles(directory=static_dir), name="static")
-    print(f"✅ Serving static files from: {static_dir}")
+    app.mount("/static", NoCacheStatic(directory=static_dir), name="static")
+    logger.info("Serving static files from: %s", static_dir)
 else:
-    print(f"⚠️ Static directory not found: {static_dir}")
+    logger.warning("Static directory not found: %s", static_dir)
+
+index_cache = IndexCache(os.path.join(static_dir, "index.html"))
+
+# API root payload never changes for the life of the process; serialize once
+_API_ROOT_BYTES = orjson.dumps({
+    "name": "Indolent Forge API",
+    "version": "1.0.0",
+    "environment": settings.env,
+    "company": settings.company_name,
+    "status": "ready"
+})
 
 @app.get("/api")
 def api_root():
     """API root endpoint"""
-    return {
-        "name": "Indolent Forge API",
-        "version": "1.0.0",
-        "environment": settings.env,
-        "company": settings.company_name,
-        "status": "ready"
-    }
+    return Response(content=_API_ROOT_BYTES, media_type="application/json")
 
-@app.get("/debug")
 def debug_info():
-    """Debug endpoint to check static file setup"""
-    import glob
-    static_dir = os.path.join(os.path.dirname(__file__), "..", "static")
-    
+    """Debug endpoint to check static file setup (as scanned at startup)"""
     debug_data = {
         "static_dir_path": static_dir,
-        "static_dir_exists": os.path.exists(static_dir),
+        "static_dir_exists": static_layout.static_exists,
         "current_working_directory": os.getcwd(),
         "app_file_location": __file__
     }
     
-    if os.path.exists(static_dir):
-        try:
-            debug_data["static_dir_contents"] = os.listdir(static_dir)
-            index_path = os.path.join(static_dir, "index.html")
-            debug_data["index_html_exists"] = os.path.exists(index_path)
-            
-            # List all files in static directory
-            all_files = []
-            for root, dirs, files in os.walk(static_dir):
-                for file in files:
-                    all_files.append(os.path.relpath(os.path.join(root, file), static_dir))
-            debug_data["all_static_files"] = all_files[:20]  # Limit to first 20 files
-        except Exception as e:
-            debug_data["static_dir_error"] = str(e)
+    if static_layout.error is not None:
+        debug_data["static_dir_error"] = static_layout.error
+    elif static_layout.static_exists:
+        debug_data["static_dir_contents"] = list(static_layout.contents)
+        debug_data["index_html_exists"] = static_layout.index_exists
+        debug_data["all_static_files"] = list(static_layout.sample_files)
     
     return debug_data
 
-# Serve React frontend for all non-API routes
-@app.get("/{full_path:path}")
-def serve_frontend(full_path: str):
-    """Serve React frontend for all non-API routes"""
-    # Don't interfere with API routes, health, docs, or static assets
-    if (full_path.startswith("api/") or 
-        full_path.startswith("health") or 
-        full_path.startswith("docs") or
-        full_path.startswith("assets/") or
-        full_path.startswith("static/")):
-        raise HTTPException(status_code=404, detail="Not found")
-    
-    # For specific file extensions, try to serve from static directory first
-    if "." in full_path and any(full_path.endswith(ext) for ext in ['.js', '.css', '.png', '.jpg', '.ico', '.svg']):
-        static_dir = os.path.join(os.path.dirname(__file__), "..", "static")
-        file_path = os.path.join(static_dir, full_path)
-        if os.path.exists(file_path):
-            return FileResponse(file_path)
-    
-    # Serve index.html for all frontend routes (React Router will handle routing)
-    static_dir = os.path.join(os.path.dirname(__file__), "..", "static")
-    index_file = os.path.join(static_dir, "index.html")
-    
-    if os.path.exists(index_file):
-        return FileResponse(index_file)
-    else:
-        # Fallback API response if no frontend is built
+# Only expose the debug endpoint in development
+if settings.env == "development":
+    app.add_api_route("/debug", debug_info, methods=["GET"])
+
+# Serve React frontend for all non-API routes. Mounted last so every literal
+# route and mount above is matched first; unknown paths fall through to here.
+if static_layout.index_exists:
+    index_cache.response()  # prime the in-memory copy
+    app.mount("/", SpaStatic(directory=static_dir, html=True), name="frontend")
+else:
+    @app.get("/")
+    def frontend_not_built():
+        """Fallback API response if no frontend is built"""
         return {
             "message": "Indolent Forge API is running",
             "frontend": "not built - run 'npm run build' in frontend directory",
-            "api_docs": "/docs",
-            "requested_path": full_path
+            "api_docs": "/docs"
         }
 
 # Error handlers
-@app.exception_handler(HTTPException)
-async def http_exception_handler(request: Request, exc: HTTPException):
-    return JSONResponse(
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException):
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"error": exc.detail, "status_code": exc.status_code}
     )
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
-    # Log the full error for debugging (server-side only)
-    import traceback
-    print(f"Internal server error: {str(exc)}")
-    print(f"Traceback: {traceback.format_exc()}")
-    
-    # Return generic error to client (no sensitive information)
-    error_response = {
-        "error": "Internal server error", 
-        "status_code": 500
-    }
+    # Log the full error for debugging (server-side only); the traceback is
+    # only formatted if a handler actually emits the record
+    logger.exception("Internal server error: %s", exc)
     
     # Only include debug info in development
     if settings.env == "development":
-        error_response["debug"] = str(exc)
+        return ORJSONResponse(
+            status_code=500,
+            content={"error": "Internal server error", "status_code": 500, "debug": str(exc)}
+        )
     
-    return JSONResponse(
-        status_code=500,
-        content=error_response
-    )
\ No newline at end of file
+    # Return generic error to client (no sensitive information)
+    return Response(content=_GENERIC_500, status_code=500, media_type="application/json")
\ No newline at end of file
@@ -2,7 +2,10 @@
 Coating System Model - Dynamic coating systems with rates
 """
 
-from sqlalchemy import Column, Integer, String, Numeric, Boolean, DateTime, Enum as SQLEnum
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Integer, String, Float, Boolean, DateTime, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, MappedAsDataclass, mapped_column
 from sqlalchemy.sql import func
 from app.db.base import Base
 import enum
@@ -12,15 +15,15 @@ class CoatingType(str, enum.Enum):
     weight = "weight"  # Priced per pound
     none = "none"      # No coating
 
-class CoatingSystem(Base):
+class CoatingSystem(MappedAsDataclass, Base, kw_only=True, eq=False):
     __tablename__ = "coating_systems"
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), unique=True, nullable=False, index=True)
-    coating_type = Column(SQLEnum(CoatingType), nullable=False)
-    rate = Column(Numeric(10, 4), nullable=False)  # Rate per unit (sqft or lb)
-    description = Column(String(255), nullable=True)
-    unit_display = Column(String(50), nullable=False)  # e.g., "per square foot", "per pound"
-    active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
\ No newline at end of file
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, init=False)
+    name: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+    coating_type: Mapped[CoatingType] = mapped_column(SQLEnum(CoatingType))
+    rate: Mapped[float] = mapped_column(Float)  # Rate per unit (sqft or lb); rounded to cents when presented
+    description: Mapped[Optional[str]] = mapped_column(String(255), default=None)
+    unit_display: Mapped[str] = mapped_column(String(50))  # e.g., "per square foot", "per pound"
+    active: Mapped[bool] = mapped_column(Boolean, default=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), init=False)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now(), init=False)
\ No newline at end of file
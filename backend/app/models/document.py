@@ -3,8 +3,10 @@ Document and Drawing Management Models
 For Senior Project Engineer document control system
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, Float, ForeignKey, Boolean, JSON
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import Any, List, Optional
+from sqlalchemy import Integer, String, DateTime, Text, Float, ForeignKey, Boolean, JSON, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
 
@@ -12,311 +14,329 @@ from app.db.base import Base
 class Document(Base):
     """Main document/drawing table"""
     __tablename__ = "documents"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(String(20), ForeignKey("takeoff_projects.id"), nullable=False, index=True)
-    document_number = Column(String(100), unique=True, index=True, nullable=False)
-    title = Column(String(255), nullable=False)
-    description = Column(Text)
+    __table_args__ = (
+        # Document list filters: project + latest/status, project + type
+        Index("ix_documents_project_latest_status", "project_id", "is_latest", "status"),
+        Index("ix_documents_project_type", "project_id", "document_type"),
+        # Date-range search
+        Index("ix_documents_created_at", "created_at"),
+    )
+    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    project_id: Mapped[str] = mapped_column(String(20), ForeignKey("takeoff_projects.id"), nullable=False, index=True)
+    document_number: Mapped[str] = mapped_column(String(100), unique=True, index=True, nullable=False)
+    title: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text)
     
     # Document classification
-    document_type = Column(String(50), nullable=False)  # drawing, specification, report, procedure, etc.
-    discipline = Column(String(50))  # mechanical, electrical, civil, structural, etc.
-    category = Column(String(50))  # P&ID, isometric, GA, detail, etc.
+    document_type: Mapped[str] = mapped_column(String(50), nullable=False)  # drawing, specification, report, procedure, etc.
+    discipline: Mapped[Optional[str]] = mapped_column(String(50))  # mechanical, electrical, civil, structural, etc.
+    category: Mapped[Optional[str]] = mapped_column(String(50))  # P&ID, isometric, GA, detail, etc.
     
     # File information
-    file_name = Column(String(255), nullable=False)
-    file_path = Column(String(500), nullable=False)
-    file_size = Column(Float)  # in MB
-    file_format = Column(String(20))  # pdf, dwg, dxf, docx, etc.
+    file_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    file_path: Mapped[str] = mapped_column(String(500), nullable=False)
+    file_size: Mapped[Optional[float]] = mapped_column(Float)  # in MB
+    file_format: Mapped[Optional[str]] = mapped_column(String(20))  # pdf, dwg, dxf, docx, etc.
     
     # Version control
-    version = Column(String(20), default="A")
-    revision_number = Column(Integer, default=0)
-    is_latest = Column(Boolean, default=True)
-    superseded_by = Column(Integer, ForeignKey("documents.id"), nullable=True)
+    version: Mapped[Optional[str]] = mapped_column(String(20), default="A")
+    revision_number: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    is_latest: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    superseded_by: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("documents.id"), nullable=True)
     
     # Status and workflow
-    status = Column(String(50), default="draft")  # draft, for_review, approved, superseded, obsolete, archived
-    review_status = Column(String(50))  # pending, in_review, approved, rejected
-    approval_date = Column(DateTime)
+    status: Mapped[Optional[str]] = mapped_column(String(50), default="draft")  # draft, for_review, approved, superseded, obsolete, archived
+    review_status: Mapped[Optional[str]] = mapped_column(String(50))  # pending, in_review, approved, rejected
+    approval_date: Mapped[Optional[datetime]] = mapped_column(DateTime)
     
     # Archive functionality
-    is_archived = Column(Boolean, default=False)
-    archived_date = Column(DateTime)
-    archived_by = Column(String(100))
-    archive_reason = Column(String(255))
-    archive_location = Column(String(500))  # physical or digital archive location
+    is_archived: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    archived_date: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    archived_by: Mapped[Optional[str]] = mapped_column(String(100))
+    archive_reason: Mapped[Optional[str]] = mapped_column(String(255))
+    archive_location: Mapped[Optional[str]] = mapped_column(String(500))  # physical or digital archive location
     
     # People involved
-    uploaded_by = Column(String(100), nullable=False)
-    reviewed_by = Column(String(100))
-    approved_by = Column(String(100))
-    engineer_of_record = Column(String(100))
+    uploaded_by: Mapped[str] = mapped_column(String(100), nullable=False)
+    reviewed_by: Mapped[Optional[str]] = mapped_column(String(100))
+    approved_by: Mapped[Optional[str]] = mapped_column(String(100))
+    engineer_of_record: Mapped[Optional[str]] = mapped_column(String(100))
     
     # Dates
-    created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, onupdate=func.now())
-    issued_date = Column(DateTime)
-    effective_date = Column(DateTime)
-    expiry_date = Column(DateTime)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, onupdate=func.now())
+    issued_date: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    effective_date: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    expiry_date: Mapped[Optional[datetime]] = mapped_column(DateTime)
     
     # Additional metadata
-    tags = Column(JSON)  # searchable tags
-    document_metadata = Column(JSON)  # flexible storage for custom fields
+    tags: Mapped[Optional[Any]] = mapped_column(JSON)  # searchable tags
+    document_metadata: Mapped[Optional[Any]] = mapped_column(JSON)  # flexible storage for custom fields
     
     # Security and access
-    access_level = Column(String(50), default="internal")  # public, internal, confidential, restricted
-    is_controlled = Column(Boolean, default=False)  # controlled document requiring special handling
+    access_level: Mapped[Optional[str]] = mapped_column(String(50), default="internal")  # public, internal, confidential, restricted
+    is_controlled: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)  # controlled document requiring special handling
     
     # Relationships - using back_populates to avoid circular import issues
     # project = relationship("Project", back_populates="documents")
-    revisions = relationship("DocumentRevision", back_populates="document", cascade="all, delete-orphan")
-    comments = relationship("DocumentComment", back_populates="document", cascade="all, delete-orphan")
-    approvals = relationship("DocumentApproval", back_populates="document", cascade="all, delete-orphan")
-    distributions = relationship("DocumentDistribution", back_populates="document", cascade="all, delete-orphan")
+    revisions: Mapped[List["DocumentRevision"]] = relationship("DocumentRevision", back_populates="document", cascade="all, delete-orphan")
+    comments: Mapped[List["DocumentComment"]] = relationship("DocumentComment", back_populates="document", cascade="all, delete-orphan")
+    approvals: Mapped[List["DocumentApproval"]] = relationship("DocumentApproval", back_populates="document", cascade="all, delete-orphan")
+    distributions: Mapped[List["DocumentDistribution"]] = relationship("DocumentDistribution", back_populates="document", cascade="all, delete-orphan")
 
 
 class DocumentRevision(Base):
     """Track all document revisions"""
     __tablename__ = "document_revisions"
+    __table_args__ = (
+        Index("ix_document_revisions_doc_revnum", "document_id", "revision_number"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
-    document_id = Column(Integer, ForeignKey("documents.id"), nullable=False, index=True)
-    revision = Column(String(20), nullable=False)
-    revision_number = Column(Integer, nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    document_id: Mapped[int] = mapped_column(Integer, ForeignKey("documents.id"), nullable=False, index=True)
+    revision: Mapped[str] = mapped_column(String(20), nullable=False)
+    revision_number: Mapped[int] = mapped_column(Integer, nullable=False)
     
     # File information for this revision
-    file_name = Column(String(255), nullable=False)
-    file_path = Column(String(500), nullable=False)
-    file_size = Column(Float)
+    file_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    file_path: Mapped[str] = mapped_column(String(500), nullable=False)
+    file_size: Mapped[Optional[float]] = mapped_column(Float)
     
     # Revision details
-    change_description = Column(Text, nullable=False)
-    reason_for_change = Column(String(255))
+    change_description: Mapped[str] = mapped_column(Text, nullable=False)
+    reason_for_change: Mapped[Optional[str]] = mapped_column(String(255))
     
     # Status
-    status = Column(String(50), default="active")
+    status: Mapped[Optional[str]] = mapped_column(String(50), default="active")
     
     # People and dates
-    created_by = Column(String(100), nullable=False)
-    created_at = Column(DateTime, server_default=func.now())
+    created_by: Mapped[str] = mapped_column(String(100), nullable=False)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
     
     # Relationships
-    document = relationship("Document", back_populates="revisions")
+    document: Mapped["Document"] = relationship("Document", back_populates="revisions")
 
 
 class DocumentComment(Base):
     """Comments and markups on documents"""
     __tablename__ = "document_comments"
     
-    id = Column(Integer, primary_key=True, index=True)
-    document_id = Column(Integer, ForeignKey("documents.id"), nullable=False, index=True)
-    revision_id = Column(Integer, ForeignKey("document_revisions.id"))
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    document_id: Mapped[int] = mapped_column(Integer, ForeignKey("documents.id"), nullable=False, index=True)
+    revision_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("document_revisions.id"))
     
     # Comment details
-    comment_type = Column(String(50))  # general, technical, markup, redline
-    comment_text = Column(Text, nullable=False)
-    page_number = Column(Integer)
-    coordinates = Column(JSON)  # for markup positioning
+    comment_type: Mapped[Optional[str]] = mapped_column(String(50))  # general, technical, markup, redline
+    comment_text: Mapped[str] = mapped_column(Text, nullable=False)
+    page_number: Mapped[Optional[int]] = mapped_column(Integer)
+    coordinates: Mapped[Optional[Any]] = mapped_column(JSON)  # for markup positioning
     
     # Status
-    status = Column(String(50), default="open")  # open, resolved, closed
-    priority = Column(String(20), default="normal")  # low, normal, high, critical
+    status: Mapped[Optional[str]] = mapped_column(String(50), default="open")  # open, resolved, closed
+    priority: Mapped[Optional[str]] = mapped_column(String(20), default="normal")  # low, normal, high, critical
     
     # Resolution
-    resolution = Column(Text)
-    resolved_by = Column(String(100))
-    resolved_at = Column(DateTime)
+    resolution: Mapped[Optional[str]] = mapped_column(Text)
+    resolved_by: Mapped[Optional[str]] = mapped_column(String(100))
+    resolved_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
     
     # People and dates
-    created_by = Column(String(100), nullable=False)
-    created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, onupdate=func.now())
+    created_by: Mapped[str] = mapped_column(String(100), nullable=False)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, onupdate=func.now())
     
     # Relationships
-    document = relationship("Document", back_populates="comments")
-    attachments = relationship("CommentAttachment", back_populates="comment", cascade="all, delete-orphan")
+    document: Mapped["Document"] = relationship("Document", back_populates="comments")
+    attachments: Mapped[List["CommentAttachment"]] = relationship("CommentAttachment", back_populates="comment", cascade="all, delete-orphan")
 
 
 class CommentAttachment(Base):
     """Attachments for document comments"""
     __tablename__ = "comment_attachments"
     
-    id = Column(Integer, primary_key=True, index=True)
-    comment_id = Column(Integer, ForeignKey("document_comments.id"), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    comment_id: Mapped[int] = mapped_column(Integer, ForeignKey("document_comments.id"), nullable=False)
     
-    file_name = Column(String(255), nullable=False)
-    file_path = Column(String(500), nullable=False)
-    file_type = Column(String(50))
-    file_size = Column(Float)
+    file_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    file_path: Mapped[str] = mapped_column(String(500), nullable=False)
+    file_type: Mapped[Optional[str]] = mapped_column(String(50))
+    file_size: Mapped[Optional[float]] = mapped_column(Float)
     
-    uploaded_by = Column(String(100), nullable=False)
-    uploaded_at = Column(DateTime, server_default=func.now())
+    uploaded_by: Mapped[str] = mapped_column(String(100), nullable=False)
+    uploaded_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
     
     # Relationships
-    comment = relationship("DocumentComment", back_populates="attachments")
+    comment: Mapped["DocumentComment"] = relationship("DocumentComment", back_populates="attachments")
 
 
 class DocumentApproval(Base):
     """Approval workflow for documents"""
     __tablename__ = "document_approvals"
+    __table_args__ = (
+        # Pending-approval probes per document
+        Index("ix_approval_doc_status", "document_id", "status"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
-    document_id = Column(Integer, ForeignKey("documents.id"), nullable=False, index=True)
-    revision_id = Column(Integer, ForeignKey("document_revisions.id"))
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    document_id: Mapped[int] = mapped_column(Integer, ForeignKey("documents.id"), nullable=False, index=True)
+    revision_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("document_revisions.id"))
     
     # Approval details
-    approval_level = Column(Integer, nullable=False)  # 1, 2, 3 for multi-level approval
-    approval_type = Column(String(50))  # technical, quality, management, client
+    approval_level: Mapped[int] = mapped_column(Integer, nullable=False)  # 1, 2, 3 for multi-level approval
+    approval_type: Mapped[Optional[str]] = mapped_column(String(50))  # technical, quality, management, client
     
     # Approver information
-    approver_name = Column(String(100), nullable=False)
-    approver_role = Column(String(100))
-    approver_email = Column(String(255))
+    approver_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    approver_role: Mapped[Optional[str]] = mapped_column(String(100))
+    approver_email: Mapped[Optional[str]] = mapped_column(String(255))
     
     # Status
-    status = Column(String(50), default="pending")  # pending, approved, rejected, on_hold
+    status: Mapped[Optional[str]] = mapped_column(String(50), default="pending")  # pending, approved, rejected, on_hold
     
     # Decision details
-    decision = Column(String(50))  # approved, rejected, conditional
-    comments = Column(Text)
-    conditions = Column(Text)  # for conditional approval
+    decision: Mapped[Optional[str]] = mapped_column(String(50))  # approved, rejected, conditional
+    comments: Mapped[Optional[str]] = mapped_column(Text)
+    conditions: Mapped[Optional[str]] = mapped_column(Text)  # for conditional approval
     
     # Dates
-    requested_at = Column(DateTime, server_default=func.now())
-    reviewed_at = Column(DateTime)
-    due_date = Column(DateTime)
+    requested_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
+    reviewed_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    due_date: Mapped[Optional[datetime]] = mapped_column(DateTime)
     
     # Digital signature
-    signature_hash = Column(String(255))
-    signature_timestamp = Column(DateTime)
+    signature_hash: Mapped[Optional[str]] = mapped_column(String(255))
+    signature_timestamp: Mapped[Optional[datetime]] = mapped_column(DateTime)
     
     # Relationships
-    document = relationship("Document", back_populates="approvals")
+    document: Mapped["Document"] = relationship("Document", back_populates="approvals")
 
 
 class DocumentDistribution(Base):
     """Track document distribution"""
     __tablename__ = "document_distributions"
+    __table_args__ = (
+        # Distribution history per document, newest first
+        Index("ix_document_distributions_doc_sent", "document_id", "sent_at"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
-    document_id = Column(Integer, ForeignKey("documents.id"), nullable=False, index=True)
-    revision_id = Column(Integer, ForeignKey("document_revisions.id"))
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    document_id: Mapped[int] = mapped_column(Integer, ForeignKey("documents.id"), nullable=False, index=True)
+    revision_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("document_revisions.id"))
     
     # Distribution details
-    distribution_type = Column(String(50))  # email, hardcopy, system, external
-    recipient_name = Column(String(100), nullable=False)
-    recipient_email = Column(String(255))
-    recipient_company = Column(String(255))
-    recipient_role = Column(String(100))
+    distribution_type: Mapped[Optional[str]] = mapped_column(String(50))  # email, hardcopy, system, external
+    recipient_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    recipient_email: Mapped[Optional[str]] = mapped_column(String(255))
+    recipient_company: Mapped[Optional[str]] = mapped_column(String(255))
+    recipient_role: Mapped[Optional[str]] = mapped_column(String(100))
     
     # Tracking
-    sent_at = Column(DateTime, server_default=func.now())
-    sent_by = Column(String(100), nullable=False)
-    delivery_method = Column(String(50))
+    sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
+    sent_by: Mapped[str] = mapped_column(String(100), nullable=False)
+    delivery_method: Mapped[Optional[str]] = mapped_column(String(50))
     
     # Acknowledgment
-    acknowledged = Column(Boolean, default=False)
-    acknowledged_at = Column(DateTime)
-    acknowledgment_method = Column(String(50))
+    acknowledged: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    acknowledged_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    acknowledgment_method: Mapped[Optional[str]] = mapped_column(String(50))
     
     # Copy control
-    copy_number = Column(String(50))  # for controlled copies
-    is_controlled_copy = Column(Boolean, default=False)
+    copy_number: Mapped[Optional[str]] = mapped_column(String(50))  # for controlled copies
+    is_controlled_copy: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
     
     # Notes
-    notes = Column(Text)
+    notes: Mapped[Optional[str]] = mapped_column(Text)
     
     # Relationships
-    document = relationship("Document", back_populates="distributions")
+    document: Mapped["Document"] = relationship("Document", back_populates="distributions")
 
 
 class DrawingSet(Base):
     """Group related drawings into sets"""
     __tablename__ = "drawing_sets"
     
-    id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(String(20), ForeignKey("takeoff_projects.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    project_id: Mapped[str] = mapped_column(String(20), ForeignKey("takeoff_projects.id"), nullable=False, index=True)
     
-    set_name = Column(String(255), nullable=False)
-    set_number = Column(String(100), unique=True, index=True)
-    description = Column(Text)
+    set_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    set_number: Mapped[Optional[str]] = mapped_column(String(100), unique=True, index=True)
+    description: Mapped[Optional[str]] = mapped_column(Text)
     
     # Set type
-    set_type = Column(String(50))  # construction, as-built, tender, approval
-    discipline = Column(String(50))
+    set_type: Mapped[Optional[str]] = mapped_column(String(50))  # construction, as-built, tender, approval
+    discipline: Mapped[Optional[str]] = mapped_column(String(50))
     
     # Status
-    status = Column(String(50), default="active")
-    issue_date = Column(DateTime)
+    status: Mapped[Optional[str]] = mapped_column(String(50), default="active")
+    issue_date: Mapped[Optional[datetime]] = mapped_column(DateTime)
     
     # Metadata
-    created_by = Column(String(100), nullable=False)
-    created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, onupdate=func.now())
+    created_by: Mapped[str] = mapped_column(String(100), nullable=False)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, onupdate=func.now())
     
     # Relationships
-    drawings = relationship("DrawingSetItem", back_populates="drawing_set", cascade="all, delete-orphan")
+    drawings: Mapped[List["DrawingSetItem"]] = relationship("DrawingSetItem", back_populates="drawing_set", cascade="all, delete-orphan")
 
 
 class DrawingSetItem(Base):
     """Link documents to drawing sets"""
     __tablename__ = "drawing_set_items"
     
-    id = Column(Integer, primary_key=True, index=True)
-    drawing_set_id = Column(Integer, ForeignKey("drawing_sets.id"), nullable=False)
-    document_id = Column(Integer, ForeignKey("documents.id"), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    drawing_set_id: Mapped[int] = mapped_column(Integer, ForeignKey("drawing_sets.id"), nullable=False)
+    document_id: Mapped[int] = mapped_column(Integer, ForeignKey("documents.id"), nullable=False)
     
     # Order in set
-    sequence_number = Column(Integer)
-    sheet_number = Column(String(50))
+    sequence_number: Mapped[Optional[int]] = mapped_column(Integer)
+    sheet_number: Mapped[Optional[str]] = mapped_column(String(50))
     
     # Include specific revision
-    revision_id = Column(Integer, ForeignKey("document_revisions.id"))
+    revision_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("document_revisions.id"))
     
     # Notes
-    notes = Column(Text)
+    notes: Mapped[Optional[str]] = mapped_column(Text)
     
     # Relationships
-    drawing_set = relationship("DrawingSet", back_populates="drawings")
+    drawing_set: Mapped["DrawingSet"] = relationship("DrawingSet", back_populates="drawings")
 
 
 class TransmittalRecord(Base):
     """Track formal document transmittals"""
     __tablename__ = "transmittal_records"
     
-    id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(String(20), ForeignKey("takeoff_projects.id"), nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    project_id: Mapped[str] = mapped_column(String(20), ForeignKey("takeoff_projects.id"), nullable=False, index=True)
     
-    transmittal_number = Column(String(100), unique=True, index=True, nullable=False)
-    subject = Column(String(255), nullable=False)
-    description = Column(Text)
+    transmittal_number: Mapped[str] = mapped_column(String(100), unique=True, index=True, nullable=False)
+    subject: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text)
     
     # Recipients
-    to_company = Column(String(255), nullable=False)
-    to_attention = Column(String(100))
-    to_email = Column(String(255))
+    to_company: Mapped[str] = mapped_column(String(255), nullable=False)
+    to_attention: Mapped[Optional[str]] = mapped_column(String(100))
+    to_email: Mapped[Optional[str]] = mapped_column(String(255))
     
-    cc_list = Column(JSON)  # list of CC recipients
+    cc_list: Mapped[Optional[Any]] = mapped_column(JSON)  # list of CC recipients
     
     # Sender
-    from_company = Column(String(255), nullable=False)
-    from_name = Column(String(100), nullable=False)
-    from_email = Column(String(255))
+    from_company: Mapped[str] = mapped_column(String(255), nullable=False)
+    from_name: Mapped[str] = mapped_column(String(100), nullable=False)
+    from_email: Mapped[Optional[str]] = mapped_column(String(255))
     
     # Purpose
-    purpose = Column(String(100))  # for_information, for_review, for_approval, for_construction
-    response_required = Column(Boolean, default=False)
-    response_due_date = Column(DateTime)
+    purpose: Mapped[Optional[str]] = mapped_column(String(100))  # for_information, for_review, for_approval, for_construction
+    response_required: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    response_due_date: Mapped[Optional[datetime]] = mapped_column(DateTime)
     
     # Status
-    status = Column(String(50), default="sent")
-    sent_date = Column(DateTime, server_default=func.now())
+    status: Mapped[Optional[str]] = mapped_column(String(50), default="sent")
+    sent_date: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
     
     # Metadata
-    created_by = Column(String(100), nullable=False)
-    created_at = Column(DateTime, server_default=func.now())
+    created_by: Mapped[str] = mapped_column(String(100), nullable=False)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now())
     
     # Documents included
-    documents = Column(JSON)  # list of document IDs and revisions
\ No newline at end of file
+    documents: Mapped[Optional[Any]] = mapped_column(JSON)  # list of document IDs and revisions
\ No newline at end of file
@@ -2,7 +2,10 @@
 Labor Operation Model - Dynamic labor operations with rates
 """
 
-from sqlalchemy import Column, Integer, String, Numeric, Boolean, DateTime, Enum as SQLEnum
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Integer, String, Float, Boolean, DateTime, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, MappedAsDataclass, mapped_column
 from sqlalchemy.sql import func
 from app.db.base import Base
 import enum
@@ -11,15 +14,15 @@ class OperationType(str, enum.Enum):
     per_ft = "per_ft"
     per_piece = "per_piece"
 
-class LaborOperation(Base):
+class LaborOperation(MappedAsDataclass, Base, kw_only=True, eq=False):
     __tablename__ = "labor_operations"
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), unique=True, nullable=False, index=True)
-    rate = Column(Numeric(10, 4), nullable=False)  # Rate in hours or cost
-    operation_type = Column(SQLEnum(OperationType), nullable=False)
-    description = Column(String(255), nullable=True)
-    unit_display = Column(String(50), nullable=False)  # e.g., "per linear foot", "per piece"
-    active = Column(Boolean, default=True, nullable=False)
-    created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
\ No newline at end of file
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, init=False)
+    name: Mapped[str] = mapped_column(String(100), unique=True, index=True)
+    rate: Mapped[float] = mapped_column(Float)  # Rate in hours or cost
+    operation_type: Mapped[OperationType] = mapped_column(SQLEnum(OperationType))
+    description: Mapped[Optional[str]] = mapped_column(String(255), default=None)
+    unit_display: Mapped[str] = mapped_column(String(50))  # e.g., "per linear foot", "per piece"
+    active: Mapped[bool] = mapped_column(Boolean, default=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), init=False)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now(), init=False)
\ No newline at end of file
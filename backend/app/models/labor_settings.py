@@ -2,16 +2,19 @@
 Labor Settings Model - Base labor rate, markup, and handling settings
 """
 
-from sqlalchemy import Column, Integer, String, Numeric, DateTime
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Integer, String, Float, DateTime
+from sqlalchemy.orm import Mapped, MappedAsDataclass, mapped_column
 from sqlalchemy.sql import func
 from app.db.base import Base
 
-class LaborSettings(Base):
+class LaborSettings(MappedAsDataclass, Base, kw_only=True, eq=False):
     __tablename__ = "labor_settings"
 
-    id = Column(Integer, primary_key=True, index=True)
-    setting_key = Column(String(50), unique=True, nullable=False, index=True)
-    setting_value = Column(Numeric(10, 4), nullable=False)
-    description = Column(String(255), nullable=True)
-    unit = Column(String(20), nullable=True)  # e.g., "per hour", "percentage"
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
\ No newline at end of file
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, init=False)
+    setting_key: Mapped[str] = mapped_column(String(50), unique=True, index=True)
+    setting_value: Mapped[float] = mapped_column(Float)
+    description: Mapped[Optional[str]] = mapped_column(String(255), default=None)
+    unit: Mapped[Optional[str]] = mapped_column(String(20), default=None)  # e.g., "per hour", "percentage"
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime, server_default=func.now(), onupdate=func.now(), init=False)
\ No newline at end of file
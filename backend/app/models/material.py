@@ -1,52 +1,74 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Integer, String, Float, Boolean, DateTime, Text, Index, DDL, event, literal_column
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapped, MappedAsDataclass, mapped_column
 from sqlalchemy.sql import func
 from app.core.database import Base
 
-class Material(Base):
+class Material(MappedAsDataclass, Base, kw_only=True, eq=False):
     __tablename__ = "materials"
+    __table_args__ = (
+        # Material picker: category/subcategory drill-down, common items first
+        Index("ix_mat_cat_sub_common", "category", "subcategory", "commonly_used"),
+        Index("ix_mat_source_active", "source_system", "category"),
+        Index("ix_mat_shape_cat", "shape_key", "category"),
+        # Fitting/pipe lookups filter on subcategory and order by price
+        Index("ix_mat_sub_price", "subcategory", "base_price_usd"),
+        # Substring search (ILIKE '%q%') can't use a B-tree; trigram GIN
+        # indexes serve it on PostgreSQL
+        Index(
+            "ix_material_shape_key_trgm", "shape_key",
+            postgresql_using="gin", postgresql_ops={"shape_key": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_material_type_trgm", "material_type",
+            postgresql_using="gin", postgresql_ops={"material_type": "gin_trgm_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
-    shape_key = Column(String(50), unique=True, index=True, nullable=False)
-    description = Column(String(300))
-    category = Column(String(50), index=True)  # Wide Flange, Plate, Angle, etc.
-    material_type = Column(String(50))  # Steel, Aluminum, etc.
-    grade = Column(String(20))  # A36, A992, etc.
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True, init=False)
+    shape_key: Mapped[str] = mapped_column(String(50), unique=True, index=True)
+    description: Mapped[Optional[str]] = mapped_column(String(300), default=None)
+    category: Mapped[Optional[str]] = mapped_column(String(50), index=True, default=None)  # Wide Flange, Plate, Angle, etc.
+    material_type: Mapped[Optional[str]] = mapped_column(String(50), default=None)  # Steel, Aluminum, etc.
+    grade: Mapped[Optional[str]] = mapped_column(String(20), default=None)  # A36, A992, etc.
     
     # Physical properties
-    weight_per_ft = Column(Float)  # Legacy structural steel weight per foot
-    depth_inches = Column(Float)
-    width_inches = Column(Float) 
-    thickness_inches = Column(Float)
+    weight_per_ft: Mapped[Optional[float]] = mapped_column(Float, default=None)  # Legacy structural steel weight per foot
+    depth_inches: Mapped[Optional[float]] = mapped_column(Float, default=None)
+    width_inches: Mapped[Optional[float]] = mapped_column(Float, default=None)
+    thickness_inches: Mapped[Optional[float]] = mapped_column(Float, default=None)
     
     # Pricing (backwards compatible)
-    unit_price_per_cwt = Column(Float)  # Legacy price per 100 lbs (CWT)
-    supplier = Column(String(100))
+    unit_price_per_cwt: Mapped[Optional[float]] = mapped_column(Float, default=None)  # Legacy price per 100 lbs (CWT)
+    supplier: Mapped[Optional[str]] = mapped_column(String(100), default=None)
     
     # Usage tracking
-    commonly_used = Column(Boolean, default=False, index=True)
-    last_used_date = Column(DateTime(timezone=True))
-    usage_count = Column(Integer, default=0)
+    commonly_used: Mapped[Optional[bool]] = mapped_column(Boolean, default=False, index=True)
+    last_used_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=None)
+    usage_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
     
     # Blake's comprehensive material fields (all nullable for backwards compatibility)
-    subcategory = Column(String(50), index=True)  # Fitting, Pipe, Valve, Component, Flange
-    specs_standard = Column(String(100), index=True)  # ASTM 316L, A106B, API 5L, etc.
-    base_price_usd = Column(Float)  # Blake's comprehensive pricing
-    size_dimensions = Column(String(200))  # Size/dimensions from Blake's data
-    schedule_class = Column(String(50))  # Schedule/Class for pipes and fittings
-    finish_coating = Column(String(100))  # Mill, Galvanized, Painted, etc.
-    weight_per_uom = Column(Float)  # Weight per unit of measure (Blake's data)
-    unit_of_measure = Column(String(20), default="ft")  # each, ft, lb, sq ft, etc.
-    source_system = Column(String(20), default="legacy", index=True)  # Track data origin
-    sku_part_number = Column(String(100))  # SKU/Part number
-    notes = Column(Text)  # Additional notes
-    price_confidence = Column(String(20), default="high")  # high, medium, low
-    last_price_update = Column(DateTime(timezone=True))
+    subcategory: Mapped[Optional[str]] = mapped_column(String(50), index=True, default=None)  # Fitting, Pipe, Valve, Component, Flange
+    specs_standard: Mapped[Optional[str]] = mapped_column(String(100), index=True, default=None)  # ASTM 316L, A106B, API 5L, etc.
+    base_price_usd: Mapped[Optional[float]] = mapped_column(Float, default=None)  # Blake's comprehensive pricing
+    size_dimensions: Mapped[Optional[str]] = mapped_column(String(200), default=None)  # Size/dimensions from Blake's data
+    schedule_class: Mapped[Optional[str]] = mapped_column(String(50), default=None)  # Schedule/Class for pipes and fittings
+    finish_coating: Mapped[Optional[str]] = mapped_column(String(100), default=None)  # Mill, Galvanized, Painted, etc.
+    weight_per_uom: Mapped[Optional[float]] = mapped_column(Float, default=None)  # Weight per unit of measure (Blake's data)
+    unit_of_measure: Mapped[Optional[str]] = mapped_column(String(20), default="ft")  # each, ft, lb, sq ft, etc.
+    source_system: Mapped[Optional[str]] = mapped_column(String(20), default="legacy", index=True)  # Track data origin
+    sku_part_number: Mapped[Optional[str]] = mapped_column(String(100), default=None)  # SKU/Part number
+    notes: Mapped[Optional[str]] = mapped_column(Text, default=None)  # Additional notes
+    price_confidence: Mapped[Optional[str]] = mapped_column(String(20), default="high")  # high, medium, low
+    last_price_update: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), default=None)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now(), init=False)
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now(), init=False)
     
-    @property 
+    @hybrid_property
     def effective_price(self):
         """Get the most appropriate price for this material"""
         # Use Blake's pricing if available, otherwise fall back to CWT pricing
@@ -57,12 +79,29 @@ class Material(Base):
             return (self.unit_price_per_cwt / 100.0) * self.weight_per_ft
         return None
     
-    @property
+    @effective_price.inplace.expression
+    @classmethod
+    def _effective_price_expression(cls):
+        """SQL form of effective_price so queries can filter/order on it"""
+        # Literal constants keep the rendered SQL identical to the expression
+        # index below, so the planner can match it
+        return func.coalesce(
+            func.nullif(cls.base_price_usd, literal_column("0")),
+            cls.unit_price_per_cwt * literal_column("0.01") * cls.weight_per_ft
+        )
+    
+    @hybrid_property
     def effective_weight(self):
         """Get the most appropriate weight for this material"""
         # Use Blake's weight data if available, otherwise structural weight
         return self.weight_per_uom if self.weight_per_uom else self.weight_per_ft
     
+    @effective_weight.inplace.expression
+    @classmethod
+    def _effective_weight_expression(cls):
+        """SQL form of effective_weight"""
+        return func.coalesce(func.nullif(cls.weight_per_uom, literal_column("0")), cls.weight_per_ft)
+    
     @property
     def full_designation(self):
         """Get comprehensive material designation"""
@@ -80,4 +119,13 @@ class Material(Base):
     def __repr__(self):
         price = self.effective_price
         price_str = f"${price:.2f}" if price else "No price"
-        return f"<Material({self.shape_key}, {self.category_display}, {price_str})>"
\ No newline at end of file
+        return f"<Material({self.shape_key}, {self.category_display}, {price_str})>"
+
+# Expression index for ORDER BY / range filters on Material.effective_price
+Index("ix_materials_effective_price", Material.effective_price)
+
+# gin_trgm_ops comes from the pg_trgm extension
+event.listen(
+    Material.__table__, "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
@@ -3,210 +3,293 @@ Capitol Engineering Company - Nesting & Material Optimization Models
 Database models for storing nesting optimization results and material data
 """
 
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, Text, JSON, ForeignKey, Numeric
+from datetime import datetime
+from typing import Any, List, Optional
+from sqlalchemy import Integer, BigInteger, String, Float, Boolean, DateTime, Text, ForeignKey, Index, Enum, text
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
-from app.core.database import Base
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from app.core.database import Base, JSONType, MsgpackType
+
+def _dollars(cents_attr):
+    """Dollar view over an integer-cents money column. Reads and writes in
+    dollars for existing callers; SQL aggregates should use the cents column."""
+    def fget(self):
+        cents = getattr(self, cents_attr)
+        return None if cents is None else cents / 100
+    
+    def fset(self, value):
+        setattr(self, cents_attr, None if value is None else round(value * 100))
+    
+    def expr(cls):
+        return getattr(cls, cents_attr) / 100.0
+    
+    return hybrid_property(fget, fset, expr=expr)
+
+# Low-cardinality status columns: native ENUM types on PostgreSQL (4-byte
+# compares, narrower rows and indexes), VARCHAR on SQLite
+SizeAvailability = Enum("standard", "special_order", "unavailable", name="size_availability")
+OptimizationStatus = Enum("pending", "running", "completed", "failed", name="nopt_status")
+PurchasePriority = Enum("critical", "high", "normal", "low", name="purchase_priority")
+PurchaseStatus = Enum("recommended", "ordered", "delivered", name="purchase_status")
+CuttingComplexity = Enum("simple", "moderate", "complex", name="cutting_complexity")
 
 class StandardMaterialSize(Base):
     """Standard material sizes available from suppliers"""
     __tablename__ = "standard_material_sizes"
     
-    id = Column(Integer, primary_key=True, index=True)
-    material_type = Column(String(50), nullable=False, index=True)  # PLATE, BEAM, ANGLE, etc.
-    shape_category = Column(String(50), index=True)  # W-shapes, L-shapes, Plates, etc.
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    material_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)  # PLATE, BEAM, ANGLE, etc.
+    shape_category: Mapped[Optional[str]] = mapped_column(String(50), index=True)  # W-shapes, L-shapes, Plates, etc.
     
     # Dimensions
-    length_ft = Column(Float)
-    width_in = Column(Float)  # For plates
-    height_in = Column(Float)  # For beams/channels
-    thickness_in = Column(Float)  # For plates, web thickness for beams
+    length_ft: Mapped[Optional[float]] = mapped_column(Float)
+    width_in: Mapped[Optional[float]] = mapped_column(Float)  # For plates
+    height_in: Mapped[Optional[float]] = mapped_column(Float)  # For beams/channels
+    thickness_in: Mapped[Optional[float]] = mapped_column(Float)  # For plates, web thickness for beams
     
     # Pricing
-    cost_per_unit = Column(Numeric(10, 2))  # Cost per piece
-    cost_per_foot = Column(Numeric(10, 2))  # Cost per foot (for linear materials)
-    cost_per_sqft = Column(Numeric(10, 2))  # Cost per square foot (for plates)
+    cost_per_unit_cents: Mapped[Optional[int]] = mapped_column(Integer)  # Cost per piece
+    cost_per_unit = _dollars("cost_per_unit_cents")
+    cost_per_foot_cents: Mapped[Optional[int]] = mapped_column(Integer)  # Cost per foot (for linear materials)
+    cost_per_foot = _dollars("cost_per_foot_cents")
+    cost_per_sqft_cents: Mapped[Optional[int]] = mapped_column(Integer)  # Cost per square foot (for plates)
+    cost_per_sqft = _dollars("cost_per_sqft_cents")
     
     # Supplier information
-    supplier_name = Column(String(100), index=True)
-    supplier_code = Column(String(50))
-    availability = Column(String(20), default="standard")  # standard, special_order, unavailable
-    lead_time_days = Column(Integer, default=0)
+    supplier_name: Mapped[Optional[str]] = mapped_column(String(100), index=True)
+    supplier_code: Mapped[Optional[str]] = mapped_column(String(50))
+    availability: Mapped[Optional[str]] = mapped_column(SizeAvailability, default="standard")
+    lead_time_days: Mapped[Optional[int]] = mapped_column(Integer, default=0)
     
     # Usage tracking
-    commonly_used = Column(Boolean, default=False, index=True)
-    last_used_date = Column(DateTime(timezone=True))
-    usage_count = Column(Integer, default=0)
+    commonly_used: Mapped[Optional[bool]] = mapped_column(Boolean, default=False, index=True)
+    last_used_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    usage_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
 
 class NestingOptimization(Base):
     """Stores nesting optimization results for projects"""
     __tablename__ = "nesting_optimizations"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(String(50), ForeignKey("takeoff_projects.id"), nullable=False, index=True)
-    optimization_name = Column(String(200))  # User-friendly name for the optimization
+    __table_args__ = (
+        # Only the current, completed optimization per project is read hot;
+        # the partial index skips superseded and failed runs
+        Index(
+            "ix_nopt_active", "project_id",
+            postgresql_where=text("is_active AND status = 'completed'"),
+            sqlite_where=text("is_active AND status = 'completed'")
+        ),
+    )
+    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    project_id: Mapped[str] = mapped_column(String(50), ForeignKey("takeoff_projects.id"), nullable=False, index=True)
+    optimization_name: Mapped[Optional[str]] = mapped_column(String(200))  # User-friendly name for the optimization
     
     # Optimization parameters
-    optimization_level = Column(String(20), default="standard")  # basic, standard, advanced
-    include_waste_costs = Column(Boolean, default=True)
-    algorithm_version = Column(String(20), default="1.0")
+    optimization_level: Mapped[Optional[str]] = mapped_column(String(20), default="standard")  # basic, standard, advanced
+    include_waste_costs: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
+    algorithm_version: Mapped[Optional[str]] = mapped_column(String(20), default="1.0")
     
     # Results summary
-    total_material_cost = Column(Numeric(12, 2))
-    total_waste_cost = Column(Numeric(12, 2))
-    total_waste_percentage = Column(Float)
-    cost_savings = Column(Numeric(12, 2))  # Savings vs non-optimized
-    efficiency_rating = Column(Float)  # 0-100 score
+    total_material_cost_cents: Mapped[Optional[int]] = mapped_column(BigInteger)
+    total_material_cost = _dollars("total_material_cost_cents")
+    total_waste_cost_cents: Mapped[Optional[int]] = mapped_column(BigInteger)
+    total_waste_cost = _dollars("total_waste_cost_cents")
+    total_waste_percentage: Mapped[Optional[float]] = mapped_column(Float)
+    cost_savings_cents: Mapped[Optional[int]] = mapped_column(BigInteger)  # Savings vs non-optimized
+    cost_savings = _dollars("cost_savings_cents")
+    efficiency_rating: Mapped[Optional[float]] = mapped_column(Float)  # 0-100 score
     
     # Optimization metadata
-    optimization_summary = Column(Text)
-    recommendations = Column(JSON)  # List of recommendations
-    algorithm_details = Column(JSON)  # Technical details about algorithm used
+    optimization_summary: Mapped[Optional[str]] = mapped_column(Text)
+    recommendations: Mapped[Optional[Any]] = mapped_column(JSONType)  # List of recommendations
+    algorithm_details: Mapped[Optional[Any]] = mapped_column(JSONType)  # Technical details about algorithm used
     
     # Status
-    status = Column(String(20), default="completed")  # pending, running, completed, failed
-    is_active = Column(Boolean, default=True)  # Current active optimization for project
+    status: Mapped[Optional[str]] = mapped_column(OptimizationStatus, default="completed")
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)  # Current active optimization for project
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    completed_at = Column(DateTime(timezone=True))
-    
-    # Relationships
-    project = relationship("TakeoffProject")
-    material_purchases = relationship("MaterialPurchaseRecommendation", back_populates="optimization")
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    
+    # Relationships. Child collections load with one "WHERE optimization_id IN (...)"
+    # query per batch of optimizations instead of one query per optimization.
+    project: Mapped["TakeoffProject"] = relationship("TakeoffProject")
+    material_purchases: Mapped[List["MaterialPurchaseRecommendation"]] = relationship("MaterialPurchaseRecommendation", back_populates="optimization", lazy="selectin")
+    waste_analyses: Mapped[List["MaterialWasteAnalysis"]] = relationship("MaterialWasteAnalysis", back_populates="optimization", lazy="selectin")
 
 class MaterialPurchaseRecommendation(Base):
     """Individual material purchase recommendations from nesting optimization"""
     __tablename__ = "material_purchase_recommendations"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    optimization_id = Column(Integer, ForeignKey("nesting_optimizations.id"), nullable=False, index=True)
+    __table_args__ = (
+        # Recommendations for an optimization ordered by priority; the INCLUDE
+        # columns let the summary select run as an index-only scan
+        Index(
+            "ix_mpr_opt_priority", "optimization_id", "priority", "purchase_status",
+            postgresql_include=("total_cost_cents", "waste_percentage")
+        ),
+        Index("ix_mpr_shape", "shape_key", "material_type"),
+        # Open recommendations only; ordered/delivered rows are cold
+        Index(
+            "ix_mpr_recommended", "optimization_id", "priority",
+            postgresql_where=text("purchase_status = 'recommended'"),
+            sqlite_where=text("purchase_status = 'recommended'")
+        ),
+    )
+    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    optimization_id: Mapped[int] = mapped_column(Integer, ForeignKey("nesting_optimizations.id"), nullable=False)
     
     # Material identification
-    shape_key = Column(String(50), nullable=False, index=True)
-    size_description = Column(String(200))  # Human-readable size description
-    material_type = Column(String(50), index=True)
+    shape_key: Mapped[str] = mapped_column(String(50), nullable=False)
+    size_description: Mapped[Optional[str]] = mapped_column(String(200))  # Human-readable size description
+    material_type: Mapped[Optional[str]] = mapped_column(String(50), index=True)
     
     # Standard size used
-    standard_size_id = Column(Integer, ForeignKey("standard_material_sizes.id"))
-    standard_length_ft = Column(Float)
-    standard_width_in = Column(Float)
-    standard_thickness_in = Column(Float)
+    standard_size_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("standard_material_sizes.id"))
+    standard_length_ft: Mapped[Optional[float]] = mapped_column(Float)
+    standard_width_in: Mapped[Optional[float]] = mapped_column(Float)
+    standard_thickness_in: Mapped[Optional[float]] = mapped_column(Float)
     
     # Purchase details
-    pieces_needed = Column(Integer, nullable=False)
-    total_cost = Column(Numeric(10, 2))
-    unit_cost = Column(Numeric(10, 2))
+    pieces_needed: Mapped[int] = mapped_column(Integer, nullable=False)
+    total_cost_cents: Mapped[Optional[int]] = mapped_column(Integer)
+    total_cost = _dollars("total_cost_cents")
+    unit_cost_cents: Mapped[Optional[int]] = mapped_column(Integer)
+    unit_cost = _dollars("unit_cost_cents")
     
     # Waste analysis
-    waste_percentage = Column(Float)
-    waste_cost = Column(Numeric(10, 2))
-    utilization_percentage = Column(Float)  # 100 - waste_percentage
+    waste_percentage: Mapped[Optional[float]] = mapped_column(Float)
+    waste_cost_cents: Mapped[Optional[int]] = mapped_column(Integer)
+    waste_cost = _dollars("waste_cost_cents")
+    utilization_percentage: Mapped[Optional[float]] = mapped_column(Float)  # 100 - waste_percentage
     
     # Cutting details
-    cuts_data = Column(JSON)  # List of cuts that will be made from this material
-    cuts_count = Column(Integer)
+    cuts_data: Mapped[Optional[Any]] = mapped_column(MsgpackType)  # List of cuts that will be made from this material
+    cuts_count: Mapped[Optional[int]] = mapped_column(Integer)
     
     # Supplier information
-    preferred_supplier = Column(String(100))
-    supplier_quote = Column(Numeric(10, 2))
-    delivery_date = Column(DateTime(timezone=True))
+    preferred_supplier: Mapped[Optional[str]] = mapped_column(String(100))
+    supplier_quote_cents: Mapped[Optional[int]] = mapped_column(Integer)
+    supplier_quote = _dollars("supplier_quote_cents")
+    delivery_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     
     # Priority and status
-    priority = Column(String(20), default="normal")  # critical, high, normal, low
-    purchase_status = Column(String(20), default="recommended")  # recommended, ordered, delivered
+    priority: Mapped[Optional[str]] = mapped_column(PurchasePriority, default="normal")
+    purchase_status: Mapped[Optional[str]] = mapped_column(PurchaseStatus, default="recommended")
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
-    optimization = relationship("NestingOptimization", back_populates="material_purchases")
-    standard_size = relationship("StandardMaterialSize")
+    optimization: Mapped["NestingOptimization"] = relationship("NestingOptimization", back_populates="material_purchases")
+    standard_size: Mapped["StandardMaterialSize"] = relationship("StandardMaterialSize", lazy="selectin")
 
 class MaterialWasteAnalysis(Base):
     """Detailed waste analysis for materials and cutting patterns"""
     __tablename__ = "material_waste_analysis"
+    __table_args__ = (
+        Index("ix_waste_proj_opt", "project_id", "optimization_id"),
+        Index("ix_waste_drops_gin", "drops_data", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(String(50), ForeignKey("takeoff_projects.id"), nullable=False, index=True)
-    optimization_id = Column(Integer, ForeignKey("nesting_optimizations.id"), index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    project_id: Mapped[str] = mapped_column(String(50), ForeignKey("takeoff_projects.id"), nullable=False)
+    optimization_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("nesting_optimizations.id"), index=True)
     
     # Material details
-    shape_key = Column(String(50), nullable=False, index=True)
-    material_type = Column(String(50), index=True)
+    shape_key: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    material_type: Mapped[Optional[str]] = mapped_column(String(50), index=True)
     
     # Waste calculations
-    material_required_area = Column(Float)  # Total area needed (for plates)
-    material_required_length = Column(Float)  # Total length needed (for linear materials)
-    material_purchased_area = Column(Float)  # Total area purchased
-    material_purchased_length = Column(Float)  # Total length purchased
+    material_required_area: Mapped[Optional[float]] = mapped_column(Float)  # Total area needed (for plates)
+    material_required_length: Mapped[Optional[float]] = mapped_column(Float)  # Total length needed (for linear materials)
+    material_purchased_area: Mapped[Optional[float]] = mapped_column(Float)  # Total area purchased
+    material_purchased_length: Mapped[Optional[float]] = mapped_column(Float)  # Total length purchased
     
-    waste_area = Column(Float)
-    waste_length = Column(Float)
-    waste_percentage = Column(Float)
-    waste_cost = Column(Numeric(10, 2))
+    waste_area: Mapped[Optional[float]] = mapped_column(Float)
+    waste_length: Mapped[Optional[float]] = mapped_column(Float)
+    waste_percentage: Mapped[Optional[float]] = mapped_column(Float)
+    waste_cost_cents: Mapped[Optional[int]] = mapped_column(Integer)
+    waste_cost = _dollars("waste_cost_cents")
     
     # Drop analysis
-    drops_data = Column(JSON)  # List of drop pieces with dimensions
-    usable_drops_count = Column(Integer, default=0)
-    usable_drops_value = Column(Numeric(10, 2), default=0)
-    scrap_weight_lbs = Column(Float)
-    scrap_value = Column(Numeric(10, 2))
+    drops_data: Mapped[Optional[Any]] = mapped_column(JSONType)  # List of drop pieces with dimensions
+    usable_drops_count: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    usable_drops_value_cents: Mapped[Optional[int]] = mapped_column(Integer, default=0)
+    usable_drops_value = _dollars("usable_drops_value_cents")
+    scrap_weight_lbs: Mapped[Optional[float]] = mapped_column(Float)
+    scrap_value_cents: Mapped[Optional[int]] = mapped_column(Integer)
+    scrap_value = _dollars("scrap_value_cents")
     
     # Optimization opportunities
-    alternative_sizes_considered = Column(JSON)
-    optimization_suggestions = Column(JSON)
-    potential_savings = Column(Numeric(10, 2))
+    alternative_sizes_considered: Mapped[Optional[Any]] = mapped_column(JSONType)
+    optimization_suggestions: Mapped[Optional[Any]] = mapped_column(JSONType)
+    potential_savings_cents: Mapped[Optional[int]] = mapped_column(Integer)
+    potential_savings = _dollars("potential_savings_cents")
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Relationships
+    optimization: Mapped["NestingOptimization"] = relationship("NestingOptimization", back_populates="waste_analyses")
 
 class NestingPattern(Base):
     """Stores actual nesting patterns and cutting layouts"""
     __tablename__ = "nesting_patterns"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    optimization_id = Column(Integer, ForeignKey("nesting_optimizations.id"), nullable=False, index=True)
-    purchase_recommendation_id = Column(Integer, ForeignKey("material_purchase_recommendations.id"), index=True)
+    __table_args__ = (
+        Index("ix_pattern_opt_piece", "optimization_id", "material_piece_number"),
+        Index("ix_pattern_cuts_gin", "cuts_list", postgresql_using="gin").ddl_if(dialect="postgresql"),
+        # Patterns still waiting to be cut
+        Index(
+            "ix_pattern_pending", "optimization_id",
+            postgresql_where=text("NOT cutting_completed"),
+            sqlite_where=text("NOT cutting_completed")
+        ),
+    )
+    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    optimization_id: Mapped[int] = mapped_column(Integer, ForeignKey("nesting_optimizations.id"), nullable=False)
+    purchase_recommendation_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("material_purchase_recommendations.id"), index=True)
     
     # Pattern identification
-    pattern_name = Column(String(100))
-    material_piece_number = Column(Integer)  # Which piece of material this pattern is for
+    pattern_name: Mapped[Optional[str]] = mapped_column(String(100))
+    material_piece_number: Mapped[Optional[int]] = mapped_column(Integer)  # Which piece of material this pattern is for
     
     # Material dimensions
-    material_length_ft = Column(Float)
-    material_width_in = Column(Float)
-    material_thickness_in = Column(Float)
+    material_length_ft: Mapped[Optional[float]] = mapped_column(Float)
+    material_width_in: Mapped[Optional[float]] = mapped_column(Float)
+    material_thickness_in: Mapped[Optional[float]] = mapped_column(Float)
     
     # Cutting pattern data
-    cutting_pattern = Column(JSON)  # Detailed layout with coordinates
-    cuts_list = Column(JSON)  # List of cuts with dimensions and positions
+    cutting_pattern: Mapped[Optional[Any]] = mapped_column(MsgpackType)  # Detailed layout with coordinates
+    cuts_list: Mapped[Optional[Any]] = mapped_column(JSONType)  # List of cuts with dimensions and positions
     
     # Pattern efficiency
-    utilization_percentage = Column(Float)
-    waste_pieces = Column(JSON)  # Waste pieces with dimensions
+    utilization_percentage: Mapped[Optional[float]] = mapped_column(Float)
+    waste_pieces: Mapped[Optional[Any]] = mapped_column(MsgpackType)  # Waste pieces with dimensions
     
     # Production information
-    cutting_time_minutes = Column(Float)
-    cutting_complexity = Column(String(20))  # simple, moderate, complex
-    special_requirements = Column(Text)  # Notes for production
+    cutting_time_minutes: Mapped[Optional[float]] = mapped_column(Float)
+    cutting_complexity: Mapped[Optional[str]] = mapped_column(CuttingComplexity)
+    special_requirements: Mapped[Optional[str]] = mapped_column(Text)  # Notes for production
     
     # Status
-    approved = Column(Boolean, default=False)
-    production_ready = Column(Boolean, default=False)
-    cutting_completed = Column(Boolean, default=False)
+    approved: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    production_ready: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    cutting_completed: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    approved_at = Column(DateTime(timezone=True))
-    completed_at = Column(DateTime(timezone=True))
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    approved_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     
     # Relationships
-    optimization = relationship("NestingOptimization")
-    purchase_recommendation = relationship("MaterialPurchaseRecommendation")
\ No newline at end of file
+    optimization: Mapped["NestingOptimization"] = relationship("NestingOptimization")
+    purchase_recommendation: Mapped["MaterialPurchaseRecommendation"] = relationship("MaterialPurchaseRecommendation")
\ No newline at end of file
@@ -1,21 +1,23 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import List, Optional
+from sqlalchemy import Integer, String, DateTime, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
 
 class Project(Base):
     __tablename__ = "projects"
     
-    id = Column(Integer, primary_key=True, index=True)
-    org_id = Column(Integer, default=1, index=True)  # Multi-tenant support
-    name = Column(String, nullable=False)
-    customer = Column(String)
-    quote_number = Column(String, index=True)
-    estimator = Column(String)
-    status = Column(String, default="draft")  # draft, active, completed
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    project_data = Column(Text)  # JSON data for additional project info
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    org_id: Mapped[Optional[int]] = mapped_column(Integer, default=1, index=True)  # Multi-tenant support
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    customer: Mapped[Optional[str]] = mapped_column(String)
+    quote_number: Mapped[Optional[str]] = mapped_column(String, index=True)
+    estimator: Mapped[Optional[str]] = mapped_column(String)
+    status: Mapped[Optional[str]] = mapped_column(String, default="draft")  # draft, active, completed
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    project_data: Mapped[Optional[str]] = mapped_column(Text)  # JSON data for additional project info
     
     # Relationships
-    takeoff_items = relationship("TakeoffItem", back_populates="project")
\ No newline at end of file
+    takeoff_items: Mapped[List["TakeoffItem"]] = relationship("TakeoffItem", back_populates="project")
\ No newline at end of file
@@ -3,109 +3,165 @@ Capitol Engineering Company - Takeoff Database Models
 SQLAlchemy models for takeoff entries and projects
 """
 
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Boolean, Text, JSON
-from sqlalchemy.orm import relationship
+from datetime import datetime
+from typing import Any, List, Optional
+from sqlalchemy import (
+    Integer, BigInteger, String, Float, ForeignKey, DateTime, Boolean, Text, Index,
+    text, event, inspect, select, update, cast
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship, Session
 from sqlalchemy.sql import func
-from app.core.database import Base
+from app.core.database import Base, JSONType
 
 class TakeoffProject(Base):
     __tablename__ = "takeoff_projects"
     
-    id = Column(String(20), primary_key=True, index=True)
-    name = Column(String(255), nullable=False)
-    description = Column(Text)
-    client_name = Column(String(255))
-    quote_number = Column(String(100))
-    estimator = Column(String(255))
-    project_location = Column(String(255))
-    project_date = Column(DateTime)
-    project_number = Column(String(100))
+    id: Mapped[str] = mapped_column(String(20), primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    client_name: Mapped[Optional[str]] = mapped_column(String(255))
+    quote_number: Mapped[Optional[str]] = mapped_column(String(100))
+    estimator: Mapped[Optional[str]] = mapped_column(String(255))
+    project_location: Mapped[Optional[str]] = mapped_column(String(255))
+    project_date: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    project_number: Mapped[Optional[str]] = mapped_column(String(100))
     
     # Project settings
-    labor_mode = Column(String(20), default="auto")  # auto or manual
-    default_labor_rate = Column(Float, default=120.0)
-    project_metadata = Column(JSON, default=dict)  # For storing nesting results and other project metadata
+    labor_mode: Mapped[Optional[str]] = mapped_column(String(20), default="auto")  # auto or manual
+    default_labor_rate: Mapped[Optional[float]] = mapped_column(Float, default=120.0)
+    project_metadata: Mapped[Optional[Any]] = mapped_column(JSONType, server_default=text("'{}'"))  # For storing nesting results and other project metadata
+    
+    # Entry aggregates, kept current by refresh_project_totals() so project
+    # lists don't SUM over takeoff_entries on every read
+    cached_entries_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default=text("0"))
+    cached_total_price_cents: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default=text("0"))
+    cached_total_weight_tons: Mapped[float] = mapped_column(Float, nullable=False, default=0.0, server_default=text("0"))
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
     
     # Status
-    is_active = Column(Boolean, default=True)
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
     
     # Relationships
-    entries = relationship("TakeoffEntry", back_populates="project", cascade="all, delete-orphan")
+    entries: Mapped[List["TakeoffEntry"]] = relationship("TakeoffEntry", back_populates="project", cascade="all, delete-orphan")
 
 class TakeoffEntry(Base):
     __tablename__ = "takeoff_entries"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(String(20), ForeignKey("takeoff_projects.id", ondelete="CASCADE"), nullable=False)
+    __table_args__ = (
+        # Per-project entry scans; the INCLUDE columns make the totals
+        # recompute an index-only scan on PostgreSQL
+        Index(
+            "ix_entry_project_shape", "project_id", "shape_key",
+            postgresql_include=("total_price", "total_weight_tons")
+        ),
+    )
+    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    # active_history keeps the previous project in the attribute history even
+    # when the row was expired, so a move refreshes both projects' totals
+    project_id: Mapped[str] = mapped_column(String(20), ForeignKey("takeoff_projects.id", ondelete="CASCADE"), nullable=False, active_history=True)
     
     # Core takeoff data (11-column structure)
-    qty = Column(Integer, nullable=False, default=1)
-    shape_key = Column(String(50), nullable=False, index=True)
-    description = Column(String(300))
-    length_ft = Column(Float, nullable=False, default=0.0)
-    width_ft = Column(Float, default=0.0)  # For plates and area calculations
+    qty: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    shape_key: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    description: Mapped[Optional[str]] = mapped_column(String(300))
+    length_ft: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    width_ft: Mapped[Optional[float]] = mapped_column(Float, default=0.0)  # For plates and area calculations
     
     # Material properties
-    weight_per_ft = Column(Float, default=0.0)
-    unit_price_per_cwt = Column(Float, default=0.0)
+    weight_per_ft: Mapped[Optional[float]] = mapped_column(Float, default=0.0)
+    unit_price_per_cwt: Mapped[Optional[float]] = mapped_column(Float, default=0.0)
     
     # Calculated values
-    total_length_ft = Column(Float, default=0.0)
-    total_weight_lbs = Column(Float, default=0.0)
-    total_weight_tons = Column(Float, default=0.0)
-    total_price = Column(Float, default=0.0)
+    total_length_ft: Mapped[Optional[float]] = mapped_column(Float, default=0.0)
+    total_weight_lbs: Mapped[Optional[float]] = mapped_column(Float, default=0.0)
+    total_weight_tons: Mapped[Optional[float]] = mapped_column(Float, default=0.0)
+    total_price: Mapped[Optional[float]] = mapped_column(Float, default=0.0)
     
     # Labor information
-    labor_mode = Column(String(20), default="auto")  # auto, manual, or custom
-    labor_hours = Column(Float, default=0.0)
-    labor_rate = Column(Float, default=75.0)  # $/hour
-    labor_cost = Column(Float, default=0.0)
-    labor_type = Column(String(50))  # For custom labor types like "Stairs", "Handrail"
-    labor_multiplier = Column(Float, default=1.0)  # Custom multiplier (e.g., 1.25 for stairs)
+    labor_mode: Mapped[Optional[str]] = mapped_column(String(20), default="auto")  # auto, manual, or custom
+    labor_hours: Mapped[Optional[float]] = mapped_column(Float, default=0.0)
+    labor_rate: Mapped[Optional[float]] = mapped_column(Float, default=75.0)  # $/hour
+    labor_cost: Mapped[Optional[float]] = mapped_column(Float, default=0.0)
+    labor_type: Mapped[Optional[str]] = mapped_column(String(50))  # For custom labor types like "Stairs", "Handrail"
+    labor_multiplier: Mapped[Optional[float]] = mapped_column(Float, default=1.0)  # Custom multiplier (e.g., 1.25 for stairs)
     
     # Labor operations and coatings
-    operations = Column(JSON, default=list)  # Selected labor operations (checkboxes)
-    coatings_selected = Column(JSON, default=list)  # Selected coating systems (checkboxes)  
-    primary_coating = Column(String(50))  # Primary coating system
-    coating_cost = Column(Float, default=0.0)  # Calculated coating cost
-    thickness_in = Column(Float, default=0.0)  # For plates - thickness in inches
+    operations: Mapped[Optional[Any]] = mapped_column(JSONType, server_default=text("'[]'"))  # Selected labor operations (checkboxes)
+    coatings_selected: Mapped[Optional[Any]] = mapped_column(JSONType, server_default=text("'[]'"))  # Selected coating systems (checkboxes)  
+    primary_coating: Mapped[Optional[str]] = mapped_column(String(50))  # Primary coating system
+    coating_cost: Mapped[Optional[float]] = mapped_column(Float, default=0.0)  # Calculated coating cost
+    thickness_in: Mapped[Optional[float]] = mapped_column(Float, default=0.0)  # For plates - thickness in inches
     
     # Additional metadata
-    entry_order = Column(Integer, default=0)  # For maintaining order in UI
-    notes = Column(Text)
+    entry_order: Mapped[Optional[int]] = mapped_column(Integer, default=0)  # For maintaining order in UI
+    notes: Mapped[Optional[str]] = mapped_column(Text)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
-    project = relationship("TakeoffProject", back_populates="entries")
-    material = relationship("Material", foreign_keys=[shape_key], primaryjoin="TakeoffEntry.shape_key == Material.shape_key")
+    project: Mapped["TakeoffProject"] = relationship("TakeoffProject", back_populates="entries")
+    material: Mapped["Material"] = relationship("Material", foreign_keys=[shape_key], primaryjoin="TakeoffEntry.shape_key == Material.shape_key")
+
+def refresh_project_totals(connection, project_ids):
+    """Recompute the cached entry aggregates for the given projects in one UPDATE"""
+    project_ids = list(project_ids)
+    if not project_ids:
+        return
+    project_id = TakeoffProject.__table__.c.id
+    entries = TakeoffEntry.__table__
+    per_project = entries.c.project_id == project_id
+    connection.execute(
+        update(TakeoffProject.__table__)
+        .where(project_id.in_(project_ids))
+        .values(
+            cached_entries_count=select(func.count()).where(per_project).scalar_subquery(),
+            cached_total_price_cents=select(
+                cast(func.round(func.coalesce(func.sum(entries.c.total_price), 0) * 100), BigInteger)
+            ).where(per_project).scalar_subquery(),
+            cached_total_weight_tons=select(
+                func.coalesce(func.sum(entries.c.total_weight_tons), 0.0)
+            ).where(per_project).scalar_subquery(),
+        )
+    )
+
+@event.listens_for(Session, "after_flush")
+def _refresh_touched_project_totals(session, flush_context):
+    # new/dirty/deleted and attribute history still hold the pre-flush state
+    # here. An entry moved to another project changes both projects' totals,
+    # so include the project it left as well.
+    project_ids = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, TakeoffEntry):
+            project_ids.add(obj.project_id)
+            project_ids.update(inspect(obj).attrs.project_id.history.deleted)
+    project_ids.discard(None)
+    refresh_project_totals(session.connection(), project_ids)
 
 class CustomLaborRate(Base):
     __tablename__ = "custom_labor_rates"
     
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), nullable=False, unique=True)  # "Stairs", "Handrail", etc.
-    description = Column(String(300))
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)  # "Stairs", "Handrail", etc.
+    description: Mapped[Optional[str]] = mapped_column(String(300))
     
     # Labor calculation method
-    rate_type = Column(String(20), default="multiplier")  # "multiplier", "fixed_rate", "per_unit"
-    multiplier = Column(Float, default=1.0)  # 1.25 for stairs/handrail
-    fixed_rate = Column(Float)  # Fixed $/hour if rate_type is "fixed_rate"
-    per_unit_rate = Column(Float)  # $/linear_foot if rate_type is "per_unit"
+    rate_type: Mapped[Optional[str]] = mapped_column(String(20), default="multiplier")  # "multiplier", "fixed_rate", "per_unit"
+    multiplier: Mapped[Optional[float]] = mapped_column(Float, default=1.0)  # 1.25 for stairs/handrail
+    fixed_rate: Mapped[Optional[float]] = mapped_column(Float)  # Fixed $/hour if rate_type is "fixed_rate"
+    per_unit_rate: Mapped[Optional[float]] = mapped_column(Float)  # $/linear_foot if rate_type is "per_unit"
     
     # Application rules
-    applies_to_materials = Column(String(500))  # Comma-separated material types or patterns
-    applies_to_descriptions = Column(String(500))  # Keywords in descriptions
+    applies_to_materials: Mapped[Optional[str]] = mapped_column(String(500))  # Comma-separated material types or patterns
+    applies_to_descriptions: Mapped[Optional[str]] = mapped_column(String(500))  # Keywords in descriptions
     
     # Status
-    is_active = Column(Boolean, default=True)
+    is_active: Mapped[Optional[bool]] = mapped_column(Boolean, default=True)
     
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
+    created_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
@@ -1,37 +1,38 @@
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, JSON, Text
-from sqlalchemy.orm import relationship
+from typing import Any, Optional
+from sqlalchemy import Integer, String, Float, ForeignKey, JSON, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 
 class TakeoffItem(Base):
     __tablename__ = "takeoff_items"
     
-    id = Column(Integer, primary_key=True, index=True)
-    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    project_id: Mapped[int] = mapped_column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     
     # Material information
-    material_shape_key = Column(String, nullable=False)
-    description = Column(String)
+    material_shape_key: Mapped[str] = mapped_column(String, nullable=False)
+    description: Mapped[Optional[str]] = mapped_column(String)
     
     # Quantities and dimensions
-    qty = Column(Float, nullable=False)
-    length_ft = Column(Float)  # Standard length in feet
+    qty: Mapped[float] = mapped_column(Float, nullable=False)
+    length_ft: Mapped[Optional[float]] = mapped_column(Float)  # Standard length in feet
     
     # Plate-specific dimensions (stored as JSON for flexibility)
-    plate_dims = Column(JSON)  # {"width_in": 12, "length_ft": 8, "length_in": 6}
+    plate_dims: Mapped[Optional[Any]] = mapped_column(JSON)  # {"width_in": 12, "length_ft": 8, "length_in": 6}
     
     # Labor information
-    labor_mode = Column(String, default="auto")  # auto or manual
-    labor_hours = Column(Float)
-    labor_rate = Column(Float, default=120.0)
-    labor_description = Column(String)
+    labor_mode: Mapped[Optional[str]] = mapped_column(String, default="auto")  # auto or manual
+    labor_hours: Mapped[Optional[float]] = mapped_column(Float)
+    labor_rate: Mapped[Optional[float]] = mapped_column(Float, default=120.0)
+    labor_description: Mapped[Optional[str]] = mapped_column(String)
     
     # Calculated values (cached for performance)
-    weight_per_unit = Column(Float)
-    total_weight = Column(Float)
-    unit_cost = Column(Float)
-    material_cost = Column(Float)
-    labor_cost = Column(Float)
-    total_cost = Column(Float)
+    weight_per_unit: Mapped[Optional[float]] = mapped_column(Float)
+    total_weight: Mapped[Optional[float]] = mapped_column(Float)
+    unit_cost: Mapped[Optional[float]] = mapped_column(Float)
+    material_cost: Mapped[Optional[float]] = mapped_column(Float)
+    labor_cost: Mapped[Optional[float]] = mapped_column(Float)
+    total_cost: Mapped[Optional[float]] = mapped_column(Float)
     
     # Relationships
-    project = relationship("Project", back_populates="takeoff_items")
\ No newline at end of file
+    project: Mapped["Project"] = relationship("Project", back_populates="takeoff_items")
\ No newline at end of file
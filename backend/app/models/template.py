@@ -1,17 +1,26 @@
-from sqlalchemy import Column, String, Text, DateTime, JSON
-from sqlalchemy.ext.declarative import declarative_base
+from datetime import datetime
+from typing import Any, Optional
+from sqlalchemy import String, Text, DateTime, Uuid, text
+from sqlalchemy.orm import Mapped, mapped_column, validates
 from sqlalchemy.sql import func
+from app.core.database import JSONType
 from app.db.base import Base
 import uuid
 
 class Template(Base):
     __tablename__ = "templates"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    name = Column(String, nullable=False)
-    category = Column(String, nullable=False)  # 'Main Takeoff', 'Ductwork Takeoff', 'Pipe Takeoff'
-    description = Column(Text, nullable=True)
-    items = Column(JSON, nullable=False, default=[])  # JSON array of template items
-    calculator_settings = Column(JSON, nullable=True, default={})  # Calculator configurations
-    created_date = Column(DateTime(timezone=True), server_default=func.now())
-    modified_date = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
\ No newline at end of file
+    # Native 16-byte UUID on PostgreSQL (CHAR(32) on SQLite)
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    category: Mapped[str] = mapped_column(String, nullable=False)  # 'Main Takeoff', 'Ductwork Takeoff', 'Pipe Takeoff'
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    items: Mapped[Any] = mapped_column(JSONType, nullable=False, server_default=text("'[]'"))  # JSON array of template items
+    calculator_settings: Mapped[Optional[Any]] = mapped_column(JSONType, nullable=True, server_default=text("'{}'"))  # Calculator configurations
+    created_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    modified_date: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    @validates("items")
+    def _items_not_null(self, key, value):
+        # Updates may send items=null; store an empty list instead
+        return [] if value is None else value
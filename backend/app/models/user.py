@@ -1,11 +1,13 @@
-from sqlalchemy import Column, Integer, String
+from typing import Optional
+from sqlalchemy import Integer, String, Enum
+from sqlalchemy.orm import Mapped, mapped_column
 from app.db.base import Base
 
 class User(Base):
     __tablename__ = "users"
     
-    id = Column(Integer, primary_key=True, index=True)
-    org_id = Column(Integer, default=1, index=True)  # Multi-tenant support
-    email = Column(String, unique=True, index=True, nullable=False)
-    password_hash = Column(String, nullable=False)
-    role = Column(String, default="admin")  # admin, estimator, viewer
\ No newline at end of file
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    org_id: Mapped[Optional[int]] = mapped_column(Integer, default=1, index=True)  # Multi-tenant support
+    email: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
+    password_hash: Mapped[str] = mapped_column(String, nullable=False)
+    role: Mapped[Optional[str]] = mapped_column(Enum("admin", "estimator", "viewer", name="user_role"), default="admin")
\ No newline at end of file
@@ -1,45 +1,92 @@
+import hmac
+import hashlib
+import secrets
+import threading
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql, sqlite
 from app.db.session import SessionLocal
 from app.models.user import User
-from app.core.security import get_password_hash, verify_password, create_access_token
+from app.core.security import get_password_hash, verify_and_update_password, create_access_token
+from app.schemas.auth import Credentials, RegisterCredentials, TokenOut
 
 router = APIRouter()
 
+# Recent successful password checks, keyed on an HMAC of (stored hash,
+# password) under a per-process random key, so a password change invalidates
+# them and the cache holds nothing reusable outside this process. Only hits
+# skip the KDF; distinct passwords still pay the full cost. Login handlers run
+# concurrently in the threadpool and cachetools caches aren't thread-safe, so
+# every access takes the lock (never held across the KDF).
+_pw_cache = TTLCache(maxsize=1024, ttl=30)
+_pw_cache_lock = threading.Lock()
+_pw_cache_key = secrets.token_bytes(32)
+
+def _pw_cache_token(password_hash: str, password: str) -> bytes:
+    return hmac.new(_pw_cache_key, f"{password_hash}\0{password}".encode(), hashlib.sha256).digest()
+
 def get_db():
-    db = SessionLocal()
+    # Auth handlers never touch objects after commit, so skip expiring them;
+    # SessionLocal already has autoflush disabled
+    db = SessionLocal(expire_on_commit=False)
     try:
         yield db
     finally:
         db.close()
 
-@router.post("/register")
-def register(email: str, password: str, db: Session = Depends(get_db)):
+@router.post("/register", response_model=TokenOut)
+def register(creds: RegisterCredentials, db: Session = Depends(get_db)):
     """Register new user"""
-    if db.query(User).filter(User.email == email).first():
-        raise HTTPException(400, "Email already registered")
-    
-    user = User(
-        email=email, 
-        password_hash=get_password_hash(password),
-        role="admin"  # Default role for Capitol Engineering
+    # Single INSERT guarded by the unique index on email instead of a
+    # SELECT-then-INSERT; no row back means the email is already taken
+    insert = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    stmt = (
+        insert(User)
+        .values(
+            email=creds.email,
+            password_hash=get_password_hash(creds.password.get_secret_value()),
+            role="admin"  # Default role for Capitol Engineering
+        )
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(User.id)
     )
-    db.add(user)
+    user_id = db.execute(stmt).scalar()
+    if user_id is None:
+        db.rollback()
+        raise HTTPException(400, "Email already registered")
     db.commit()
-    db.refresh(user)
     
-    token = create_access_token(str(user.id))
-    return {"access_token": token, "token_type": "bearer"}
+    return TokenOut(access_token=create_access_token(str(user_id)))
 
-@router.post("/login")
-def login(email: str, password: str, db: Session = Depends(get_db)):
+@router.post("/login", response_model=TokenOut)
+def login(creds: Credentials, db: Session = Depends(get_db)):
     """Login user"""
-    user = db.query(User).filter(User.email == email).first()
-    if not user or not verify_password(password, user.password_hash):
+    password = creds.password.get_secret_value()
+    # Only the two columns needed to verify; no ORM entity or identity map entry
+    user = db.execute(
+        select(User.id, User.password_hash).where(User.email == creds.email)
+    ).first()
+    if not user:
         raise HTTPException(401, "Invalid credentials")
     
-    token = create_access_token(str(user.id))
-    return {"access_token": token, "token_type": "bearer"}
+    key = _pw_cache_token(user.password_hash, password)
+    with _pw_cache_lock:
+        cached = _pw_cache.get(key, False)
+    if not cached:
+        valid, new_hash = verify_and_update_password(password, user.password_hash)
+        if not valid:
+            raise HTTPException(401, "Invalid credentials")
+        if new_hash:
+            # Stored hash uses an old scheme or cost; upgrade it in place
+            db.execute(update(User).where(User.id == user.id).values(password_hash=new_hash))
+            db.commit()
+            key = _pw_cache_token(new_hash, password)
+        with _pw_cache_lock:
+            _pw_cache[key] = True
+    
+    return TokenOut(access_token=create_access_token(str(user.id)))
 
 @router.get("/me")
 def get_current_user():
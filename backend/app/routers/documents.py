@@ -3,12 +3,17 @@ Document Management API Routes
 For Senior Project Engineer document control system
 """
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, Body
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import select, insert, update, exists, func
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql, sqlite
 from typing import List, Optional
 from datetime import datetime
 import os
-import shutil
+import anyio
+import orjson
 from pathlib import Path
 
 from app.core.database import get_db
@@ -28,64 +33,154 @@ from app.schemas.document import (
     DocumentSearch, BulkDocumentUpdate, BulkApproval
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # Configure upload directory
 UPLOAD_DIR = Path("uploads/documents")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Columns returned by the list/search endpoints. Those build their JSON from
+# the projected rows directly; response_model is kept for the OpenAPI schema.
+DOCUMENT_RESPONSE_COLUMNS = tuple(getattr(Document, name) for name in DocumentResponse.model_fields)
+
+
+# Body chunks arrive at the server's read size (~64 KiB); each async write
+# is a worker-thread hop plus a write() syscall, so batch them up to 1 MiB.
+# The batch buffer is allocated once per upload and written through a
+# memoryview, so no intermediate bytes objects are created per batch.
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Largest document body accepted. Checked against Content-Length before any
+# disk space is reserved for it, and again as the body streams in.
+MAX_UPLOAD_SIZE = int(os.getenv("DOCUMENT_MAX_UPLOAD_MB", "200")) * 1024 * 1024
+
+
+async def _save_request_body(request: Request, file_path: Path) -> int:
+    """Write the raw request body to file_path as it arrives, without
+    spooling it to a temp file first. Returns the number of bytes written."""
+    try:
+        expected = int(request.headers.get("content-length") or 0)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid Content-Length")
+    if expected > MAX_UPLOAD_SIZE:
+        raise HTTPException(status_code=413, detail="File too large")
+    size = 0
+    batch = bytearray(WRITE_BUFFER_SIZE)
+    view = memoryview(batch)
+    filled = 0
+    try:
+        async with await anyio.open_file(file_path, "wb") as buffer:
+            if expected and hasattr(os, "posix_fallocate"):
+                # Reserve the whole file up front so the filesystem allocates it
+                # in one extent instead of growing it on every 1 MiB write
+                try:
+                    await anyio.to_thread.run_sync(os.posix_fallocate, buffer.wrapped.fileno(), 0, expected)
+                except OSError:
+                    expected = 0  # filesystem doesn't support it; grow normally
+            async for chunk in request.stream():
+                size += len(chunk)
+                if size > MAX_UPLOAD_SIZE:
+                    raise HTTPException(status_code=413, detail="File too large")
+                if filled + len(chunk) > WRITE_BUFFER_SIZE:
+                    if filled:
+                        await buffer.write(view[:filled])
+                        filled = 0
+                    if len(chunk) >= WRITE_BUFFER_SIZE:
+                        await buffer.write(chunk)
+                        continue
+                view[filled:filled + len(chunk)] = chunk
+                filled += len(chunk)
+            if filled:
+                await buffer.write(view[:filled])
+            if expected and size != expected:
+                # Body was shorter than announced; drop the reserved tail
+                await buffer.truncate(size)
+    except BaseException:
+        # Aborted or failed body: don't leave a partial (pre-allocated) file
+        # behind. Unlinked synchronously so a cancelled request still cleans up.
+        file_path.unlink(missing_ok=True)
+        raise
+    return size
+
+
+def _file_timestamp() -> str:
+    """Upload filename timestamp (YYYYMMDD_HHMMSS), formatted with plain
+    integer formatting rather than strftime's locale-aware path"""
+    n = datetime.now()
+    return f"{n.year:04d}{n.month:02d}{n.day:02d}_{n.hour:02d}{n.minute:02d}{n.second:02d}"
+
+
+def _insert_unique(db: Session, model, values: dict, unique_column: str):
+    """INSERT a row, relying on the unique index on unique_column instead of
+    a SELECT-then-INSERT. Returns the new instance, or None if the value is
+    already taken."""
+    insert_ = postgresql.insert if db.get_bind().dialect.name == "postgresql" else sqlite.insert
+    stmt = (
+        insert_(model)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=[unique_column])
+        .returning(model)
+    )
+    return db.scalars(stmt).first()
+
+
+def _save_record(db: Session, record):
+    """Add, commit and refresh a record. The async upload handlers run this
+    in the threadpool so the blocking database round trips stay off the
+    event loop while other uploads are streaming."""
+    db.add(record)
+    db.commit()
+    db.refresh(record)
+    return record
+
+
 # Document endpoints
 @router.post("/documents", response_model=DocumentResponse)
-async def create_document(
+def create_document(
     document: DocumentCreate,
     db: Session = Depends(get_db)
 ):
     """Create a new document"""
-    # Check if document number already exists
-    existing = db.query(Document).filter(
-        Document.document_number == document.document_number
-    ).first()
-    if existing:
+    # Duplicate document numbers are caught by the unique index in the same statement
+    db_document = _insert_unique(db, Document, document.dict(), "document_number")
+    if db_document is None:
+        db.rollback()
         raise HTTPException(status_code=400, detail="Document number already exists")
     
-    db_document = Document(**document.dict())
-    db.add(db_document)
+    # Serialize before commit so the response doesn't reload the row
+    response = DocumentResponse.from_orm_trusted(db_document)
     db.commit()
-    db.refresh(db_document)
-    return db_document
+    return response
 
 
 @router.post("/documents/upload", response_model=DocumentResponse)
 async def upload_document(
+    request: Request,
     project_id: str,
     document_number: str,
     title: str,
     document_type: str,
     uploaded_by: str,
-    file: UploadFile = File(...),
+    file_name: str,
     description: Optional[str] = None,
     discipline: Optional[str] = None,
     category: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """Upload a document file"""
+    """Upload a document file; the request body is the raw file content"""
     # Create project directory if it doesn't exist
     project_dir = UPLOAD_DIR / project_id
-    project_dir.mkdir(parents=True, exist_ok=True)
+    await run_in_threadpool(project_dir.mkdir, parents=True, exist_ok=True)
     
     # Generate unique filename
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    file_extension = Path(file.filename).suffix
+    timestamp = _file_timestamp()
+    file_extension = Path(file_name).suffix
     safe_filename = f"{document_number}_{timestamp}{file_extension}"
     file_path = project_dir / safe_filename
     
-    # Save file
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-    
-    # Get file size in MB
-    file_size = os.path.getsize(file_path) / (1024 * 1024)
+    # Save file, counting bytes as they are written (size in MB)
+    file_size = await _save_request_body(request, file_path) / (1024 * 1024)
     
     # Create document record
     db_document = Document(
@@ -96,17 +191,93 @@ async def upload_document(
         document_type=document_type,
         discipline=discipline,
         category=category,
-        file_name=file.filename,
+        file_name=file_name,
         file_path=str(file_path),
         file_size=file_size,
         file_format=file_extension[1:] if file_extension else None,
         uploaded_by=uploaded_by
     )
     
-    db.add(db_document)
+    return await run_in_threadpool(_save_record, db, db_document)
+
+
+def _document_filters(project_id, document_type, discipline, status, is_latest) -> list:
+    """WHERE criteria shared by the document list and export endpoints"""
+    criteria = []
+    if project_id:
+        criteria.append(Document.project_id == project_id)
+    if document_type:
+        criteria.append(Document.document_type == document_type)
+    if discipline:
+        criteria.append(Document.discipline == discipline)
+    if status:
+        criteria.append(Document.status == status)
+    if is_latest:
+        criteria.append(Document.is_latest == True)
+    return criteria
+
+
+# Rows fetched per round trip by the export stream
+EXPORT_BATCH_SIZE = 500
+
+
+@router.get("/documents/export")
+def export_documents(
+    project_id: Optional[str] = Query(None),
+    document_type: Optional[str] = Query(None),
+    discipline: Optional[str] = Query(None),
+    status: Optional[str] = Query(None),
+    is_latest: bool = Query(True),
+    db: Session = Depends(get_db)
+):
+    """Export all matching documents as newline-delimited JSON"""
+    stmt = (
+        select(*DOCUMENT_RESPONSE_COLUMNS)
+        .where(*_document_filters(project_id, document_type, discipline, status, is_latest))
+        .order_by(Document.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    
+    # yield_per streams the result with a server-side cursor (PostgreSQL) in
+    # batches, so memory stays flat however many rows match. The session
+    # from get_db stays open until the response has been fully sent.
+    def generate():
+        for row in db.execute(stmt):
+            yield orjson.dumps(row._asdict()) + b"\n"
+    
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+# Registered ahead of /documents/{document_id}, which would otherwise
+# match "bulk-update" as a document id
+@router.put("/documents/bulk-update")
+def bulk_update_documents(
+    bulk_update: BulkDocumentUpdate,
+    db: Session = Depends(get_db)
+):
+    """Update multiple documents at once"""
+    document_ids = set(bulk_update.document_ids)
+    update_data = bulk_update.update_data.dict(exclude_unset=True)
+    
+    # One UPDATE for the whole batch; the matched row count doubles as the
+    # existence check
+    if update_data:
+        matched = db.execute(
+            update(Document)
+            .where(Document.id.in_(document_ids))
+            .values(**update_data)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+    else:
+        matched = db.query(func.count(Document.id)).filter(Document.id.in_(document_ids)).scalar()
+    
+    if matched != len(document_ids):
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Some documents not found")
+    
     db.commit()
-    db.refresh(db_document)
-    return db_document
+    
+    return {"message": f"Updated {matched} documents successfully"}
 
 
 @router.get("/documents/{document_id}", response_model=DocumentResponse)
@@ -130,21 +301,12 @@ def list_documents(
     db: Session = Depends(get_db)
 ):
     """List documents with optional filters"""
-    query = db.query(Document)
-    
-    if project_id:
-        query = query.filter(Document.project_id == project_id)
-    if document_type:
-        query = query.filter(Document.document_type == document_type)
-    if discipline:
-        query = query.filter(Document.discipline == discipline)
-    if status:
-        query = query.filter(Document.status == status)
-    if is_latest:
-        query = query.filter(Document.is_latest == True)
+    query = db.query(Document).filter(
+        *_document_filters(project_id, document_type, discipline, status, is_latest)
+    )
     
-    documents = query.offset(skip).limit(limit).all()
-    return documents
+    rows = query.with_entities(*DOCUMENT_RESPONSE_COLUMNS).offset(skip).limit(limit).all()
+    return ORJSONResponse([row._asdict() for row in rows])
 
 
 @router.put("/documents/{document_id}", response_model=DocumentResponse)
@@ -186,33 +348,31 @@ def delete_document(document_id: int, db: Session = Depends(get_db)):
 # Revision endpoints
 @router.post("/documents/{document_id}/revisions", response_model=RevisionResponse)
 async def create_revision(
+    request: Request,
     document_id: int,
-    file: UploadFile = File(...),
-    revision: str = Body(...),
-    change_description: str = Body(...),
-    reason_for_change: Optional[str] = Body(None),
-    created_by: str = Body(...),
+    file_name: str,
+    revision: str,
+    change_description: str,
+    created_by: str,
+    reason_for_change: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """Create a new document revision"""
+    """Create a new document revision; the request body is the raw file content"""
     # Get original document
-    document = db.query(Document).filter(Document.id == document_id).first()
+    document = await run_in_threadpool(db.get, Document, document_id)
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
     # Save new revision file
     project_dir = UPLOAD_DIR / document.project_id / "revisions"
-    project_dir.mkdir(parents=True, exist_ok=True)
+    await run_in_threadpool(project_dir.mkdir, parents=True, exist_ok=True)
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    file_extension = Path(file.filename).suffix
+    timestamp = _file_timestamp()
+    file_extension = Path(file_name).suffix
     safe_filename = f"{document.document_number}_rev{revision}_{timestamp}{file_extension}"
     file_path = project_dir / safe_filename
     
-    with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(file.file, buffer)
-    
-    file_size = os.path.getsize(file_path) / (1024 * 1024)
+    file_size = await _save_request_body(request, file_path) / (1024 * 1024)
     
     # Create revision record
     new_revision_number = document.revision_number + 1
@@ -220,7 +380,7 @@ async def create_revision(
         document_id=document_id,
         revision=revision,
         revision_number=new_revision_number,
-        file_name=file.filename,
+        file_name=file_name,
         file_path=str(file_path),
         file_size=file_size,
         change_description=change_description,
@@ -231,14 +391,11 @@ async def create_revision(
     # Update document with new revision info
     document.version = revision
     document.revision_number = new_revision_number
-    document.file_name = file.filename
+    document.file_name = file_name
     document.file_path = str(file_path)
     document.file_size = file_size
     
-    db.add(db_revision)
-    db.commit()
-    db.refresh(db_revision)
-    return db_revision
+    return await run_in_threadpool(_save_record, db, db_revision)
 
 
 @router.get("/documents/{document_id}/revisions", response_model=List[RevisionResponse])
@@ -247,7 +404,7 @@ def get_document_revisions(document_id: int, db: Session = Depends(get_db)):
     revisions = db.query(DocumentRevision).filter(
         DocumentRevision.document_id == document_id
     ).order_by(DocumentRevision.revision_number.desc()).all()
-    return revisions
+    return ORJSONResponse([RevisionResponse.from_orm_trusted(r).model_dump(mode="json") for r in revisions])
 
 
 # Comment endpoints
@@ -285,7 +442,7 @@ def get_document_comments(
         query = query.filter(DocumentComment.status == status)
     
     comments = query.order_by(DocumentComment.created_at.desc()).all()
-    return comments
+    return ORJSONResponse([CommentResponse.from_orm_trusted(c).model_dump(mode="json") for c in comments])
 
 
 @router.put("/comments/{comment_id}", response_model=CommentResponse)
@@ -348,65 +505,66 @@ def get_document_approvals(
         query = query.filter(DocumentApproval.status == status)
     
     approvals = query.order_by(DocumentApproval.approval_level).all()
-    return approvals
+    return ORJSONResponse([ApprovalResponse.from_orm_trusted(a).model_dump(mode="json") for a in approvals])
 
 
 @router.put("/approvals/{approval_id}/decision", response_model=ApprovalResponse)
 def make_approval_decision(
     approval_id: int,
-    decision: ApprovalDecision,
+    decision: ApprovalDecision = Body(discriminator="decision"),
     db: Session = Depends(get_db)
 ):
     """Make an approval decision"""
-    approval = db.query(DocumentApproval).filter(
-        DocumentApproval.id == approval_id
+    now = datetime.utcnow()
+    values = {
+        "decision": decision.decision,
+        "comments": decision.comments,
+        "conditions": getattr(decision, "conditions", None),
+        "signature_hash": decision.signature_hash,
+        "reviewed_at": now,
+    }
+    if decision.signature_hash:
+        values["signature_timestamp"] = now
+    
+    # Update status based on decision
+    if decision.decision in ("approved", "rejected"):
+        values["status"] = decision.decision
+    
+    # Record the decision and get the updated row back in one statement
+    approval = db.scalars(
+        update(DocumentApproval)
+        .where(DocumentApproval.id == approval_id)
+        .values(**values)
+        .returning(DocumentApproval)
     ).first()
     if not approval:
         raise HTTPException(status_code=404, detail="Approval request not found")
     
-    # Update approval
-    approval.decision = decision.decision
-    approval.comments = decision.comments
-    approval.conditions = decision.conditions
-    approval.signature_hash = decision.signature_hash
-    approval.reviewed_at = datetime.utcnow()
-    
-    if decision.signature_hash:
-        approval.signature_timestamp = datetime.utcnow()
-    
-    # Update status based on decision
     if decision.decision == "approved":
-        approval.status = "approved"
-        
-        # If this is the final approval, update document status
-        document = db.query(Document).filter(
-            Document.id == approval.document_id
-        ).first()
-        
-        # Check if all required approvals are complete
-        pending_approvals = db.query(DocumentApproval).filter(
+        # If this is the final approval, update document status; the
+        # NOT EXISTS guard checks for other pending approvals in the same UPDATE
+        other_pending = exists().where(
             DocumentApproval.document_id == approval.document_id,
             DocumentApproval.status == "pending",
             DocumentApproval.id != approval_id
-        ).count()
-        
-        if pending_approvals == 0:
-            document.status = "approved"
-            document.approval_date = datetime.utcnow()
-            document.approved_by = approval.approver_name
+        )
+        db.execute(
+            update(Document)
+            .where(Document.id == approval.document_id, ~other_pending)
+            .values(status="approved", approval_date=now, approved_by=approval.approver_name)
+        )
     
     elif decision.decision == "rejected":
-        approval.status = "rejected"
-        
-        # Update document status
-        document = db.query(Document).filter(
-            Document.id == approval.document_id
-        ).first()
-        document.review_status = "rejected"
+        db.execute(
+            update(Document)
+            .where(Document.id == approval.document_id)
+            .values(review_status="rejected")
+        )
     
+    # Serialize before commit so the response doesn't reload the row
+    response = ApprovalResponse.from_orm_trusted(approval)
     db.commit()
-    db.refresh(approval)
-    return approval
+    return response
 
 
 # Distribution endpoints
@@ -432,6 +590,31 @@ def distribute_document(
     return db_distribution
 
 
+@router.post("/documents/{document_id}/distribute-bulk", response_model=List[DistributionResponse])
+def distribute_document_bulk(
+    document_id: int,
+    distributions: List[DistributionCreate],
+    db: Session = Depends(get_db)
+):
+    """Create distribution records for a list of recipients in one statement.
+    Only records the distributions; no notifications are sent."""
+    if not db.query(exists().where(Document.id == document_id)).scalar():
+        raise HTTPException(status_code=404, detail="Document not found")
+    if not distributions:
+        return []
+    
+    # ORM bulk insert with RETURNING: the rows go out as batched multi-row
+    # INSERTs and come back as instances, instead of one flush per recipient
+    rows = [{**d.dict(), "document_id": document_id} for d in distributions]
+    created = db.scalars(insert(DocumentDistribution).returning(DocumentDistribution), rows).all()
+    
+    # Serialize before commit so the response doesn't reload every row
+    response = [DistributionResponse.from_orm_trusted(d) for d in created]
+    db.commit()
+    
+    return response
+
+
 @router.get("/documents/{document_id}/distributions", response_model=List[DistributionResponse])
 def get_document_distributions(
     document_id: int,
@@ -441,7 +624,7 @@ def get_document_distributions(
     distributions = db.query(DocumentDistribution).filter(
         DocumentDistribution.document_id == document_id
     ).order_by(DocumentDistribution.sent_at.desc()).all()
-    return distributions
+    return ORJSONResponse([DistributionResponse.from_orm_trusted(d).model_dump(mode="json") for d in distributions])
 
 
 @router.put("/distributions/{distribution_id}/acknowledge", response_model=DistributionResponse)
@@ -473,18 +656,16 @@ def create_drawing_set(
     db: Session = Depends(get_db)
 ):
     """Create a new drawing set"""
-    # Check if set number already exists
-    existing = db.query(DrawingSet).filter(
-        DrawingSet.set_number == drawing_set.set_number
-    ).first()
-    if existing:
+    # Duplicate set numbers are caught by the unique index in the same statement
+    db_drawing_set = _insert_unique(db, DrawingSet, drawing_set.dict(), "set_number")
+    if db_drawing_set is None:
+        db.rollback()
         raise HTTPException(status_code=400, detail="Drawing set number already exists")
     
-    db_drawing_set = DrawingSet(**drawing_set.dict())
-    db.add(db_drawing_set)
+    # Serialize before commit so the response doesn't reload the row
+    response = DrawingSetResponse.from_orm_trusted(db_drawing_set)
     db.commit()
-    db.refresh(db_drawing_set)
-    return db_drawing_set
+    return response
 
 
 @router.post("/drawing-sets/{set_id}/drawings")
@@ -523,27 +704,31 @@ def get_drawing_set(set_id: int, db: Session = Depends(get_db)):
     if not drawing_set:
         raise HTTPException(status_code=404, detail="Drawing set not found")
     
-    # Get drawings in the set
-    items = db.query(DrawingSetItem).filter(
+    # Get drawings in the set with their documents in one joined query,
+    # selecting only the columns the response uses
+    rows = db.query(
+        Document.id.label("document_id"),
+        Document.document_number,
+        Document.title,
+        Document.version.label("revision"),
+        DrawingSetItem.sequence_number,
+        DrawingSetItem.sheet_number,
+        DrawingSetItem.notes
+    ).join(
+        Document, Document.id == DrawingSetItem.document_id
+    ).filter(
         DrawingSetItem.drawing_set_id == set_id
     ).order_by(DrawingSetItem.sequence_number).all()
     
     # Format drawings data
-    drawings = []
-    for item in items:
-        document = db.query(Document).filter(Document.id == item.document_id).first()
-        if document:
-            drawings.append({
-                "document_id": document.id,
-                "document_number": document.document_number,
-                "title": document.title,
-                "revision": document.version,
-                "sequence_number": item.sequence_number,
-                "sheet_number": item.sheet_number,
-                "notes": item.notes
-            })
-    
-    drawing_set_dict = drawing_set.__dict__
+    drawings = [row._asdict() for row in rows]
+    
+    # Build the response from the column values rather than the instance
+    # __dict__, which would leak ORM state into it
+    drawing_set_dict = {
+        column.key: getattr(drawing_set, column.key)
+        for column in DrawingSet.__table__.columns
+    }
     drawing_set_dict["drawings"] = drawings
     
     return drawing_set_dict
@@ -556,21 +741,19 @@ def create_transmittal(
     db: Session = Depends(get_db)
 ):
     """Create a transmittal record"""
-    # Check if transmittal number already exists
-    existing = db.query(TransmittalRecord).filter(
-        TransmittalRecord.transmittal_number == transmittal.transmittal_number
-    ).first()
-    if existing:
+    # Duplicate transmittal numbers are caught by the unique index in the same statement
+    db_transmittal = _insert_unique(db, TransmittalRecord, transmittal.dict(), "transmittal_number")
+    if db_transmittal is None:
+        db.rollback()
         raise HTTPException(status_code=400, detail="Transmittal number already exists")
     
-    db_transmittal = TransmittalRecord(**transmittal.dict())
-    db.add(db_transmittal)
+    # Serialize before commit so the response doesn't reload the row
+    response = TransmittalResponse.from_orm_trusted(db_transmittal)
     db.commit()
-    db.refresh(db_transmittal)
     
     # TODO: Send transmittal email
     
-    return db_transmittal
+    return response
 
 
 @router.get("/transmittals/{transmittal_id}", response_model=TransmittalResponse)
@@ -623,67 +806,48 @@ def search_documents(
     
     # Pagination
     offset = (search.page - 1) * search.page_size
-    documents = query.offset(offset).limit(search.page_size).all()
+    rows = query.with_entities(*DOCUMENT_RESPONSE_COLUMNS).offset(offset).limit(search.page_size).all()
     
-    return documents
+    return ORJSONResponse([row._asdict() for row in rows])
 
 
 # Bulk operations
-@router.put("/documents/bulk-update")
-def bulk_update_documents(
-    bulk_update: BulkDocumentUpdate,
-    db: Session = Depends(get_db)
-):
-    """Update multiple documents at once"""
-    documents = db.query(Document).filter(
-        Document.id.in_(bulk_update.document_ids)
-    ).all()
-    
-    if len(documents) != len(bulk_update.document_ids):
-        raise HTTPException(status_code=404, detail="Some documents not found")
-    
-    update_data = bulk_update.update_data.dict(exclude_unset=True)
-    
-    for document in documents:
-        for field, value in update_data.items():
-            setattr(document, field, value)
-    
-    db.commit()
-    
-    return {"message": f"Updated {len(documents)} documents successfully"}
-
-
 @router.put("/approvals/bulk-approve")
 def bulk_approve(
     bulk_approval: BulkApproval,
     db: Session = Depends(get_db)
 ):
     """Approve multiple documents at once"""
-    approvals = db.query(DocumentApproval).filter(
-        DocumentApproval.id.in_(bulk_approval.approval_ids)
-    ).all()
-    
-    if len(approvals) != len(bulk_approval.approval_ids):
-        raise HTTPException(status_code=404, detail="Some approval requests not found")
-    
+    approval_ids = set(bulk_approval.approval_ids)
     decision_data = bulk_approval.decision.dict()
     
-    for approval in approvals:
-        approval.decision = decision_data["decision"]
-        approval.comments = decision_data.get("comments")
-        approval.conditions = decision_data.get("conditions")
-        approval.signature_hash = decision_data.get("signature_hash")
-        approval.reviewed_at = datetime.utcnow()
-        
-        if decision_data.get("signature_hash"):
-            approval.signature_timestamp = datetime.utcnow()
-        
-        # Update status
-        if decision_data["decision"] == "approved":
-            approval.status = "approved"
-        elif decision_data["decision"] == "rejected":
-            approval.status = "rejected"
+    now = datetime.utcnow()
+    values = {
+        "decision": decision_data["decision"],
+        "comments": decision_data.get("comments"),
+        "conditions": decision_data.get("conditions"),
+        "signature_hash": decision_data.get("signature_hash"),
+        "reviewed_at": now,
+    }
+    if decision_data.get("signature_hash"):
+        values["signature_timestamp"] = now
+    
+    # Update status
+    if decision_data["decision"] in ("approved", "rejected"):
+        values["status"] = decision_data["decision"]
+    
+    # Same decision for every approval, so one UPDATE covers the batch
+    matched = db.execute(
+        update(DocumentApproval)
+        .where(DocumentApproval.id.in_(approval_ids))
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    
+    if matched != len(approval_ids):
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Some approval requests not found")
     
     db.commit()
     
-    return {"message": f"Processed {len(approvals)} approval requests successfully"}
\ No newline at end of file
+    return {"message": f"Processed {matched} approval requests successfully"}
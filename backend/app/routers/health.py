@@ -1,23 +1,78 @@
+import threading
+import time
+import orjson
 from fastapi import APIRouter
+from fastapi.responses import Response
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+from app.core.database import engine
 
 router = APIRouter()
 
+# Static probe payloads, serialized once
+_LIVE_BYTES = orjson.dumps({"ok": True})
+_VERSION_BYTES = orjson.dumps({
+    "name": "Capitol Takeoff API",
+    "version": "0.1.0",
+    "environment": "development"
+})
+_NOT_READY_BYTES = orjson.dumps({"ok": False})
+
+# Readiness is probed far more often than the database goes away; run the
+# SELECT 1 at most once per READY_TTL seconds and serve the cached verdict
+# in between, so probe frequency doesn't turn into database load
+READY_TTL = 1.0
+READY_PROBE_TIMEOUT = 2
+_ready_refresh_lock = threading.Lock()
+_ready_state = (float("-inf"), False)  # (checked_at, ok), replaced as a whole
+
+# The probe opens its own unpooled connection with a short timeout, so a
+# database outage neither waits on the app engine's 60s connect timeout nor
+# queues behind a pool full of stuck checkouts
+if engine.dialect.name == "postgresql":
+    _probe_engine = create_engine(
+        engine.url,
+        poolclass=NullPool,
+        connect_args={
+            "connect_timeout": READY_PROBE_TIMEOUT,
+            "options": f"-c statement_timeout={READY_PROBE_TIMEOUT * 1000}",
+            "application_name": "capitol-takeoff-ready"
+        }
+    )
+else:
+    _probe_engine = engine
+
+def _database_ok() -> bool:
+    try:
+        with _probe_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return True
+    except Exception:
+        return False
+
 @router.get("/live")
 def live():
     """Kubernetes liveness probe"""
-    return {"ok": True}
+    return Response(content=_LIVE_BYTES, media_type="application/json")
 
 @router.get("/ready")
 def ready():
-    """Kubernetes readiness probe"""
-    # TODO: Add database connectivity check
-    return {"ok": True}
+    """Kubernetes readiness probe (503 while the database is unreachable)"""
+    global _ready_state
+    checked_at, ok = _ready_state
+    # A single probe refreshes a stale verdict; concurrent probes don't wait
+    # for it and answer with the last verdict instead
+    if time.monotonic() - checked_at >= READY_TTL and _ready_refresh_lock.acquire(blocking=False):
+        try:
+            ok = _database_ok()
+            _ready_state = (time.monotonic(), ok)
+        finally:
+            _ready_refresh_lock.release()
+    if ok:
+        return Response(content=_LIVE_BYTES, media_type="application/json")
+    return Response(content=_NOT_READY_BYTES, status_code=503, media_type="application/json")
 
 @router.get("/version")
 def version():
     """API version info"""
-    return {
-        "name": "Capitol Takeoff API",
-        "version": "0.1.0",
-        "environment": "development"
-    }
\ No newline at end of file
+    return Response(content=_VERSION_BYTES, media_type="application/json")
\ No newline at end of file
@@ -1,12 +1,51 @@
+import threading
+from cachetools import TTLCache
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import or_, func, event
 from typing import List, Optional
 from app.db.session import SessionLocal
 from app.models.material import Material
 
 router = APIRouter()
 
+# The search and list endpoints return a handful of scalars, so select just
+# those columns instead of hydrating full Material rows. Material stores a
+# per-CWT price; the per-lb and per-ft prices are derived from it in SQL.
+MATERIAL_DETAIL_COLUMNS = (
+    Material.shape_key,
+    Material.material_type,
+    Material.grade,
+    Material.weight_per_ft,
+    (Material.unit_price_per_cwt / 100.0).label("price_per_lb"),
+    Material.effective_price.label("price_per_ft"),
+    Material.category,
+    Material.commonly_used,
+)
+
+# The category dropdown and the unfiltered search page (commonly used
+# materials first) only change when the catalog does. Cache them briefly;
+# ORM writes to Material clear the cache, and the TTL covers bulk imports
+# that bypass the ORM. The handlers run in the threadpool and cachetools
+# caches aren't thread-safe, so every access goes through the lock.
+_catalog_cache = TTLCache(maxsize=32, ttl=300)
+_catalog_cache_lock = threading.Lock()
+
+@event.listens_for(Material, "after_insert")
+@event.listens_for(Material, "after_update")
+@event.listens_for(Material, "after_delete")
+def _clear_catalog_cache(mapper, connection, target):
+    with _catalog_cache_lock:
+        _catalog_cache.clear()
+
+MATERIAL_LIST_COLUMNS = (
+    Material.shape_key,
+    Material.material_type,
+    Material.category,
+    Material.weight_per_ft,
+    Material.effective_price.label("price_per_ft"),
+)
+
 def get_db():
     db = SessionLocal()
     try:
@@ -25,9 +64,18 @@ def search_materials(
     Search materials - matches desktop functionality
     Fast search with < 150ms response time target
     """
+    # No search term or category: the autocomplete's default hot set
+    cache_key = ("search", limit) if not q and not category else None
+    if cache_key is not None:
+        with _catalog_cache_lock:
+            cached = _catalog_cache.get(cache_key)
+        if cached is not None:
+            return cached
+    
     query = db.query(Material)
     
-    # Search in shape_key and material_type (matches desktop logic)
+    # Search in shape_key and material_type (matches desktop logic). On
+    # PostgreSQL both ILIKEs are answered from the trigram GIN indexes.
     if q:
         like_pattern = f"%{q}%"
         query = query.filter(
@@ -47,51 +95,42 @@ def search_materials(
         Material.shape_key.asc()
     ).limit(limit)
     
-    materials = query.all()
+    rows = query.with_entities(*MATERIAL_DETAIL_COLUMNS).all()
     
     # Return format matching desktop expectations
-    return [
-        {
-            "shape_key": material.shape_key,
-            "material_type": material.material_type,
-            "grade": material.grade,
-            "weight_per_ft": material.weight_per_ft,
-            "price_per_lb": material.price_per_lb,
-            "price_per_ft": material.price_per_ft,
-            "category": material.category,
-            "commonly_used": material.commonly_used
-        }
-        for material in materials
-    ]
+    results = [row._asdict() for row in rows]
+    if cache_key is not None:
+        with _catalog_cache_lock:
+            _catalog_cache[cache_key] = results
+    return results
 
 @router.get("/categories")
 def get_categories(db: Session = Depends(get_db)):
     """Get all available material categories"""
-    categories = db.query(Material.category).distinct().all()
-    return [category[0] for category in categories if category[0]]
+    with _catalog_cache_lock:
+        categories = _catalog_cache.get("categories")
+    if categories is None:
+        rows = db.query(Material.category).distinct().all()
+        categories = [row[0] for row in rows if row[0]]
+        with _catalog_cache_lock:
+            _catalog_cache["categories"] = categories
+    return categories
 
 @router.get("/{shape_key}")
 def get_material_by_shape_key(shape_key: str, db: Session = Depends(get_db)):
     """Get specific material by shape key"""
-    material = db.query(Material).filter(Material.shape_key == shape_key).first()
+    material = db.query(*MATERIAL_DETAIL_COLUMNS).filter(Material.shape_key == shape_key).first()
     if not material:
         raise HTTPException(404, f"Material {shape_key} not found")
     
-    return {
-        "shape_key": material.shape_key,
-        "material_type": material.material_type,
-        "grade": material.grade,
-        "weight_per_ft": material.weight_per_ft,
-        "price_per_lb": material.price_per_lb,
-        "price_per_ft": material.price_per_ft,
-        "category": material.category,
-        "commonly_used": material.commonly_used
-    }
+    return material._asdict()
 
 @router.post("/import")
 def import_materials():
     """Import materials from Excel (placeholder for admin functionality)"""
     # TODO: Implement Excel import matching desktop functionality
+    with _catalog_cache_lock:
+        _catalog_cache.clear()
     return {"message": "Material import functionality will be implemented in Phase 3"}
 
 @router.get("/")
@@ -107,21 +146,23 @@ def list_materials(
     if category:
         query = query.filter(Material.category == category)
     
-    materials = query.offset(skip).limit(limit).all()
-    total_count = query.count()
+    # COUNT(*) OVER () carries the filtered total on every row, so the page
+    # and the total come back from one execution of the filter
+    rows = query.with_entities(
+        *MATERIAL_LIST_COLUMNS, func.count().over().label("total_count")
+    ).offset(skip).limit(limit).all()
+    if rows:
+        total_count = rows[0].total_count
+    else:
+        # Page past the end (or no matches): no row to read the total from
+        total_count = query.with_entities(func.count(Material.id)).scalar()
     
     return {
         "materials": [
-            {
-                "shape_key": material.shape_key,
-                "material_type": material.material_type,
-                "category": material.category,
-                "weight_per_ft": material.weight_per_ft,
-                "price_per_ft": material.price_per_ft
-            }
-            for material in materials
+            {key: value for key, value in row._asdict().items() if key != "total_count"}
+            for row in rows
         ],
         "total_count": total_count,
         "skip": skip,
         "limit": limit
-    }
\ No newline at end of file
+    }
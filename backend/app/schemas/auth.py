@@ -0,0 +1,21 @@
+"""
+Capitol Engineering Company - Auth Schemas
+Pydantic models for authentication requests and responses
+"""
+
+from pydantic import BaseModel, EmailStr, SecretStr
+
+class Credentials(BaseModel):
+    """Login body; keeps credentials out of URLs and access logs. The email is
+    matched exactly as stored, so local accounts like admin@local still work"""
+    email: str
+    password: SecretStr
+
+class RegisterCredentials(Credentials):
+    """Registration body; new accounts must use a deliverable-format address"""
+    email: EmailStr
+
+class TokenOut(BaseModel):
+    """Bearer token issued on login or registration"""
+    access_token: str
+    token_type: str = "bearer"
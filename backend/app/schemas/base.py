@@ -0,0 +1,55 @@
+"""
+Capitol Engineering Company - Shared Schema Bases
+Base classes shared by the response schemas
+"""
+
+from datetime import date, datetime
+from typing import Any, Callable, ClassVar, Dict, Literal, get_args, get_origin
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+# Field types an ORM column hands back exactly as the schema declares them
+_ORM_NATIVE_TYPES = {int, float, str, bool, bytes, date, datetime, dict, list, type(None), Any}
+
+def _orm_native(annotation) -> bool:
+    """Whether values of this annotation come back from the ORM already in
+    the field's type (so model_construct can take them as they are)"""
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return all(type(arg) in _ORM_NATIVE_TYPES for arg in get_args(annotation))
+    if origin is not None:
+        return all(_orm_native(arg) for arg in get_args(annotation) if arg is not Ellipsis)
+    return annotation in _ORM_NATIVE_TYPES
+
+class TrustedResponse(BaseModel):
+    """Response schema that can be built from a trusted ORM row without
+    validation. Only for rows read back from our own database, whose column
+    types already match the schema fields; anything from a client still goes
+    through model_validate. Fields the ORM can't hand back in the declared
+    type (enums, nested models) are converted on the way in, so serializing
+    the response doesn't trip over raw column values. Instances are frozen:
+    a response is never modified after it is built."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    _trusted_coercers: ClassVar[Dict[str, Callable[[Any], Any]]] = {}
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._trusted_coercers = {
+            name: TypeAdapter(field.annotation).validate_python
+            for name, field in cls.model_fields.items()
+            if not _orm_native(field.annotation)
+        }
+
+    @classmethod
+    def from_orm_trusted(cls, obj):
+        """Construct from the ORM object's attributes, validating only the
+        fields that need converting"""
+        fields = cls.model_fields
+        coercers = cls._trusted_coercers
+        values = {}
+        for name in fields:
+            value = getattr(obj, name)
+            coerce = coercers.get(name)
+            values[name] = value if coerce is None or value is None else coerce(value)
+        return cls.model_construct(_fields_set=set(fields), **values)
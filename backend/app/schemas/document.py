@@ -2,11 +2,15 @@
 Pydantic schemas for Document Management System
 """
 
+from __future__ import annotations
+
 from pydantic import BaseModel, Field, ConfigDict
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal, Union
 from datetime import datetime
 from enum import Enum
 
+from app.schemas.base import TrustedResponse
+
 
 class DocumentType(str, Enum):
     DRAWING = "drawing"
@@ -47,6 +51,19 @@ class Priority(str, Enum):
     CRITICAL = "critical"
 
 
+class AccessLevel(str, Enum):
+    PUBLIC = "public"
+    INTERNAL = "internal"
+    CONFIDENTIAL = "confidential"
+    RESTRICTED = "restricted"
+
+
+class Decision(str, Enum):
+    APPROVED = "approved"
+    REJECTED = "rejected"
+    CONDITIONAL = "conditional"
+
+
 # Base schemas
 class DocumentBase(BaseModel):
     project_id: str
@@ -58,7 +75,7 @@ class DocumentBase(BaseModel):
     category: Optional[str] = None
     tags: Optional[List[str]] = []
     document_metadata: Optional[Dict[str, Any]] = {}
-    access_level: str = "internal"
+    access_level: AccessLevel = AccessLevel.INTERNAL
     is_controlled: bool = False
 
 
@@ -78,12 +95,12 @@ class DocumentUpdate(BaseModel):
     category: Optional[str] = None
     tags: Optional[List[str]] = None
     document_metadata: Optional[Dict[str, Any]] = None
-    access_level: Optional[str] = None
+    access_level: Optional[AccessLevel] = None
     is_controlled: Optional[bool] = None
     engineer_of_record: Optional[str] = None
 
 
-class DocumentResponse(DocumentBase):
+class DocumentResponse(DocumentBase, TrustedResponse):
     model_config = ConfigDict(from_attributes=True)
     
     id: int
@@ -107,7 +124,11 @@ class DocumentResponse(DocumentBase):
 
 
 # Revision schemas
+# Revision, approval, distribution, drawing set and transmittal schemas use
+# defer_build so their core schemas are generated on first use, not at import
 class RevisionCreate(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+    
     document_id: int
     revision: str
     change_description: str
@@ -118,8 +139,8 @@ class RevisionCreate(BaseModel):
     created_by: str
 
 
-class RevisionResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+class RevisionResponse(TrustedResponse):
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
     
     id: int
     document_id: int
@@ -136,13 +157,19 @@ class RevisionResponse(BaseModel):
 
 
 # Comment schemas
+class MarkupCoordinates(BaseModel):
+    x: float
+    y: float
+    page: Optional[int] = None
+
+
 class CommentCreate(BaseModel):
     document_id: int
     revision_id: Optional[int] = None
     comment_type: Optional[str] = None
     comment_text: str
     page_number: Optional[int] = None
-    coordinates: Optional[Dict[str, Any]] = None
+    coordinates: Optional[MarkupCoordinates] = None
     priority: Priority = Priority.NORMAL
     created_by: str
 
@@ -155,7 +182,7 @@ class CommentUpdate(BaseModel):
     resolved_by: Optional[str] = None
 
 
-class CommentResponse(BaseModel):
+class CommentResponse(TrustedResponse):
     model_config = ConfigDict(from_attributes=True)
     
     id: int
@@ -177,6 +204,8 @@ class CommentResponse(BaseModel):
 
 # Approval schemas
 class ApprovalCreate(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+    
     document_id: int
     revision_id: Optional[int] = None
     approval_level: int
@@ -187,15 +216,35 @@ class ApprovalCreate(BaseModel):
     due_date: Optional[datetime] = None
 
 
-class ApprovalDecision(BaseModel):
-    decision: str  # approved, rejected, conditional
+class _ApprovalDecisionBase(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+    
     comments: Optional[str] = None
-    conditions: Optional[str] = None
     signature_hash: Optional[str] = None
 
 
-class ApprovalResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+class ApprovedDecision(_ApprovalDecisionBase):
+    decision: Literal[Decision.APPROVED]
+
+
+class RejectedDecision(_ApprovalDecisionBase):
+    decision: Literal[Decision.REJECTED]
+
+
+class ConditionalDecision(_ApprovalDecisionBase):
+    decision: Literal[Decision.CONDITIONAL]
+    conditions: str
+
+
+# Tagged on "decision": declare fields of this type with
+# discriminator="decision" so the validator dispatches straight to the
+# matching variant instead of trying each one, and a conditional approval
+# without conditions is rejected at the boundary
+ApprovalDecision = Union[ApprovedDecision, RejectedDecision, ConditionalDecision]
+
+
+class ApprovalResponse(TrustedResponse):
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
     
     id: int
     document_id: int
@@ -218,6 +267,8 @@ class ApprovalResponse(BaseModel):
 
 # Distribution schemas
 class DistributionCreate(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+    
     document_id: int
     revision_id: Optional[int] = None
     distribution_type: Optional[str] = None
@@ -233,11 +284,13 @@ class DistributionCreate(BaseModel):
 
 
 class DistributionAcknowledge(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+    
     acknowledgment_method: Optional[str] = None
 
 
-class DistributionResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+class DistributionResponse(TrustedResponse):
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
     
     id: int
     document_id: int
@@ -260,6 +313,8 @@ class DistributionResponse(BaseModel):
 
 # Drawing Set schemas
 class DrawingSetCreate(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+    
     project_id: str
     set_name: str
     set_number: str
@@ -270,6 +325,8 @@ class DrawingSetCreate(BaseModel):
 
 
 class DrawingSetItemCreate(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+    
     document_id: int
     revision_id: Optional[int] = None
     sequence_number: Optional[int] = None
@@ -277,8 +334,20 @@ class DrawingSetItemCreate(BaseModel):
     notes: Optional[str] = None
 
 
-class DrawingSetResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+class DrawingSetDrawing(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+    
+    document_id: int
+    document_number: str
+    title: str
+    revision: Optional[str] = None
+    sequence_number: Optional[int] = None
+    sheet_number: Optional[str] = None
+    notes: Optional[str] = None
+
+
+class DrawingSetResponse(TrustedResponse):
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
     
     id: int
     project_id: str
@@ -292,11 +361,20 @@ class DrawingSetResponse(BaseModel):
     created_by: str
     created_at: datetime
     updated_at: Optional[datetime] = None
-    drawings: List[Dict[str, Any]] = []
+    drawings: List[DrawingSetDrawing] = []
 
 
 # Transmittal schemas
+class CCEntry(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+    
+    name: str
+    email: Optional[str] = None
+
+
 class TransmittalCreate(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+    
     project_id: str
     transmittal_number: str
     subject: str
@@ -304,7 +382,7 @@ class TransmittalCreate(BaseModel):
     to_company: str
     to_attention: Optional[str] = None
     to_email: Optional[str] = None
-    cc_list: Optional[List[Dict[str, str]]] = []
+    cc_list: Optional[List[CCEntry]] = []
     from_company: str
     from_name: str
     from_email: Optional[str] = None
@@ -315,8 +393,8 @@ class TransmittalCreate(BaseModel):
     created_by: str
 
 
-class TransmittalResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
+class TransmittalResponse(TrustedResponse):
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
     
     id: int
     project_id: str
@@ -365,4 +443,4 @@ class BulkDocumentUpdate(BaseModel):
 
 class BulkApproval(BaseModel):
     approval_ids: List[int]
-    decision: ApprovalDecision
\ No newline at end of file
+    decision: ApprovalDecision = Field(discriminator="decision")
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""
+Capitol Engineering Company - Shared Schema Enums
+Choice lists shared by the takeoff and locked takeoff schemas
+"""
+
+from enum import Enum
+
+class LaborMode(str, Enum):
+    auto = "auto"
+    manual = "manual"
+
+class Operation(str, Enum):
+    pressbrake_forming = "Pressbrake Forming"
+    roll_forming = "Roll Forming"
+    saw_cutting = "Saw Cutting"
+    drill_punch = "Drill & Punch"
+    dragon_plasma_cutting = "Dragon Plasma Cutting"
+    beam_line_cutting = "Beam Line Cutting"
+    shearing = "Shearing"
+
+class CoatingSystem(str, Enum):
+    shop_coating = "Shop Coating"
+    epoxy = "Epoxy"
+    powder_coat = "Powder Coat"
+    galvanized = "Galvanized"
+    none = "None"
@@ -2,10 +2,11 @@
 Labor Management Schemas - For operations, coatings, and settings
 """
 
+from __future__ import annotations
+
 from typing import Optional
-from decimal import Decimal
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 from enum import Enum
 
 class OperationType(str, Enum):
@@ -20,7 +21,7 @@ class CoatingType(str, Enum):
 # Labor Operation Schemas
 class LaborOperationBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
-    rate: Decimal = Field(..., ge=Decimal('0'))
+    rate: float = Field(..., ge=0)
     operation_type: OperationType
     description: Optional[str] = Field(None, max_length=255)
     unit_display: str = Field(..., min_length=1, max_length=50)
@@ -31,25 +32,30 @@ class LaborOperationCreate(LaborOperationBase):
 
 class LaborOperationUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
-    rate: Optional[Decimal] = Field(None, ge=Decimal('0'))
+    rate: Optional[float] = Field(None, ge=0)
     operation_type: Optional[OperationType] = None
     description: Optional[str] = Field(None, max_length=255)
     unit_display: Optional[str] = Field(None, min_length=1, max_length=50)
     active: Optional[bool] = None
 
 class LaborOperationResponse(LaborOperationBase):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    @field_serializer("rate")
+    def _round_rate(self, rate: float) -> float:
+        # Operation rates are mostly hours (e.g. 0.0667 per ft), so keep the
+        # four places the column used to store rather than cents
+        return round(rate, 4)
 
 # Coating System Schemas
 class CoatingSystemBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
     coating_type: CoatingType
-    rate: Decimal = Field(..., ge=Decimal('0'))
+    rate: float = Field(..., ge=0)
     description: Optional[str] = Field(None, max_length=255)
     unit_display: str = Field(..., min_length=1, max_length=50)
     active: bool = True
@@ -60,23 +66,26 @@ class CoatingSystemCreate(CoatingSystemBase):
 class CoatingSystemUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     coating_type: Optional[CoatingType] = None
-    rate: Optional[Decimal] = Field(None, ge=Decimal('0'))
+    rate: Optional[float] = Field(None, ge=0)
     description: Optional[str] = Field(None, max_length=255)
     unit_display: Optional[str] = Field(None, min_length=1, max_length=50)
     active: Optional[bool] = None
 
 class CoatingSystemResponse(CoatingSystemBase):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    @field_serializer("rate")
+    def _round_rate(self, rate: float) -> float:
+        return round(rate, 2)  # dollars per unit, to the cent
 
 # Labor Settings Schemas
 class LaborSettingsBase(BaseModel):
     setting_key: str = Field(..., min_length=1, max_length=50)
-    setting_value: Decimal = Field(..., ge=Decimal('0'))
+    setting_value: float = Field(..., ge=0)
     description: Optional[str] = Field(None, max_length=255)
     unit: Optional[str] = Field(None, max_length=20)
 
@@ -84,13 +93,16 @@ class LaborSettingsCreate(LaborSettingsBase):
     pass
 
 class LaborSettingsUpdate(BaseModel):
-    setting_value: Decimal = Field(..., ge=Decimal('0'))
+    setting_value: float = Field(..., ge=0)
     description: Optional[str] = Field(None, max_length=255)
     unit: Optional[str] = Field(None, max_length=20)
 
 class LaborSettingsResponse(LaborSettingsBase):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    @field_serializer("setting_value")
+    def _round_setting_value(self, setting_value: float) -> float:
+        return round(setting_value, 2)  # dollar rates and percentages
\ No newline at end of file
@@ -3,27 +3,14 @@ Capitol Engineering Company - Takeoff Schemas
 Pydantic models for takeoff API requests and responses
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Literal, Sequence
+from dataclasses import dataclass, fields, asdict
 from decimal import Decimal
-from pydantic import BaseModel, Field
+from typing_extensions import TypedDict
+from pydantic import BaseModel, ConfigDict, Field
+from app.schemas.base import TrustedResponse
+from app.schemas.enums import Operation, CoatingSystem
 from datetime import datetime
-from enum import Enum
-
-class Operation(str, Enum):
-    pressbrake_forming = "Pressbrake Forming"
-    roll_forming = "Roll Forming"
-    saw_cutting = "Saw Cutting"
-    drill_punch = "Drill & Punch"
-    dragon_plasma_cutting = "Dragon Plasma Cutting"
-    beam_line_cutting = "Beam Line Cutting"
-    shearing = "Shearing"
-
-class CoatingSystem(str, Enum):
-    shop_coating = "Shop Coating"
-    epoxy = "Epoxy"
-    powder_coat = "Powder Coat"
-    galvanized = "Galvanized"
-    none = "None"
 
 class TakeoffCalculationRequest(BaseModel):
     """Request for real-time takeoff calculation"""
@@ -36,20 +23,23 @@ class TakeoffCalculationRequest(BaseModel):
     unit_price_per_cwt: Optional[float] = Field(None, ge=0, description="Override unit price per CWT")
     calculate_labor: bool = Field(True, description="Include labor calculations")
     labor_mode: Optional[str] = Field("auto", description="Labor calculation mode: auto or manual")
-    operations: Optional[List[Operation]] = Field(default_factory=list, description="Selected labor operations (checkboxes)")
-    coatings_selected: Optional[List[CoatingSystem]] = Field(default_factory=list, description="Selected coating systems (checkboxes)")
+    operations: Optional[Sequence[Operation]] = Field(default_factory=tuple, description="Selected labor operations (checkboxes)")
+    coatings_selected: Optional[Sequence[CoatingSystem]] = Field(default_factory=tuple, description="Selected coating systems (checkboxes)")
     primary_coating: Optional[str] = None
 
-class TakeoffCalculationResponse(BaseModel):
-    """Response from takeoff calculation"""
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TakeoffCalculationResponse:
+    """Response from takeoff calculation. Only ever filled in by the server
+    from the calculation service, so it is a plain dataclass rather than a
+    validating model."""
     # Input values
     qty: int
     shape_key: str
     description: str
     length_ft: float
-    length_in: Optional[float] = 0
-    width_in: Optional[float] = 0
-    thickness_in: Optional[float] = 0
+    length_in: Optional[float] = 0.0
+    width_in: Optional[float] = 0.0
+    thickness_in: Optional[float] = 0.0
     
     # Material properties
     weight_per_ft: float
@@ -74,14 +64,30 @@ class TakeoffCalculationResponse(BaseModel):
     
     # Material validation
     material_confirmed: bool = False
+    
+    @classmethod
+    def from_calculation(cls, calculation: Dict[str, Any]) -> "TakeoffCalculationResponse":
+        """Pick the response fields out of a calculation dict; the service
+        works in Decimal, the response in float"""
+        values = {}
+        for f in fields(cls):
+            if f.name in calculation:
+                value = calculation[f.name]
+                values[f.name] = float(value) if isinstance(value, Decimal) else value
+        return cls(**values)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
 
 class TakeoffEntryBase(BaseModel):
     """Base schema for takeoff entries"""
     qty: int = Field(..., ge=1)
     shape_key: str = Field(..., min_length=1)
-    operations: List[Operation] = Field(default_factory=list, description="Selected labor operations (checkboxes)")
+    # Omitted selections share the empty tuple instead of allocating a list
+    # per instance; they still persist and serialize as []
+    operations: Sequence[Operation] = Field(default_factory=tuple, description="Selected labor operations (checkboxes)")
     primary_coating: Optional[str] = None
-    coatings_selected: List[CoatingSystem] = Field(default_factory=list, description="Selected coating systems (checkboxes)")
+    coatings_selected: Sequence[CoatingSystem] = Field(default_factory=tuple, description="Selected coating systems (checkboxes)")
     description: str = Field("")
     length_ft: float = Field(..., ge=0)
     width_ft: float = Field(0, ge=0)
@@ -103,8 +109,10 @@ class TakeoffEntryUpdate(BaseModel):
     width_ft: Optional[float] = Field(None, ge=0)
     labor_mode: Optional[str] = None
 
-class TakeoffEntryResponse(TakeoffEntryBase):
+class TakeoffEntryResponse(TakeoffEntryBase, TrustedResponse):
     """Schema for takeoff entry responses"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: int
     project_id: str
     
@@ -124,8 +132,8 @@ class TakeoffEntryResponse(TakeoffEntryBase):
     labor_cost: Optional[float] = None
     
     # Labor operations and coatings (from the database)
-    operations: Optional[List[Operation]] = Field(default_factory=list)
-    coatings_selected: Optional[List[CoatingSystem]] = Field(default_factory=list)
+    operations: Optional[Sequence[Operation]] = Field(default_factory=tuple)
+    coatings_selected: Optional[Sequence[CoatingSystem]] = Field(default_factory=tuple)
     primary_coating: Optional[str] = None
     coating_cost: Optional[float] = 0
     notes: Optional[str] = ""
@@ -134,9 +142,30 @@ class TakeoffEntryResponse(TakeoffEntryBase):
     # Timestamps
     created_at: datetime
     updated_at: Optional[datetime] = None
-    
-    class Config:
-        from_attributes = True
+
+class TakeoffGridRow(TypedDict):
+    """One entry as the TakeoffGrid frontend loads it (string id, width in inches)"""
+    id: str
+    qty: int
+    shape_key: str
+    description: str
+    length_ft: float
+    length_in: float
+    width_in: float
+    thickness_in: float
+    weight_per_ft: float
+    total_length_ft: float
+    total_weight_lbs: float
+    total_weight_tons: float
+    unit_price_per_cwt: float
+    total_price: float
+    labor_hours: float
+    labor_cost: float
+    operations: List[str]
+    coatings_selected: List[str]
+    primary_coating: str
+    coating_cost: float
+    notes: str
 
 class ProjectTotalsResponse(BaseModel):
     """Schema for project total calculations"""
@@ -160,13 +189,15 @@ class MaterialSearchResult(BaseModel):
     supplier: str
 
 # Project-related schemas
+ProjectStatus = Literal["active", "inactive", "pending", "completed", "on_hold"]
+
 class TakeoffProjectBase(BaseModel):
     """Base schema for takeoff projects"""
     name: str = Field(..., min_length=1, max_length=255)
     client: str = Field(..., min_length=1, max_length=255)
     location: Optional[str] = Field(None, max_length=255)
     description: Optional[str] = None
-    status: str = Field("active")
+    status: ProjectStatus = Field("active")
 
 class TakeoffProjectCreate(TakeoffProjectBase):
     """Schema for creating projects"""
@@ -181,10 +212,12 @@ class TakeoffProjectUpdate(BaseModel):
     client: Optional[str] = Field(None, min_length=1, max_length=200)
     location: Optional[str] = Field(None, max_length=200)
     description: Optional[str] = None
-    status: Optional[str] = None
+    status: Optional[ProjectStatus] = None
 
 class TakeoffProjectResponse(BaseModel):
     """Schema for project responses"""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: str
     name: str
     client: str  # Maps from client_name in database
@@ -201,9 +234,6 @@ class TakeoffProjectResponse(BaseModel):
     total_entries: int = 0
     total_weight_tons: float = 0
     total_value: float = 0
-    
-    class Config:
-        from_attributes = True
 
 # Proposal generation schemas (Phase 5)
 class ProposalGenerationRequest(BaseModel):
@@ -235,9 +265,41 @@ class ProposalGenerationResponse(BaseModel):
     model_used: Optional[str] = None
 
 # Bulk save schema for project takeoff entries
+class TakeoffSaveRowBase(BaseModel):
+    """Fields shared by the bulk-save row schemas, as calculated by the
+    frontend grid. Defaults match the takeoff_entries column defaults."""
+    qty: Optional[int] = 1
+    shape_key: Optional[str] = ""
+    description: Optional[str] = ""
+    length_ft: Optional[float] = 0.0
+    weight_per_ft: Optional[float] = 0.0
+    total_length_ft: Optional[float] = 0.0
+    total_weight_lbs: Optional[float] = 0.0
+    total_weight_tons: Optional[float] = 0.0
+    unit_price_per_cwt: Optional[float] = 0.0
+    total_price: Optional[float] = 0.0
+    labor_hours: Optional[float] = 0.0
+    labor_rate: Optional[float] = 75.0
+    labor_cost: Optional[float] = 0.0
+    labor_mode: Optional[str] = "auto"
+    notes: Optional[str] = ""
+
+class ProjectTakeoffSaveEntry(TakeoffSaveRowBase):
+    """One row of a project takeoff save (width in inches)"""
+    width_in: Optional[float] = None
+
+class TakeoffSaveEntry(TakeoffSaveRowBase):
+    """One TakeoffGrid row sent to the takeoff save route (width already in feet)"""
+    width_ft: Optional[float] = 0.0
+    thickness_in: Optional[float] = 0.0
+    operations: Optional[List[str]] = Field(default_factory=list)
+    coatings_selected: Optional[List[str]] = Field(default_factory=list)
+    primary_coating: Optional[str] = ""
+    coating_cost: Optional[float] = 0.0
+
 class ProjectTakeoffSaveRequest(BaseModel):
     """Request schema for bulk saving project takeoff entries"""
-    entries: List[dict] = Field(..., description="List of takeoff entries to save")
+    entries: List[ProjectTakeoffSaveEntry] = Field(..., description="List of takeoff entries to save")
     totals: dict = Field(..., description="Calculated project totals")
 
 class ProjectTakeoffSaveResponse(BaseModel):
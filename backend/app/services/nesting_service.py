@@ -1,14 +1,18 @@
 """
 Capitol Engineering Company - Material Nesting & Optimization Service
 Simple, proven nesting algorithm based on working VBS macro
+All lengths, areas and costs are plain floats (inches, square inches, dollars)
 """
 
-from typing import Dict, List, Any, Optional
-from decimal import Decimal
-from dataclasses import dataclass
-import math
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from sortedcontainers import SortedList
+import logging
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True)
 class MaterialPurchase:
     shape_key: str
     size_description: str
@@ -17,16 +21,10 @@ class MaterialPurchase:
     waste_percentage: float
     waste_cost: float = 0.0
     stock_length: float = 0.0
-    cuts_per_stick: List[float] = None
-    cuts_from_this_size: List[float] = None
-    
-    def __post_init__(self):
-        if self.cuts_per_stick is None:
-            self.cuts_per_stick = []
-        if self.cuts_from_this_size is None:
-            self.cuts_from_this_size = []
+    cuts_per_stick: List[float] = field(default_factory=list)
+    cuts_from_this_size: List[float] = field(default_factory=list)
 
-@dataclass 
+@dataclass(slots=True)
 class NestingResult:
     material_purchases: List[MaterialPurchase]
     total_waste_percentage: float
@@ -34,6 +32,20 @@ class NestingResult:
     cost_savings: float
     optimization_summary: str
 
+@lru_cache(maxsize=4096)
+def _best_plate_fit(plate_stock: Tuple[Tuple[float, float, float], ...], width: float, length: float) -> Tuple[Tuple[float, float], float]:
+    """Best fitting stock sheet for a plate and the waste it leaves. Plate
+    sizes repeat across entries and projects, so the search is memoized."""
+    piece_area: float = width * length
+    for stock_width, stock_length, stock_area in plate_stock:
+        # Check if piece fits
+        if (width <= stock_width and length <= stock_length) or \
+           (width <= stock_length and length <= stock_width):
+            return (stock_width, stock_length), stock_area - piece_area
+    
+    # Default to largest sheet
+    return (96, 240), (96 * 240) - piece_area
+
 class NestingService:
     def __init__(self):
         # Standard stock lengths in inches (from VBS: 720, 600, 480, 360, 240, 120)
@@ -44,18 +56,36 @@ class NestingService:
             (48, 96), (48, 120), (60, 120), (60, 96), (48, 144), 
             (60, 144), (96, 96), (96, 240), (120, 480), (96, 480), (72, 144)
         ]
+        # Stock sheets smallest area first (stable, so equal areas keep the
+        # order above): the first sheet a plate fits on is then the one that
+        # leaves the least waste, and the search can stop there
+        self._plate_stock = tuple(sorted(
+            ((w, l, w * l) for w, l in self.standard_plate_sizes),
+            key=lambda sheet: sheet[2]
+        ))
 
     def optimize_project_materials(self, takeoff_entries: List[Dict[str, Any]], project_id: str) -> NestingResult:
         """Main optimization function using the proven VBS algorithm"""
         try:
-            print(f"Starting nesting optimization for project {project_id}")
+            logger.debug("Starting nesting optimization for project %s", project_id)
             
             # Separate linear materials from plates
             linear_materials = {}
             plate_materials = {}
             
+            # Normalized key and plate check, worked out once per distinct
+            # raw shape key: a project repeats a handful of shapes, and their
+            # entries then share one key string for the dict lookups below
+            shapes = {}
+            
             for entry in takeoff_entries:
-                shape_key = entry.get('shape_key', '').upper().strip()
+                raw_key = entry.get('shape_key', '')
+                shape = shapes.get(raw_key)
+                if shape is None:
+                    shape_key = raw_key.upper().strip()
+                    # Check if it's a plate (starts with PL or has DUCT)
+                    shape = shapes[raw_key] = (shape_key, shape_key.startswith('PL') or 'DUCT' in shape_key)
+                shape_key, is_plate = shape
                 if not shape_key:
                     continue
                     
@@ -63,11 +93,10 @@ class NestingService:
                 if qty <= 0:
                     continue
                 
-                # Check if it's a plate (starts with PL or has DUCT)
-                if shape_key.startswith('PL') or 'DUCT' in shape_key:
-                    self._process_plate_entry(entry, plate_materials)
+                if is_plate:
+                    self._process_plate_entry(entry, shape_key, qty, plate_materials)
                 else:
-                    self._process_linear_entry(entry, linear_materials)
+                    self._process_linear_entry(entry, shape_key, qty, linear_materials)
             
             # Process linear materials
             linear_purchases = []
@@ -88,9 +117,14 @@ class NestingService:
             if not all_purchases:
                 return NestingResult([], 0.0, 0.0, 0.0, "No materials to optimize")
             
-            # Calculate totals
-            total_cost = sum(p.total_cost for p in all_purchases)
-            total_waste = sum(p.waste_percentage * p.total_cost for p in all_purchases) / total_cost if total_cost > 0 else 0
+            # Calculate totals: cost, and waste weighted by cost, in one pass
+            total_cost = 0.0
+            weighted_waste = 0.0
+            for p in all_purchases:
+                cost = p.total_cost
+                total_cost += cost
+                weighted_waste += p.waste_percentage * cost
+            total_waste = weighted_waste / total_cost if total_cost > 0 else 0
             
             summary = f"Optimized {len(linear_purchases)} linear materials and {len(plate_purchases)} plate materials"
             
@@ -103,38 +137,33 @@ class NestingService:
             )
             
         except Exception as e:
-            print(f"Nesting optimization error: {str(e)}")
-            raise ValueError(f"Nesting optimization failed: {str(e)}")
+            logger.exception("Nesting optimization failed for project %s", project_id)
+            raise ValueError(f"Nesting optimization failed: {str(e)}") from e
 
-    def _process_linear_entry(self, entry: Dict[str, Any], linear_materials: Dict[str, List[float]]):
-        """Process linear material entry (beams, tubes, etc.)"""
-        shape_key = entry.get('shape_key', '').upper().strip()
-        qty = int(entry.get('qty', 0))
+    def _process_linear_entry(self, entry: Dict[str, Any], shape_key: str, qty: int, linear_materials: Dict[str, Dict[float, int]]):
+        """Process linear material entry (beams, tubes, etc.); shape_key and
+        qty come already normalized and checked by the caller"""
         ft = float(entry.get('length_ft', 0))
         inches = float(entry.get('length_in', 0))
         
-        if qty <= 0 or (ft == 0 and inches == 0):
+        if ft == 0 and inches == 0:
             return
             
         # Convert to total inches
-        cut_length = (ft * 12) + inches
+        cut_length: float = (ft * 12) + inches
         
-        if shape_key not in linear_materials:
-            linear_materials[shape_key] = []
-            
-        # Add each piece individually
-        for _ in range(qty):
-            linear_materials[shape_key].append(cut_length)
+        # Count pieces per cut length rather than listing each one
+        cut_counts = linear_materials.setdefault(shape_key, {})
+        cut_counts[cut_length] = cut_counts.get(cut_length, 0) + qty
 
-    def _process_plate_entry(self, entry: Dict[str, Any], plate_materials: Dict[str, Dict]):
-        """Process plate material entry"""
-        shape_key = entry.get('shape_key', '').upper().strip()
-        qty = int(entry.get('qty', 0))
+    def _process_plate_entry(self, entry: Dict[str, Any], shape_key: str, qty: int, plate_materials: Dict[tuple, Dict]):
+        """Process plate material entry; shape_key and qty come already
+        normalized and checked by the caller"""
         width = float(entry.get('width_in', 0))
         ft = float(entry.get('length_ft', 0))
         inches = float(entry.get('length_in', 0))
         
-        if qty <= 0 or width == 0:
+        if width == 0:
             return
             
         length = (ft * 12) + inches
@@ -142,7 +171,7 @@ class NestingService:
             return
             
         # Create unique key for each plate size
-        plate_key = f"{shape_key}|{width}|{length}"
+        plate_key = (shape_key, width, length)
         
         if plate_key in plate_materials:
             plate_materials[plate_key]['qty'] += qty
@@ -154,40 +183,30 @@ class NestingService:
                 'qty': qty
             }
 
-    def _optimize_linear_material(self, material: str, cuts: List[float]) -> Optional[MaterialPurchase]:
-        """Optimize linear material using greedy bin packing (from VBS macro)"""
+    def _optimize_linear_material(self, material: str, cuts: Dict[float, int]) -> Optional[MaterialPurchase]:
+        """Optimize linear material using best-fit decreasing bin packing;
+        cuts maps each cut length to how many pieces need it"""
         if not cuts:
             return None
             
-        # Sort cuts by length, largest first (greedy approach)
+        # Sort cut lengths, largest first (greedy approach)
         sorted_cuts = sorted(cuts, reverse=True)
         
-        # Use largest standard stock length (720" = 60')
+        # Try every standard stock length the longest cut fits in and buy
+        # the one needing the least total length; fall back to the largest
+        # (720" = 60') when a cut is longer than all of them
         stock_length = self.standard_stock_lengths[0]  # 720"
-        
-        # Bin packing algorithm
-        sticks = []  # Each stick tracks remaining space
-        stick_cuts = []  # Track what cuts are on each stick
-        
-        for cut_length in sorted_cuts:
-            placed = False
-            
-            # Try to place in existing stick
-            for i, remaining_space in enumerate(sticks):
-                if remaining_space >= cut_length:
-                    sticks[i] -= cut_length
-                    stick_cuts[i].append(cut_length)
-                    placed = True
-                    break
-            
-            # If can't fit in existing stick, start new one
-            if not placed:
-                sticks.append(stock_length - cut_length)
-                stick_cuts.append([cut_length])
+        best = None
+        for candidate in self.standard_stock_lengths:
+            if candidate < sorted_cuts[0]:
+                continue
+            packed = self._pack_linear(cuts, sorted_cuts, candidate)
+            if best is None or len(packed[0]) * candidate < len(best[0]) * stock_length:
+                stock_length, best = candidate, packed
+        stick_cuts, total_used = best or self._pack_linear(cuts, sorted_cuts, stock_length)
         
         # Calculate metrics
-        num_sticks = len(sticks)
-        total_used = sum(sum(cuts_on_stick) for cuts_on_stick in stick_cuts)
+        num_sticks = len(stick_cuts)
         total_available = num_sticks * stock_length
         total_waste = total_available - total_used
         
@@ -195,14 +214,18 @@ class NestingService:
         waste_percentage = (total_waste / total_available) * 100 if total_available > 0 else 0
         
         # Estimate cost (placeholder - could be enhanced with real pricing)
-        cost_per_stick = 100.0  # $100 per stick placeholder
+        # $100 per 60' stick placeholder, pro-rated so every stock length
+        # costs the same per foot
+        cost_per_stick = 100.0 * stock_length / 720
         total_cost = num_sticks * cost_per_stick
         waste_cost = (total_waste / stock_length) * cost_per_stick if stock_length > 0 else 0
         
-        # Flatten all cuts for cuts_from_this_size
+        # Every cut for cuts_from_this_size, longest first: the same pieces
+        # as the sticks hold, expanded from the counts rather than gathered
+        # back out of every stick
         all_cuts = []
-        for cuts_on_stick in stick_cuts:
-            all_cuts.extend(cuts_on_stick)
+        for cut_length in sorted_cuts:
+            all_cuts += [cut_length] * cuts[cut_length]
         
         return MaterialPurchase(
             shape_key=material,
@@ -216,7 +239,51 @@ class NestingService:
             cuts_from_this_size=all_cuts
         )
 
-    def _optimize_plate_material(self, plate_key: str, plate_data: Dict) -> Optional[MaterialPurchase]:
+    def _pack_linear(self, cuts: Dict[float, int], sorted_cuts: List[float], stock_length: float) -> Tuple[List[List[float]], float]:
+        """Pack the cuts onto sticks of one stock length; returns the cuts on
+        each stick and their total length"""
+        # Bin packing algorithm: best fit, putting each cut on the stick with
+        # the least remaining space that still holds it. Sticks are kept
+        # sorted as (remaining space, stick index), so that stick is one
+        # bisect away; ties go to the oldest stick.
+        # A stick with less room than the smallest cut can never take
+        # another one, so it is dropped from the list instead of re-added;
+        # that keeps the list to the sticks still worth searching.
+        sticks = SortedList()
+        find_stick, take_stick, put_stick = sticks.bisect_left, sticks.pop, sticks.add
+        stick_cuts = []  # Track what cuts are on each stick
+        total_used = 0.0  # Length of all cuts placed so far
+        smallest_cut = sorted_cuts[-1]
+        
+        # Once a stick is the best fit for a length it stays the best fit for
+        # further pieces of that length until it is full, so each visit
+        # places as many pieces as the stick holds
+        for cut_length in sorted_cuts:
+            count = cuts[cut_length]
+            while count:
+                i = find_stick((cut_length, -1))
+                if i < len(sticks):
+                    remaining_space, stick = take_stick(i)
+                else:
+                    # Can't fit in an existing stick, start new one
+                    remaining_space, stick = stock_length, len(stick_cuts)
+                    stick_cuts.append([])
+                # The first piece always goes on (it fits, or the stick is new,
+                # for cuts longer than the stock); the rest while they fit
+                remaining_space -= cut_length
+                pieces = 1
+                while pieces < count and remaining_space >= cut_length:
+                    remaining_space -= cut_length
+                    pieces += 1
+                stick_cuts[stick].extend([cut_length] * pieces)
+                total_used += pieces * cut_length
+                count -= pieces
+                if remaining_space >= smallest_cut:
+                    put_stick((remaining_space, stick))
+        
+        return stick_cuts, total_used
+
+    def _optimize_plate_material(self, plate_key: tuple, plate_data: Dict) -> Optional[MaterialPurchase]:
         """Optimize plate material by finding best fitting standard sheet"""
         material = plate_data['material']
         width = plate_data['width']
@@ -224,26 +291,10 @@ class NestingService:
         qty = plate_data['qty']
         
         # Calculate area of single piece
-        piece_area = width * length  # square inches
+        piece_area: float = width * length  # square inches
         
         # Find best fitting stock sheet
-        best_fit = None
-        best_waste = float('inf')
-        
-        for stock_width, stock_length in self.standard_plate_sizes:
-            stock_area = stock_width * stock_length
-            
-            # Check if piece fits
-            if (width <= stock_width and length <= stock_length) or \
-               (width <= stock_length and length <= stock_width):
-                waste = stock_area - piece_area
-                if waste < best_waste:
-                    best_waste = waste
-                    best_fit = (stock_width, stock_length)
-        
-        if not best_fit:
-            best_fit = (96, 240)  # Default to largest sheet
-            best_waste = (96 * 240) - piece_area
+        best_fit, best_waste = _best_plate_fit(self._plate_stock, width, length)
         
         # Calculate metrics
         stock_area = best_fit[0] * best_fit[1]
@@ -1,7 +1,8 @@
 
 from __future__ import annotations
 
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from decimal import Decimal
 
 # ======= Constants from your spreadsheet =======
@@ -33,6 +34,21 @@ COATING_SYSTEMS = {
     "None": {"type": "none", "rate": Decimal("0")},
 }
 
+@lru_cache(maxsize=256)
+def _coating_plan(coatings_selected: Tuple[str, ...], primary: Optional[str]) -> Tuple[tuple, ...]:
+    """
+    Resolve a coating selection to (name, type, rate) triples.
+    Depends only on the selection, which repeats across most rows of a
+    project, so it is memoized; costs are still computed per row.
+    """
+    if coatings_selected:
+        names = [c for c in coatings_selected if c in COATING_SYSTEMS]
+    elif primary and primary in COATING_SYSTEMS:
+        names = [primary]
+    else:
+        names = []
+    return tuple((name, COATING_SYSTEMS[name]["type"], COATING_SYSTEMS[name]["rate"]) for name in names)
+
 class TakeoffCalculationService:
     """
     Service that performs material, labor, and coating calculations.
@@ -203,12 +219,7 @@ class TakeoffCalculationService:
         details: Dict[str, Any] = {}
 
         # Determine selection list - only primary coating, no secondary
-        selection: List[str] = []
-        if coatings_selected:
-            selection = [c for c in coatings_selected if c in COATING_SYSTEMS]
-        else:
-            if primary and primary in COATING_SYSTEMS:
-                selection.append(primary)
+        selection = _coating_plan(tuple(coatings_selected or ()), primary)
 
         qty_dec = Decimal(str(qty))
         length_ft_dec = Decimal(str(length_ft))
@@ -224,15 +235,14 @@ class TakeoffCalculationService:
 
         weight_lbs = total_weight_lbs or Decimal("0")
 
-        for coat in selection:
-            system = COATING_SYSTEMS.get(coat, {"type": "none", "rate": Decimal("0")})
-            if system["type"] == "area":
-                cost = sqft_proxy * system["rate"]
-                applied[coat] = {"type": "area", "sqft": sqft_proxy, "rate": system["rate"], "cost": cost}
+        for coat, coat_type, rate in selection:
+            if coat_type == "area":
+                cost = sqft_proxy * rate
+                applied[coat] = {"type": "area", "sqft": sqft_proxy, "rate": rate, "cost": cost}
                 total_cost += cost
-            elif system["type"] == "weight":
-                cost = weight_lbs * system["rate"]
-                applied[coat] = {"type": "weight", "lbs": weight_lbs, "rate": system["rate"], "cost": cost}
+            elif coat_type == "weight":
+                cost = weight_lbs * rate
+                applied[coat] = {"type": "weight", "lbs": weight_lbs, "rate": rate, "cost": cost}
                 total_cost += cost
             else:
                 applied[coat] = {"type": "none", "cost": Decimal("0")}
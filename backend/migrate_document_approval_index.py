@@ -0,0 +1,36 @@
+"""
+Migration script to add the (document_id, status) index on document_approvals
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+# Add the app directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+def migrate_database():
+    """Create ix_approval_doc_status if it doesn't exist"""
+    
+    database_url = os.getenv("DATABASE_URL", "sqlite:///./capitol_takeoff.db")
+    engine = create_engine(database_url)
+    
+    print("Starting document approval index migration...")
+    
+    try:
+        with engine.begin() as conn:
+            print("Creating index ix_approval_doc_status...")
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_approval_doc_status ON document_approvals (document_id, status)"
+            ))
+            
+            print("Migration completed successfully!")
+            
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        return False
+        
+    return True
+
+if __name__ == "__main__":
+    migrate_database()
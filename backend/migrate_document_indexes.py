@@ -0,0 +1,43 @@
+"""
+Migration script to add composite indexes for the document list and search filters
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+# Add the app directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+DOCUMENT_INDEXES = [
+    ("ix_documents_project_latest_status", "documents", "project_id, is_latest, status"),
+    ("ix_documents_project_type", "documents", "project_id, document_type"),
+    ("ix_documents_created_at", "documents", "created_at"),
+    ("ix_document_revisions_doc_revnum", "document_revisions", "document_id, revision_number"),
+    ("ix_document_distributions_doc_sent", "document_distributions", "document_id, sent_at"),
+]
+
+def migrate_database():
+    """Create the document indexes if they don't exist"""
+    
+    database_url = os.getenv("DATABASE_URL", "sqlite:///./capitol_takeoff.db")
+    engine = create_engine(database_url)
+    
+    print("Starting document index migration...")
+    
+    try:
+        with engine.begin() as conn:
+            for index_name, table, columns in DOCUMENT_INDEXES:
+                print(f"Creating index {index_name}...")
+                conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({columns})"))
+            
+            print("Migration completed successfully!")
+            
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        return False
+        
+    return True
+
+if __name__ == "__main__":
+    migrate_database()
@@ -0,0 +1,53 @@
+"""
+Migration script to move takeoff/template JSON columns to JSONB with
+database-side defaults (PostgreSQL only)
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+# Add the app directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# table -> [(column, default literal)]
+JSON_DEFAULTS = {
+    "takeoff_projects": [("project_metadata", "{}")],
+    "takeoff_entries": [("operations", "[]"), ("coatings_selected", "[]")],
+    "templates": [("items", "[]"), ("calculator_settings", "{}")],
+}
+
+def migrate_database():
+    """Cast JSON columns to JSONB and set their server defaults"""
+    
+    database_url = os.getenv("DATABASE_URL", "sqlite:///./capitol_takeoff.db")
+    if not database_url.startswith("postgresql"):
+        print("JSON defaults migration only applies to PostgreSQL - nothing to do")
+        return True
+    
+    engine = create_engine(database_url)
+    
+    print("Starting JSON defaults migration...")
+    
+    try:
+        with engine.begin() as conn:
+            for table, columns in JSON_DEFAULTS.items():
+                for column, default in columns:
+                    print(f"Updating {table}.{column}...")
+                    conn.execute(text(
+                        f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb"
+                    ))
+                    conn.execute(text(
+                        f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'"
+                    ))
+            
+            print("Migration completed successfully!")
+            
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        return False
+        
+    return True
+
+if __name__ == "__main__":
+    migrate_database()
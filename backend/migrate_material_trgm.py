@@ -0,0 +1,47 @@
+"""
+Migration script to add trigram indexes for material substring search
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+# Add the app directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+TRGM_INDEXES = [
+    ("ix_material_shape_key_trgm", "shape_key"),
+    ("ix_material_type_trgm", "material_type"),
+]
+
+def migrate_database():
+    """Enable pg_trgm and create the GIN trigram indexes"""
+    
+    database_url = os.getenv("DATABASE_URL", "sqlite:///./capitol_takeoff.db")
+    if not database_url.startswith("postgresql"):
+        print("Trigram index migration only applies to PostgreSQL - nothing to do")
+        return True
+    
+    engine = create_engine(database_url)
+    
+    print("Starting trigram index migration...")
+    
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            for index_name, column in TRGM_INDEXES:
+                print(f"Creating trigram index {index_name}...")
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS {index_name} ON materials USING gin ({column} gin_trgm_ops)"
+                ))
+            
+            print("Migration completed successfully!")
+            
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        return False
+        
+    return True
+
+if __name__ == "__main__":
+    migrate_database()
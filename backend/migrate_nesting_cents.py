@@ -0,0 +1,89 @@
+"""
+Migration script to convert nesting Numeric(10,2) money columns to integer
+cents (<column> -> <column>_cents)
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+# Add the app directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# table -> [(column, integer type)]
+CENTS_COLUMNS = {
+    "standard_material_sizes": [
+        ("cost_per_unit", "INTEGER"),
+        ("cost_per_foot", "INTEGER"),
+        ("cost_per_sqft", "INTEGER"),
+    ],
+    "nesting_optimizations": [
+        ("total_material_cost", "BIGINT"),
+        ("total_waste_cost", "BIGINT"),
+        ("cost_savings", "BIGINT"),
+    ],
+    "material_purchase_recommendations": [
+        ("total_cost", "INTEGER"),
+        ("unit_cost", "INTEGER"),
+        ("waste_cost", "INTEGER"),
+        ("supplier_quote", "INTEGER"),
+    ],
+    "material_waste_analysis": [
+        ("waste_cost", "INTEGER"),
+        ("usable_drops_value", "INTEGER"),
+        ("scrap_value", "INTEGER"),
+        ("potential_savings", "INTEGER"),
+    ],
+}
+
+def migrate_database():
+    """Rename each money column to <column>_cents and scale dollars to cents"""
+    
+    database_url = os.getenv("DATABASE_URL", "sqlite:///./capitol_takeoff.db")
+    is_postgres = database_url.startswith("postgresql")
+    engine = create_engine(database_url)
+    
+    print("Starting integer cents migration...")
+    
+    try:
+        with engine.begin() as conn:
+            for table, columns in CENTS_COLUMNS.items():
+                for column, int_type in columns:
+                    print(f"Converting {table}.{column} to {column}_cents...")
+                    if is_postgres:
+                        conn.execute(text(
+                            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {int_type} "
+                            f"USING round({column} * 100)::{int_type.lower()}"
+                        ))
+                        conn.execute(text(
+                            f"ALTER TABLE {table} RENAME COLUMN {column} TO {column}_cents"
+                        ))
+                    else:
+                        # SQLite stores NUMERIC with integer affinity already;
+                        # rename then rescale the stored values
+                        conn.execute(text(
+                            f"ALTER TABLE {table} RENAME COLUMN {column} TO {column}_cents"
+                        ))
+                        conn.execute(text(
+                            f"UPDATE {table} SET {column}_cents = CAST(ROUND({column}_cents * 100) AS INTEGER)"
+                        ))
+            
+            if is_postgres:
+                # The covering index INCLUDEs the renamed column; rebuild it
+                print("Rebuilding ix_mpr_opt_priority...")
+                conn.execute(text("DROP INDEX IF EXISTS ix_mpr_opt_priority"))
+                conn.execute(text(
+                    "CREATE INDEX ix_mpr_opt_priority ON material_purchase_recommendations "
+                    "(optimization_id, priority, purchase_status) INCLUDE (total_cost_cents, waste_percentage)"
+                ))
+            
+            print("Migration completed successfully!")
+            
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        return False
+        
+    return True
+
+if __name__ == "__main__":
+    migrate_database()
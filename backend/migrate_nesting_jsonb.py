@@ -0,0 +1,60 @@
+"""
+Migration script to convert nesting JSON columns to JSONB (PostgreSQL only)
+and add GIN indexes on the searched JSON columns
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+# Add the app directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+JSONB_COLUMNS = {
+    "nesting_optimizations": ["recommendations", "algorithm_details"],
+    "material_waste_analysis": ["drops_data", "alternative_sizes_considered", "optimization_suggestions"],
+    "nesting_patterns": ["cuts_list"],
+}
+
+GIN_INDEXES = [
+    ("ix_pattern_cuts_gin", "nesting_patterns", "cuts_list"),
+    ("ix_waste_drops_gin", "material_waste_analysis", "drops_data"),
+]
+
+def migrate_database():
+    """Cast nesting JSON columns to JSONB in place"""
+    
+    database_url = os.getenv("DATABASE_URL", "sqlite:///./capitol_takeoff.db")
+    if not database_url.startswith("postgresql"):
+        print("JSONB migration only applies to PostgreSQL - nothing to do")
+        return True
+    
+    engine = create_engine(database_url)
+    
+    print("Starting JSONB migration...")
+    
+    try:
+        with engine.begin() as conn:
+            for table, columns in JSONB_COLUMNS.items():
+                for column in columns:
+                    print(f"Converting {table}.{column} to JSONB...")
+                    conn.execute(text(
+                        f"ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb"
+                    ))
+            
+            for index_name, table, column in GIN_INDEXES:
+                print(f"Creating GIN index {index_name}...")
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} USING gin ({column})"
+                ))
+            
+            print("Migration completed successfully!")
+            
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        return False
+        
+    return True
+
+if __name__ == "__main__":
+    migrate_database()
@@ -0,0 +1,62 @@
+"""
+Migration script to re-encode bulky nesting JSON payloads as MessagePack
+blobs (cuts_data, cutting_pattern, waste_pieces)
+"""
+
+import os
+import sys
+import json
+import msgpack
+from sqlalchemy import create_engine, text
+
+# Add the app directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+MSGPACK_COLUMNS = {
+    "material_purchase_recommendations": ["cuts_data"],
+    "nesting_patterns": ["cutting_pattern", "waste_pieces"],
+}
+
+def migrate_database():
+    """Copy each JSON column into a new binary column, then swap them"""
+    
+    database_url = os.getenv("DATABASE_URL", "sqlite:///./capitol_takeoff.db")
+    is_postgres = database_url.startswith("postgresql")
+    blob_type = "BYTEA" if is_postgres else "BLOB"
+    engine = create_engine(database_url)
+    
+    print("Starting MessagePack migration...")
+    
+    try:
+        with engine.begin() as conn:
+            for table, columns in MSGPACK_COLUMNS.items():
+                for column in columns:
+                    print(f"Re-encoding {table}.{column}...")
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column}_msgpack {blob_type}"))
+                    
+                    rows = conn.execute(text(
+                        f"SELECT id, {column} FROM {table} WHERE {column} IS NOT NULL"
+                    )).all()
+                    for row_id, value in rows:
+                        # JSONB comes back decoded; SQLite JSON comes back as text
+                        if isinstance(value, str):
+                            value = json.loads(value)
+                        conn.execute(
+                            text(f"UPDATE {table} SET {column}_msgpack = :packed WHERE id = :id"),
+                            {"packed": msgpack.packb(value, use_bin_type=True), "id": row_id}
+                        )
+                    
+                    conn.execute(text(f"ALTER TABLE {table} DROP COLUMN {column}"))
+                    conn.execute(text(f"ALTER TABLE {table} RENAME COLUMN {column}_msgpack TO {column}"))
+                    print(f"  {len(rows)} rows converted")
+            
+            print("Migration completed successfully!")
+            
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        return False
+        
+    return True
+
+if __name__ == "__main__":
+    migrate_database()
@@ -0,0 +1,47 @@
+"""
+Migration script to add partial indexes for the hot nesting filters
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+# Add the app directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+PARTIAL_INDEXES = [
+    ("ix_nopt_active", "nesting_optimizations", "project_id",
+     "is_active AND status = 'completed'"),
+    ("ix_mpr_recommended", "material_purchase_recommendations", "optimization_id, priority",
+     "purchase_status = 'recommended'"),
+    ("ix_pattern_pending", "nesting_patterns", "optimization_id",
+     "NOT cutting_completed"),
+]
+
+def migrate_database():
+    """Create the partial indexes if they don't exist"""
+    
+    # PostgreSQL and SQLite both support CREATE INDEX ... WHERE
+    database_url = os.getenv("DATABASE_URL", "sqlite:///./capitol_takeoff.db")
+    engine = create_engine(database_url)
+    
+    print("Starting partial index migration...")
+    
+    try:
+        with engine.begin() as conn:
+            for index_name, table, columns, predicate in PARTIAL_INDEXES:
+                print(f"Creating partial index {index_name}...")
+                conn.execute(text(
+                    f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({columns}) WHERE {predicate}"
+                ))
+            
+            print("Migration completed successfully!")
+            
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        return False
+        
+    return True
+
+if __name__ == "__main__":
+    migrate_database()
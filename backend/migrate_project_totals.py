@@ -0,0 +1,72 @@
+"""
+Migration script to add cached entry aggregates to takeoff_projects and
+backfill them from takeoff_entries
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text, inspect
+
+# Add the app directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+NEW_COLUMNS = [
+    ("cached_entries_count", "INTEGER NOT NULL DEFAULT 0"),
+    ("cached_total_price_cents", "BIGINT NOT NULL DEFAULT 0"),
+    ("cached_total_weight_tons", "FLOAT NOT NULL DEFAULT 0"),
+]
+
+BACKFILL = """
+UPDATE takeoff_projects SET
+    cached_entries_count = (
+        SELECT count(*) FROM takeoff_entries WHERE takeoff_entries.project_id = takeoff_projects.id),
+    cached_total_price_cents = (
+        SELECT CAST(round(coalesce(sum(total_price), 0) * 100) AS BIGINT)
+        FROM takeoff_entries WHERE takeoff_entries.project_id = takeoff_projects.id),
+    cached_total_weight_tons = (
+        SELECT coalesce(sum(total_weight_tons), 0)
+        FROM takeoff_entries WHERE takeoff_entries.project_id = takeoff_projects.id)
+"""
+
+def migrate_database():
+    """Add the cached_* columns and the entry covering index, then backfill"""
+    
+    database_url = os.getenv("DATABASE_URL", "sqlite:///./capitol_takeoff.db")
+    engine = create_engine(database_url)
+    
+    print("Starting project totals migration...")
+    
+    try:
+        existing = {col["name"] for col in inspect(engine).get_columns("takeoff_projects")}
+        with engine.begin() as conn:
+            for column, ddl in NEW_COLUMNS:
+                if column in existing:
+                    print(f"Column {column} already exists - skipping")
+                    continue
+                print(f"Adding takeoff_projects.{column}...")
+                conn.execute(text(f"ALTER TABLE takeoff_projects ADD COLUMN {column} {ddl}"))
+            
+            print("Creating ix_entry_project_shape...")
+            if database_url.startswith("postgresql"):
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_entry_project_shape ON takeoff_entries "
+                    "(project_id, shape_key) INCLUDE (total_price, total_weight_tons)"
+                ))
+            else:
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_entry_project_shape ON takeoff_entries (project_id, shape_key)"
+                ))
+            
+            print("Backfilling cached totals...")
+            conn.execute(text(BACKFILL))
+            
+            print("Migration completed successfully!")
+            
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        return False
+        
+    return True
+
+if __name__ == "__main__":
+    migrate_database()
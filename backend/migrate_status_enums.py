@@ -0,0 +1,86 @@
+"""
+Migration script to convert low-cardinality status columns to native ENUM
+types (PostgreSQL only)
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+# Add the app directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+ENUM_TYPES = {
+    "size_availability": ("standard", "special_order", "unavailable"),
+    "nopt_status": ("pending", "running", "completed", "failed"),
+    "purchase_priority": ("critical", "high", "normal", "low"),
+    "purchase_status": ("recommended", "ordered", "delivered"),
+    "cutting_complexity": ("simple", "moderate", "complex"),
+    "user_role": ("admin", "estimator", "viewer"),
+}
+
+ENUM_COLUMNS = [
+    ("standard_material_sizes", "availability", "size_availability"),
+    ("nesting_optimizations", "status", "nopt_status"),
+    ("material_purchase_recommendations", "priority", "purchase_priority"),
+    ("material_purchase_recommendations", "purchase_status", "purchase_status"),
+    ("nesting_patterns", "cutting_complexity", "cutting_complexity"),
+    ("users", "role", "user_role"),
+]
+
+# Partial indexes whose predicates compare these columns to string literals;
+# they are dropped before the type change and rebuilt against the enum
+PARTIAL_INDEXES = [
+    ("ix_nopt_active", "nesting_optimizations", "project_id",
+     "is_active AND status = 'completed'"),
+    ("ix_mpr_recommended", "material_purchase_recommendations", "optimization_id, priority",
+     "purchase_status = 'recommended'"),
+]
+
+def migrate_database():
+    """Create the enum types and cast the existing VARCHAR columns"""
+    
+    database_url = os.getenv("DATABASE_URL", "sqlite:///./capitol_takeoff.db")
+    if not database_url.startswith("postgresql"):
+        print("Enum migration only applies to PostgreSQL - nothing to do")
+        return True
+    
+    engine = create_engine(database_url)
+    
+    print("Starting status enum migration...")
+    
+    try:
+        with engine.begin() as conn:
+            for index_name, _, _, _ in PARTIAL_INDEXES:
+                conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+            
+            for type_name, values in ENUM_TYPES.items():
+                print(f"Creating type {type_name}...")
+                labels = ", ".join(f"'{value}'" for value in values)
+                conn.execute(text(
+                    f"DO $$ BEGIN CREATE TYPE {type_name} AS ENUM ({labels}); "
+                    f"EXCEPTION WHEN duplicate_object THEN NULL; END $$"
+                ))
+            
+            for table, column, type_name in ENUM_COLUMNS:
+                print(f"Converting {table}.{column} to {type_name}...")
+                conn.execute(text(
+                    f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} USING {column}::{type_name}"
+                ))
+            
+            for index_name, table, columns, predicate in PARTIAL_INDEXES:
+                print(f"Rebuilding partial index {index_name}...")
+                conn.execute(text(
+                    f"CREATE INDEX {index_name} ON {table} ({columns}) WHERE {predicate}"
+                ))
+            
+            print("Migration completed successfully!")
+            
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        return False
+        
+    return True
+
+if __name__ == "__main__":
+    migrate_database()
@@ -0,0 +1,44 @@
+"""
+Migration script to convert templates.id from a textual UUID to a native
+UUID column
+"""
+
+import os
+import sys
+from sqlalchemy import create_engine, text
+
+# Add the app directory to Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+def migrate_database():
+    """Convert templates.id to UUID (PostgreSQL) or 32-char hex (SQLite)"""
+    
+    database_url = os.getenv("DATABASE_URL", "sqlite:///./capitol_takeoff.db")
+    engine = create_engine(database_url)
+    
+    print("Starting template UUID migration...")
+    
+    try:
+        with engine.begin() as conn:
+            if database_url.startswith("postgresql"):
+                print("Converting templates.id to UUID...")
+                conn.execute(text("ALTER TABLE templates ALTER COLUMN id TYPE UUID USING id::uuid"))
+                # gen_random_uuid() is built in from PostgreSQL 13; pgcrypto
+                # provides it on older servers
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pgcrypto"))
+                conn.execute(text("ALTER TABLE templates ALTER COLUMN id SET DEFAULT gen_random_uuid()"))
+            else:
+                # SQLAlchemy's Uuid type stores 32 hex chars without hyphens on SQLite
+                print("Rewriting templates.id as 32-character hex...")
+                conn.execute(text("UPDATE templates SET id = lower(replace(id, '-', ''))"))
+            
+            print("Migration completed successfully!")
+            
+    except Exception as e:
+        print(f"Migration failed: {e}")
+        return False
+        
+    return True
+
+if __name__ == "__main__":
+    migrate_database()
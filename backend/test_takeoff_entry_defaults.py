@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test script to verify omitted operation/coating selections come back as []
+"""
+import requests
+
+BASE_URL = "http://localhost:8000/api/v1"
+
+def test_omitted_selections_default_to_empty_lists():
+    """Create an entry without operations/coatings_selected and read it back"""
+
+    project = requests.post(f"{BASE_URL}/projects/", json={
+        "project_id": "TEST-SELDEF",
+        "name": "Selection Defaults Test",
+        "client": "Test Customer LLC",
+        "quote_number": "25-TEST02",
+        "estimator": "Blake Holmes"
+    })
+    print(f"Create project status: {project.status_code}")
+    if project.status_code != 200:
+        print(f"FAIL: Could not create project: {project.text}")
+        return False
+    project_id = project.json()["id"]
+
+    try:
+        entry = requests.post(f"{BASE_URL}/takeoff/projects/{project_id}/entries", json={
+            "qty": 2,
+            "shape_key": "W12X26",
+            "length_ft": 20.0
+        })
+        print(f"Create entry status: {entry.status_code}")
+        if entry.status_code != 200:
+            print(f"FAIL: Could not create entry: {entry.text}")
+            return False
+
+        # The create route returns the row as refreshed from the database
+        created = entry.json()
+        if created.get("operations") != [] or created.get("coatings_selected") != []:
+            print(f"FAIL: Create response returned {created.get('operations')!r} / {created.get('coatings_selected')!r}")
+            return False
+
+        entries = requests.get(f"{BASE_URL}/takeoff/projects/{project_id}/entries").json()
+        stored = next(e for e in entries if e["id"] == str(created["id"]))
+        if stored.get("operations") != [] or stored.get("coatings_selected") != []:
+            print(f"FAIL: Stored entry has {stored.get('operations')!r} / {stored.get('coatings_selected')!r}")
+            return False
+
+        print("SUCCESS: Omitted selections persist and return as []")
+        return True
+    finally:
+        requests.delete(f"{BASE_URL}/projects/{project_id}")
+
+if __name__ == "__main__":
+    print("Testing takeoff entry selection defaults...")
+    print("=" * 50)
+    test_omitted_selections_default_to_empty_lists()
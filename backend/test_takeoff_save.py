@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the takeoff save route validates entry rows
+"""
+import requests
+
+BASE_URL = "http://localhost:8000/api/v1"
+
+def test_save_validates_entries():
+    """Save valid grid rows, then check a malformed row is rejected"""
+
+    project = requests.post(f"{BASE_URL}/projects/", json={
+        "project_id": "TEST-SAVE",
+        "name": "Takeoff Save Test",
+        "client": "Test Customer LLC",
+        "quote_number": "25-TEST03",
+        "estimator": "Blake Holmes"
+    })
+    print(f"Create project status: {project.status_code}")
+    if project.status_code != 200:
+        print(f"FAIL: Could not create project: {project.text}")
+        return False
+    project_id = project.json()["id"]
+
+    try:
+        response = requests.post(f"{BASE_URL}/takeoff/projects/{project_id}/save", json={"entries": [
+            {"qty": 2, "shape_key": "W12X26", "length_ft": 20.0, "total_price": 540.0,
+             "operations": ["Saw Cutting"]},
+            {"qty": "3", "shape_key": "L3X3X1/4", "length_ft": 10}
+        ]})
+        print(f"Valid save status: {response.status_code}")
+        if response.status_code != 200 or response.json().get("entries_created") != 2:
+            print(f"FAIL: Valid save was not accepted: {response.text}")
+            return False
+
+        entries = requests.get(f"{BASE_URL}/takeoff/projects/{project_id}/entries").json()
+        saved = {e["shape_key"]: e for e in entries}
+        if saved["L3X3X1/4"]["qty"] != 3 or saved["W12X26"]["operations"] != ["Saw Cutting"]:
+            print(f"FAIL: Saved rows do not match the request: {entries}")
+            return False
+
+        response = requests.post(f"{BASE_URL}/takeoff/projects/{project_id}/save", json={"entries": [
+            {"qty": "two", "shape_key": "W12X26", "length_ft": 20.0}
+        ]})
+        print(f"Malformed save status: {response.status_code}")
+        if response.status_code != 422:
+            print(f"FAIL: Expected 422 for a malformed row, got: {response.text}")
+            return False
+
+        # The rejected save must leave the previous entries in place
+        entries = requests.get(f"{BASE_URL}/takeoff/projects/{project_id}/entries").json()
+        if len(entries) != 2:
+            print(f"FAIL: Rejected save changed the entries: {entries}")
+            return False
+
+        print("SUCCESS: Save route validates entry rows")
+        return True
+    finally:
+        requests.delete(f"{BASE_URL}/projects/{project_id}")
+
+if __name__ == "__main__":
+    print("Testing takeoff save validation...")
+    print("=" * 50)
+    test_save_validates_entries()
@@ -0,0 +1,27 @@
+// Writes .br and .gz sidecars next to text assets in dist/ so the backend can
+// serve precompressed files instead of compressing on every request.
+import { readdir, readFile, writeFile } from 'node:fs/promises'
+import { join } from 'node:path'
+import { brotliCompressSync, gzipSync, constants } from 'node:zlib'
+
+const DIST_DIR = new URL('../dist/', import.meta.url).pathname
+const COMPRESSIBLE = /\.(js|css|html|svg|json|txt|map)$/
+const MIN_SIZE = 1024
+
+async function* walk(dir) {
+  for (const entry of await readdir(dir, { withFileTypes: true })) {
+    const path = join(dir, entry.name)
+    if (entry.isDirectory()) yield* walk(path)
+    else yield path
+  }
+}
+
+for await (const file of walk(DIST_DIR)) {
+  if (!COMPRESSIBLE.test(file)) continue
+  const data = await readFile(file)
+  if (data.length < MIN_SIZE) continue
+  await writeFile(`${file}.br`, brotliCompressSync(data, {
+    params: { [constants.BROTLI_PARAM_QUALITY]: constants.BROTLI_MAX_QUALITY }
+  }))
+  await writeFile(`${file}.gz`, gzipSync(data, { level: 9 }))
+}